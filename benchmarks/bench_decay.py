@@ -0,0 +1,72 @@
+"""Compares the per-pet decay loop with the vectorized PetPopulation tick.
+
+Run from the project root:  python benchmarks/bench_decay.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pet.pet import VirtualPet  # noqa: E402
+from pet.population import PetPopulation  # noqa: E402
+
+
+def decay_loop(pets):
+    # Mirrors the original MainWindow.auto_decay_stats
+    for pet in pets:
+        pet.adjust_stat("hunger", +2)
+        pet.adjust_stat("happiness", -2)
+        pet.adjust_stat("energy", -1)
+        if pet.energy < 20:
+            pet.state = "sleeping"
+        elif pet.hunger > 80:
+            pet.state = "collapsed"
+        elif pet.happiness < 30 and pet.state not in ("sleeping", "collapsed"):
+            pet.state = "idle"
+
+
+def make_pets(n):
+    rng = random.Random(n)
+    return [
+        VirtualPet(
+            f"Cat{i}",
+            "cat",
+            "lazy",
+            "AllCats",
+            hunger=rng.randint(0, 100),
+            happiness=rng.randint(0, 100),
+            energy=rng.randint(0, 100),
+        )
+        for i in range(n)
+    ]
+
+
+def best_of(fn, repeat, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'pets':>8} {'loop ms':>10} {'vector ms':>10} {'speedup':>8}")
+    for n in (10_000, 100_000):
+        repeat = 5 if n <= 10_000 else 3
+        pets = make_pets(n)
+        loop = best_of(decay_loop, repeat, pets)
+
+        population = PetPopulation(make_pets(n))
+        vector = best_of(population.decay, repeat)
+
+        print(
+            f"{n:>8} {loop * 1000:>10.2f} {vector * 1000:>10.3f} {loop / vector:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Startup cost of a large pets.json: whole-file load versus streaming.
+
+Writes a household file of roughly --mb megabytes to a temp dir, then times
+json.load + building every pet (the old load_pets) against the streaming
+iter_pets: time until the first screenful of pets is ready, and in total.
+
+Run from the project root:  python benchmarks/bench_load.py [--mb 50]
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pet.persistence as persistence  # noqa: E402
+from pet.pet import PERSONALITIES, VirtualPet  # noqa: E402
+
+FIRST_SCREEN = 50
+
+
+def write_household(path, megabytes):
+    rng = random.Random(0)
+    pets = []
+    size = 0
+    while size < megabytes * 2**20:
+        pet = VirtualPet(
+            f"Cat{len(pets)}",
+            "cat",
+            rng.choice(PERSONALITIES),
+            "AllCats",
+            hunger=rng.randint(0, 100),
+            last_seen=time.time(),
+        )
+        pets.append(pet.to_dict())
+        size += 330  # about one indented record
+    path.write_text(json.dumps(pets, indent=4))
+    return len(pets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pets.json"
+        count = write_household(path, args.mb)
+        persistence.DATA_PATH = str(path)
+        print(f"{count} pets, {path.stat().st_size / 2**20:.1f} MiB")
+
+        start = time.perf_counter()
+        with open(path) as f:
+            pets = [persistence.pet_from_dict(pd) for pd in json.load(f)]
+        whole = time.perf_counter() - start
+        print(f"  json.load + build all:   {whole:6.2f} s before anything shows")
+        del pets
+
+        start = time.perf_counter()
+        stream = persistence.iter_pets()
+        first = list(itertools.islice(stream, FIRST_SCREEN))
+        first_screen = time.perf_counter() - start
+        rest = list(stream)
+        total = time.perf_counter() - start
+        print(f"  streaming, first {len(first)}:    {first_screen * 1000:6.1f} ms")
+        print(f"  streaming, all {len(first) + len(rest)}: {total:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
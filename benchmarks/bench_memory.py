@@ -0,0 +1,103 @@
+"""Measures the memory used by 100k pets loaded from JSON-style dicts.
+
+Compares a dict-backed pet (what VirtualPet was before __slots__) with the
+slotted VirtualPet, unbound and bound to a PetPopulation. Bound pets keep
+their population fields only in the arrays; every pet is still an object.
+
+Run from the project root:  python benchmarks/bench_memory.py [--pets N]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pet.persistence import pet_from_dict  # noqa: E402
+from pet.pet import PERSONALITIES, VirtualPet  # noqa: E402
+from pet.population import PetPopulation  # noqa: E402
+
+
+class DictPet:
+    """The old representation: a plain object with a per-instance __dict__."""
+
+    def __init__(self, pd):
+        self.id = pd["id"]
+        self.name = pd["name"]
+        self.species = pd["species"]
+        self.personality = pd["personality"]
+        self.sprite_name = pd["sprite_name"]
+        self.hunger = pd["hunger"]
+        self.happiness = pd["happiness"]
+        self.energy = pd["energy"]
+        self.relationships = pd["relationships"]
+        self.sleeping = pd["sleeping"]
+        self.state = pd["state"]
+        self.last_seen = pd["last_seen"]
+        self._current_animation_key = None
+        self._last_state = self.state
+        self.requested_attention = False
+
+
+def make_json(n):
+    rng = random.Random(n)
+    pets = [
+        VirtualPet(
+            f"Cat{i}",
+            "cat",
+            rng.choice(PERSONALITIES),
+            "AllCats" + rng.choice(["", "Black", "Grey", "Orange"]),
+            hunger=rng.randint(0, 100),
+            happiness=rng.randint(0, 100),
+            energy=rng.randint(0, 100),
+            state=rng.choice(["idle", "sleeping", "playing"]),
+            last_seen=1.7e9 + i,
+        )
+        for i in range(n)
+    ]
+    return json.dumps([pet.to_dict() for pet in pets])
+
+
+def measure(build, text):
+    # Parse inside the measurement so unshared strings from the JSON count
+    gc.collect()
+    tracemalloc.start()
+    result = build(json.loads(text))
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=100_000)
+    args = parser.parse_args()
+
+    text = make_json(args.pets)
+    builds = {
+        "dict-backed pets": lambda dicts: [DictPet(pd) for pd in dicts],
+        "VirtualPet (__slots__)": lambda dicts: [pet_from_dict(pd) for pd in dicts],
+        "VirtualPet + PetPopulation": lambda dicts: PetPopulation(
+            [pet_from_dict(pd) for pd in dicts]
+        ),
+    }
+
+    baseline = None
+    print(f"{args.pets} pets")
+    for label, build in builds.items():
+        used = measure(build, text)
+        baseline = baseline or used
+        print(
+            f"  {label:<28} {used / 2**20:7.1f} MiB"
+            f"  {used / args.pets:6.0f} B/pet  ({used / baseline:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
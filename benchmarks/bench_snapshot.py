@@ -0,0 +1,104 @@
+"""Save/load times and file sizes: pets.json versus the binary snapshot.
+
+Run from the project root:
+    python benchmarks/bench_snapshot.py [--sizes 1000,100000,1000000]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pet.pet import PERSONALITIES  # noqa: E402
+from pet.snapshot import PetSnapshot, write_snapshot  # noqa: E402
+
+
+def make_dicts(n):
+    rng = random.Random(n)
+    ids = [uuid.UUID(int=rng.getrandbits(128)).hex for _ in range(n)]
+    return [
+        {
+            "id": ids[i],
+            "name": f"Cat{i}",
+            "species": "cat",
+            "personality": rng.choice(PERSONALITIES),
+            "sprite_name": rng.choice(["AllCats", "AllCatsBlack", "AllCatsGrey"]),
+            "hunger": rng.randint(0, 100),
+            "happiness": rng.randint(0, 100),
+            "energy": rng.randint(0, 100),
+            "relationships": {ids[rng.randrange(n)]: rng.randint(0, 100)},
+            "sleeping": False,
+            "state": "idle",
+            "last_seen": 1.7e9 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def save_json(data, path):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def open_snapshot(path):
+    snapshot = PetSnapshot(path)
+    first = snapshot[0]
+    snapshot.close()
+    return first
+
+
+def load_snapshot(path):
+    with PetSnapshot(path) as snapshot:
+        return list(snapshot)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    args = parser.parse_args()
+
+    print(f"{'pets':>9} {'format':<9} {'size MiB':>9} {'save s':>8} {'load s':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "pets.json"
+        snap_path = Path(tmp) / "pets.snap"
+        for n in (int(size) for size in args.sizes.split(",")):
+            data = make_dicts(n)
+
+            save, _ = timed(save_json, data, json_path)
+            load, loaded = timed(load_json, json_path)
+            assert loaded == data
+            del loaded
+            size = json_path.stat().st_size / 2**20
+            print(f"{n:>9} {'json':<9} {size:>9.1f} {save:>8.3f} {load:>8.3f}")
+
+            save, _ = timed(write_snapshot, data, snap_path)
+            load, loaded = timed(load_snapshot, snap_path)
+            assert loaded == data
+            del loaded
+            first, _ = timed(open_snapshot, snap_path)
+            size = snap_path.stat().st_size / 2**20
+            print(
+                f"{n:>9} {'snapshot':<9} {size:>9.1f} {save:>8.3f} {load:>8.3f}"
+                f"  (open + first pet: {first * 1000:.2f} ms)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Runs the headless PetSimulation for a long stretch of simulated time.
+
+Run from the project root, e.g.:
+    python benchmarks/soak_simulation.py --pets 5000 --days 1 --seed 1
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pet.pet import VirtualPet  # noqa: E402
+from pet.simulation import PetSimulation  # noqa: E402
+
+PERSONALITIES = ["affectionate", "playful", "lazy", "curious", "shy"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pets", type=int, default=1000)
+    parser.add_argument("--days", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pets = [
+        VirtualPet(f"Cat{i}", "cat", rng.choice(PERSONALITIES), "AllCats")
+        for i in range(args.pets)
+    ]
+    sim = PetSimulation(pets, seed=args.seed)
+    events = Counter()
+    sim.subscribe(lambda event: events.update([event.kind]))
+
+    start = time.perf_counter()
+    sim.fast_forward(args.days * 24 * 60)
+    elapsed = time.perf_counter() - start
+
+    states = Counter(pet.state for pet in pets)
+    print(f"Simulated {args.days} day(s) for {args.pets} pets in {elapsed:.2f} s")
+    print(f"Events: {dict(events)}")
+    print(f"Final states: {dict(states)}")
+
+
+if __name__ == "__main__":
+    main()
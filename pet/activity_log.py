@@ -0,0 +1,67 @@
+import logging
+import logging.handlers
+import os
+from collections import deque
+
+LOG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "activity.log"
+)
+
+# Lines kept in memory (and shown in the log box)
+LOG_CAPACITY = 500
+# Size of each on-disk log file before it rotates, and how many old ones to keep
+LOG_FILE_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+
+class ActivityLog:
+    """The most recent activity messages, in a fixed-size ring buffer.
+
+    ``add`` only queues a message; ``flush`` moves everything queued into
+    the buffer at once and returns the new lines, so a view can append a
+    whole tick's worth in one go. With a ``path``, flushed lines are also
+    written to a log file that rotates at ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        capacity=LOG_CAPACITY,
+        path=None,
+        max_bytes=LOG_FILE_BYTES,
+        backups=LOG_FILE_BACKUPS,
+    ):
+        self.lines = deque(maxlen=capacity)
+        self.pending = []
+        self._file = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._file = logging.handlers.RotatingFileHandler(
+                path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+            )
+            self._file.setFormatter(
+                logging.Formatter("%(asctime)s %(message)s", "%Y-%m-%d %H:%M:%S")
+            )
+
+    @property
+    def capacity(self):
+        return self.lines.maxlen
+
+    def add(self, message):
+        if message:
+            self.pending.extend(message.splitlines())
+
+    def flush(self):
+        """Moves queued lines into the buffer (and the file); returns them."""
+        batch = self.pending[-self.capacity :]
+        self.pending = []
+        self.lines.extend(batch)
+        if self._file is not None:
+            for line in batch:
+                self._file.emit(logging.makeLogRecord({"msg": line}))
+        return batch
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,5 +1,8 @@
+from collections import namedtuple
+
 # Global animation config for each species
 # Format: species -> state -> (row, start_col, end_col, loop, frame_interval)
+# Multi-row animations list several (row, start_col, end_col) ranges instead.
 
 ANIMATION_CONFIGS = {
     "cat": {
@@ -28,3 +31,81 @@ ANIMATION_CONFIGS = {
         # "idle": (row, start, end, loop, interval)
     },
 }
+
+
+# === Compiled frame tables ===
+# Layout of every species' sprite sheet: 64px frames on a 16 x 19 grid
+FRAME_WIDTH = 64
+FRAME_HEIGHT = 64
+SHEET_COLUMNS = 16
+SHEET_ROWS = 19
+
+FrameTable = namedtuple("FrameTable", "key frames rects loop interval")
+FrameTable.__doc__ = """One animation, ready to play: its (row, col) frames,
+the matching (x, y, w, h) source rects on the sheet, the loop flag and the
+frame interval in ms."""
+
+
+def _is_range(value):
+    return (
+        isinstance(value, tuple)
+        and len(value) == 3
+        and all(isinstance(v, int) and not isinstance(v, bool) for v in value)
+    )
+
+
+def compile_animation(
+    key,
+    config,
+    columns=SHEET_COLUMNS,
+    rows=SHEET_ROWS,
+    frame_width=FRAME_WIDTH,
+    frame_height=FRAME_HEIGHT,
+):
+    """Turns one ANIMATION_CONFIGS entry into a FrameTable.
+
+    Raises ValueError if the entry is malformed or reaches off the sheet.
+    """
+    if not isinstance(config, tuple) or len(config) < 3:
+        raise ValueError(f"Animation {key!r}: expected a tuple, got {config!r}")
+    *ranges, loop, interval = config
+    if _is_range(tuple(ranges)):
+        ranges = [tuple(ranges)]
+    if not ranges or not all(_is_range(r) for r in ranges):
+        raise ValueError(
+            f"Animation {key!r}: frames must be (row, start_col, end_col) ranges"
+        )
+    if not isinstance(loop, bool):
+        raise ValueError(f"Animation {key!r}: loop must be True or False")
+    if not isinstance(interval, int) or isinstance(interval, bool) or interval <= 0:
+        raise ValueError(f"Animation {key!r}: interval must be a positive int (ms)")
+
+    frames = []
+    for row, start, end in ranges:
+        if not 0 <= row < rows or not 0 <= start < end <= columns:
+            raise ValueError(
+                f"Animation {key!r}: frames ({row}, {start}, {end}) are outside "
+                f"the {columns} x {rows} sheet"
+            )
+        frames.extend((row, col) for col in range(start, end))
+
+    rects = tuple(
+        (col * frame_width, row * frame_height, frame_width, frame_height)
+        for row, col in frames
+    )
+    return FrameTable(key, tuple(frames), rects, loop, interval)
+
+
+def compile_animations(configs, **sheet):
+    """species -> animation key -> FrameTable, for every entry in ``configs``."""
+    return {
+        species: {
+            key: compile_animation(key, config, **sheet)
+            for key, config in animations.items()
+        }
+        for species, animations in configs.items()
+    }
+
+
+# Compiled once at import, so a broken entry stops the app at startup
+ANIMATIONS = compile_animations(ANIMATION_CONFIGS)
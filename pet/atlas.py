@@ -0,0 +1,146 @@
+"""Layout and index of packed sprite atlases.
+
+An atlas packs the animation frames of several sprite sheets (one per cat
+color) into a few large pages, so every color is decoded from one image
+instead of one full sheet each. Pixel-identical frames are stored once.
+The index says where each sheet's frames ended up:
+
+    frames   [page, x, y] per stored frame
+    sheets   name -> source mtime and animation key -> frame numbers
+    failed   name -> mtime of sheets that couldn't be read when it was built
+
+Building the pages needs Qt and lives in ui/sprite_atlas.py; this module
+only does the bookkeeping.
+"""
+
+import hashlib
+import json
+import os
+
+from pet.animation_config import FRAME_HEIGHT, FRAME_WIDTH
+from pet.atomic import atomic_write
+
+ATLAS_VERSION = 1
+# Largest page edge; 2048 is a safe texture size everywhere
+ATLAS_MAX_SIZE = 2048
+
+
+def animation_signature(tables):
+    """Hash of a species' frame tables; a config change makes old atlases stale."""
+    rects = {key: table.rects for key, table in sorted(tables.items())}
+    return hashlib.sha1(json.dumps(rects).encode("utf-8")).hexdigest()
+
+
+def grid_layout(
+    count, frame_width=FRAME_WIDTH, frame_height=FRAME_HEIGHT, max_size=ATLAS_MAX_SIZE
+):
+    """Places ``count`` equal-size frames on as few pages as possible.
+
+    Returns ``(positions, page_sizes)``: a (page, x, y) per frame, and each
+    page's (width, height), trimmed to the rows actually used.
+    """
+    columns = max(1, max_size // frame_width)
+    rows = max(1, max_size // frame_height)
+    per_page = columns * rows
+
+    positions = []
+    for i in range(count):
+        page, slot = divmod(i, per_page)
+        row, col = divmod(slot, columns)
+        positions.append((page, col * frame_width, row * frame_height))
+
+    page_sizes = []
+    for page in range((count + per_page - 1) // per_page):
+        used = min(per_page, count - page * per_page)
+        width = min(used, columns) * frame_width
+        height = ((used + columns - 1) // columns) * frame_height
+        page_sizes.append((width, height))
+    return positions, page_sizes
+
+
+class AtlasIndex:
+    """Where each sheet's animation frames live in the atlas pages."""
+
+    def __init__(
+        self,
+        species,
+        signature,
+        pages,
+        frames,
+        sheets,
+        frame_size=(FRAME_WIDTH, FRAME_HEIGHT),
+        version=ATLAS_VERSION,
+        failed=None,
+    ):
+        self.species = species
+        self.signature = signature
+        self.pages = list(pages)
+        self.frames = [tuple(f) for f in frames]
+        self.sheets = sheets
+        self.frame_size = tuple(frame_size)
+        self.version = version
+        self.failed = dict(failed or {})
+
+    def __contains__(self, sheet):
+        return sheet in self.sheets
+
+    def frames_for(self, sheet, animation_key):
+        """(page, x, y) of every frame of one animation, in play order."""
+        numbers = self.sheets[sheet]["animations"].get(animation_key, ())
+        return [self.frames[n] for n in numbers]
+
+    def is_fresh(self, sources, signature):
+        """True if built from exactly these sheets ({name: mtime_ns}) and tables.
+
+        Sheets that failed to load count too: until one changes, rebuilding
+        would fail the same way.
+        """
+        built = {name: s["mtime_ns"] for name, s in self.sheets.items()}
+        built.update(self.failed)
+        return (
+            self.version == ATLAS_VERSION
+            and self.signature == signature
+            and built == sources
+        )
+
+    def to_dict(self):
+        return {
+            "version": self.version,
+            "species": self.species,
+            "signature": self.signature,
+            "frame_size": list(self.frame_size),
+            "pages": self.pages,
+            "frames": [list(f) for f in self.frames],
+            "sheets": self.sheets,
+            "failed": self.failed,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["species"],
+            data["signature"],
+            data["pages"],
+            data["frames"],
+            data["sheets"],
+            frame_size=data["frame_size"],
+            version=data["version"],
+            failed=data.get("failed"),
+        )
+
+    def save(self, path):
+        """Writes the index via a temp file, so readers never see half of it."""
+        with atomic_write(path, prefix=".atlas-") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """The saved index, or None if there is none (or it can't be read)."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[WARN] Ignoring unreadable sprite atlas index {path}: {e}")
+            return None
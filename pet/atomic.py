@@ -0,0 +1,29 @@
+"""Crash-safe file replacement shared by every writer of data/ files."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path, mode="w", prefix=".tmp-"):
+    """Opens a temp file next to ``path`` that replaces it on success.
+
+    The data is fsynced before the atomic rename, so a crash leaves either
+    the old file or the complete new one, never a truncated mix. If the
+    block raises, the temp file is removed and ``path`` is untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    try:
+        encoding = None if "b" in mode else "utf-8"
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
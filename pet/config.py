@@ -3,7 +3,19 @@ import os
 
 CONFIG_DIR = "data"
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
-DEFAULT_CONFIG = {"background": "1.png"}
+# scene_backend: "widgets" (one widget per pet) or "canvas" (single painted canvas)
+# storage: "json" (data/pets.json), "sqlite" (data/pets.db) or
+#          "snapshot" (data/pets.snap)
+# journal: log each change to data/pets.journal and only rewrite the whole
+#          household every few minutes
+# activity_log_file: also write the activity log to data/activity.log (rotated at 1 MB)
+DEFAULT_CONFIG = {
+    "background": "1.png",
+    "scene_backend": "widgets",
+    "storage": "json",
+    "journal": False,
+    "activity_log_file": False,
+}
 
 
 def load_config():
@@ -1,67 +1,165 @@
 import random
+from collections import namedtuple
 
+from pet.pet import PERSONALITIES
 
-def process_interaction(pet1, pet2):
-    """Handles cat-cat interactions based on personality and relationship."""
-    if pet1.species != "cat" or pet2.species != "cat":
-        return ""
-
-    personalities = {pet1.personality, pet2.personality}
-    message = ""
-
-    # Affectionate behavior
-    if "affectionate" in personalities:
-        pet1.adjust_stat("happiness", +5)
-        pet2.adjust_stat("happiness", +5)
-        message = (
-            f"{pet1.name} cuddled up next to {pet2.name}. So warm and fuzzy. 🐱💞🐱"
-        )
-
-    # Playful + Playful
-    elif pet1.personality == "playful" and pet2.personality == "playful":
-        pet1.adjust_stat("energy", -5)
-        pet2.adjust_stat("energy", -5)
-        pet1.adjust_stat("happiness", +8)
-        pet2.adjust_stat("happiness", +8)
-        message = (
-            f"{pet1.name} and {pet2.name} pounced and tumbled around playfully! 🐱🎾🐱"
-        )
-
-    # Playful + Shy
-    elif "playful" in personalities and "shy" in personalities:
-        playful = pet1 if pet1.personality == "playful" else pet2
-        shy = pet2 if pet1 == playful else pet1
-        playful.adjust_stat("happiness", -2)
-        shy.adjust_stat("happiness", -2)
-        message = f"{playful.name} tried to play, but {shy.name} shied away... 😿"
-
-    # Lazy + Lazy or Shy + Shy or Lazy + Shy
-    elif {"lazy", "shy"}.intersection(personalities) and random.random() < 0.8:
-        pet1.adjust_stat("energy", +5)
-        pet2.adjust_stat("energy", +5)
-        message = f"{pet1.name} and {pet2.name} quietly enjoyed a lazy nap together. 💤"
-
-    # Curious + Any
-    elif "curious" in personalities:
-        pet1.adjust_stat("happiness", +3)
-        pet2.adjust_stat("happiness", +3)
-        message = f"{pet1.name} and {pet2.name} observed each other curiously, tails twitching. 🐾👀"
-
-    else:
-        pet1.adjust_stat("hunger", +3)
-        pet2.adjust_stat("hunger", +3)
-        message = (
-            f"{pet1.name} looked at {pet2.name}... then started licking their paw. 🐱✨"
-        )
-
-    # Relationship impact
-    for a, b in [(pet1, pet2), (pet2, pet1)]:
-        prev = a.relationships.get(b.name, 0)
-        if "pounced" in message or "cuddled" in message:
-            a.relationships[b.name] = min(100, prev + 10)
-        elif "shied away" in message:
-            a.relationships[b.name] = max(0, prev - 5)
+ANY = "*"
+
+
+class InteractionRule(
+    namedtuple(
+        "InteractionRule",
+        ["name", "match", "deltas", "relationship", "states", "template", "chance"],
+        defaults=({}, 0, None, "", 1.0),
+    )
+):
+    """One kind of cat-cat interaction, declared as data.
+
+    ``match`` is a pair of roles, each a personality, a tuple of them, or
+    ``ANY``; the first pet of the outcome plays the first role. ``deltas``
+    are applied to both pets, ``relationship`` to both directions of the
+    friendship, and ``states`` (if given) sets the (first, second) states.
+    A rule with a ``chance`` below 1 only fires that often, otherwise later
+    rules apply.
+    """
+
+    __slots__ = ()
+
+
+class InteractionOutcome(namedtuple("InteractionOutcome", ["rule", "first", "second"])):
+    """What happened between two pets; the message is only formatted on demand."""
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return self.rule.template.format(a=self.first.name, b=self.second.name)
+
+
+# === Rules (first match wins) ===
+RULES = (
+    InteractionRule(
+        "cuddle",
+        match=("affectionate", ANY),
+        deltas={"happiness": +5},
+        relationship=+10,
+        states=("idle", "idle"),
+        template="{a} cuddled up next to {b}. So warm and fuzzy. 🐱💞🐱",
+    ),
+    InteractionRule(
+        "pounce",
+        match=("playful", "playful"),
+        deltas={"energy": -5, "happiness": +8},
+        relationship=+10,
+        template="{a} and {b} pounced and tumbled around playfully! 🐱🎾🐱",
+    ),
+    InteractionRule(
+        "shy_away",
+        match=("playful", "shy"),
+        deltas={"happiness": -2},
+        relationship=-5,
+        states=("playing", "idle"),
+        template="{a} tried to play, but {b} shied away... 😿",
+    ),
+    InteractionRule(
+        "nap",
+        match=(("lazy", "shy"), ANY),
+        deltas={"energy": +5},
+        relationship=+2,
+        template="{a} and {b} quietly enjoyed a lazy nap together. 💤",
+        chance=0.8,
+    ),
+    InteractionRule(
+        "observe",
+        match=("curious", ANY),
+        deltas={"happiness": +3},
+        relationship=+2,
+        template="{a} and {b} observed each other curiously, tails twitching. 🐾👀",
+    ),
+    InteractionRule(
+        "ignore",
+        match=(ANY, ANY),
+        deltas={"hunger": +3},
+        relationship=+2,
+        template="{a} looked at {b}... then started licking their paw. 🐱✨",
+    ),
+)
+
+
+def _matches(role, personality):
+    if isinstance(role, tuple):
+        return personality in role
+    return role == ANY or role == personality
+
+
+def compile_rules(p1, p2, rules=RULES):
+    """The candidate rules for an ordered personality pair, in priority order.
+
+    Each entry is (rule, swap), where ``swap`` says the second pet plays the
+    rule's first role. The list stops at the first rule that always fires.
+    """
+    candidates = []
+    for rule in rules:
+        first, second = rule.match
+        if _matches(first, p1) and _matches(second, p2):
+            swap = False
+        elif _matches(first, p2) and _matches(second, p1):
+            swap = True
         else:
-            a.relationships[b.name] = min(100, prev + 2)
+            continue
+        candidates.append((rule, swap))
+        if rule.chance >= 1.0:
+            break
+    return tuple(candidates)
+
+
+RULE_TABLE = {
+    (p1, p2): compile_rules(p1, p2) for p1 in PERSONALITIES for p2 in PERSONALITIES
+}
+
+
+def rules_for(p1, p2):
+    candidates = RULE_TABLE.get((p1, p2))
+    if candidates is None:
+        candidates = RULE_TABLE[(p1, p2)] = compile_rules(p1, p2)
+    return candidates
+
+
+def match_interaction(pet1, pet2, rng=random):
+    """Picks the rule for a pair without changing anything. None for non-cats."""
+    if pet1.species != "cat" or pet2.species != "cat":
+        return None
+    for rule, swap in rules_for(pet1.personality, pet2.personality):
+        if rule.chance >= 1.0 or rng.random() < rule.chance:
+            if swap:
+                return InteractionOutcome(rule, pet2, pet1)
+            return InteractionOutcome(rule, pet1, pet2)
+    return None
 
-    return message
+
+def apply_outcome(outcome):
+    rule = outcome.rule
+    for pet in (outcome.first, outcome.second):
+        for stat, delta in rule.deltas.items():
+            pet.adjust_stat(stat, delta)
+
+    for a, b in ((outcome.first, outcome.second), (outcome.second, outcome.first)):
+        score = a.relationships.get(b.id, 0) + rule.relationship
+        a.relationships[b.id] = max(0, min(100, score))
+
+    if rule.states is not None:
+        outcome.first.state, outcome.second.state = rule.states
+
+
+def resolve_interaction(pet1, pet2, rng=random):
+    """Matches and applies an interaction, returning its outcome (or None)."""
+    outcome = match_interaction(pet1, pet2, rng)
+    if outcome is not None:
+        apply_outcome(outcome)
+    return outcome
+
+
+def process_interaction(pet1, pet2, rng=random):
+    """Handles cat-cat interactions based on personality and relationship."""
+    outcome = resolve_interaction(pet1, pet2, rng)
+    return outcome.message if outcome is not None else ""
@@ -0,0 +1,220 @@
+import json
+import os
+import threading
+import time
+
+from pet import persistence
+
+# Fields that stat changes (care actions, interactions, decay) can touch
+STAT_FIELDS = ("hunger", "happiness", "energy", "state", "sleeping")
+
+# Fold the journal into a snapshot once it gets this big or this old
+COMPACT_BYTES = 256 * 1024
+COMPACT_INTERVAL = 600
+
+
+class PetJournal:
+    """Append-only log of pet changes, one JSON object per line.
+
+    Events carry absolute values (not deltas) and a wall-clock time ``t``.
+    On startup they are replayed on top of the last snapshot, skipping any
+    event older than the pet's snapshot stamp, so replaying a journal that
+    was already folded into a snapshot changes nothing. Appends only queue
+    the line; a background thread writes and fsyncs the queue in batches
+    every ``sync_interval`` seconds, so appending never waits on the disk.
+
+    Compaction: ``rotate`` moves the journal aside (to ``.old``) right
+    before a full snapshot is taken; once that snapshot is on disk,
+    ``discard_rotated`` deletes it.
+    """
+
+    def __init__(self, path=None, sync_interval=1.0):
+        self.path = path or persistence.JOURNAL_PATH
+        self.rotated_path = self.path + ".old"
+        self.sync_interval = sync_interval
+        self._file = None
+        self._cond = threading.Condition()
+        # Held while writing the file; append() only needs _cond
+        self._io = threading.Lock()
+        self._lines = []
+        self._closed = False
+        self._thread = None
+        self.bytes_written = 0
+        self.compacted_at = time.monotonic()
+
+    # === Writing ===
+    def start(self):
+        """Opens the journal for appending; earlier records are ignored."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._run, name="pet-journal", daemon=True
+        )
+        self._thread.start()
+
+    def append(self, kind, **fields):
+        if self._file is None:
+            return
+        line = json.dumps({"t": time.time(), "kind": kind, **fields}) + "\n"
+        with self._cond:
+            self._lines.append(line)
+            self.bytes_written += len(line)
+
+    def pets_changed(self, pets, cause, fields=STAT_FIELDS):
+        for pet in pets:
+            values = {field: getattr(pet, field) for field in fields}
+            self.append("update", id=pet.id, cause=cause, values=values)
+
+    def interacted(self, outcomes):
+        """Logs both pets' stats and their friendship after each interaction."""
+        for outcome in outcomes:
+            pair = (outcome.first, outcome.second)
+            cause = outcome.rule.name
+            self.pets_changed(pair, cause)
+            for pet, other in (pair, pair[::-1]):
+                score = pet.relationships.get(other.id)
+                self.append(
+                    "relationship", id=pet.id, other=other.id, score=score, cause=cause
+                )
+
+    def pet_added(self, pet):
+        self.append("add", id=pet.id, pet=pet.to_dict())
+
+    def pet_removed(self, pet):
+        self.append("remove", id=pet.id)
+
+    def decayed(self, changed):
+        # Audit only: replay rebuilds decay from last_seen (see replay)
+        self.append("decay", changed=[pet.id for pet in changed])
+
+    def should_compact(self):
+        return (
+            self.bytes_written >= COMPACT_BYTES
+            or time.monotonic() - self.compacted_at >= COMPACT_INTERVAL
+        )
+
+    def sync(self):
+        with self._io:
+            self._sync_locked()
+
+    def _sync_locked(self):
+        # Caller holds _io; the queue is swapped out so appends carry on
+        # while this writes
+        with self._cond:
+            lines, self._lines = self._lines, []
+        if self._file is not None and lines:
+            self._file.writelines(lines)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                self._cond.wait(self.sync_interval)
+            try:
+                self.sync()
+            except OSError as e:
+                print(f"[ERROR] Failed to sync pet journal: {e}")
+
+    def rotate(self):
+        """Moves the journal aside for compaction.
+
+        Returns False while an earlier rotation is still waiting for its
+        snapshot, in which case the journal keeps growing until next time.
+        """
+        with self._io:
+            if self._file is None or os.path.exists(self.rotated_path):
+                return False
+            self._sync_locked()
+            self._file.close()
+            os.replace(self.path, self.rotated_path)
+            self._file = open(self.path, "a", encoding="utf-8")
+            with self._cond:
+                self.bytes_written = 0
+            self.compacted_at = time.monotonic()
+            return True
+
+    def discard_rotated(self):
+        with self._io:
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        with self._io:
+            if self._file is None:
+                return
+            self._sync_locked()
+            self._file.close()
+            self._file = None
+            # Nothing happened since the last compaction
+            if self.bytes_written == 0 and os.path.getsize(self.path) == 0:
+                os.remove(self.path)
+
+    # === Reading ===
+    def has_events(self):
+        return any(
+            os.path.exists(path) and os.path.getsize(path) > 0
+            for path in (self.rotated_path, self.path)
+        )
+
+    def events(self):
+        """Yields logged events, oldest first; a torn last line is skipped."""
+        for path in (self.rotated_path, self.path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for number, line in enumerate(f, 1):
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        print(
+                            f"[WARN] Skipping unreadable journal line {path}:{number}"
+                        )
+
+    def replay(self, simulation):
+        """Applies logged events newer than each pet's snapshot to a simulation.
+
+        Decay isn't replayed tick by tick: replayed pets get ``last_seen`` set
+        to their last event, and catch-up decay covers the time after that.
+        Returns the pets that changed.
+        """
+        pets = simulation.by_id
+        saved_at = {pet.id: pet.last_seen or 0.0 for pet in simulation.pets}
+        snapshot_time = max(saved_at.values(), default=0.0)
+        touched = {}
+        for event in self.events():
+            kind = event.get("kind")
+            t = event["t"]
+            pet = pets.get(event.get("id"))
+            is_newer = pet is not None and t > saved_at.get(pet.id, 0.0)
+
+            if kind == "update" and is_newer:
+                for field, value in event["values"].items():
+                    setattr(pet, field, value)
+                if "hunger" in event["values"]:
+                    pet.last_seen = t
+                if "personality" in event["values"]:
+                    simulation.mark_changed()
+                touched[pet.id] = pet
+            elif kind == "relationship" and is_newer:
+                if event["score"] is None:
+                    pet.relationships.pop(event["other"], None)
+                else:
+                    pet.relationships[event["other"]] = event["score"]
+                touched[pet.id] = pet
+            elif kind == "add" and pet is None and t > snapshot_time:
+                pet = persistence.pet_from_dict(event["pet"])
+                pet.last_seen = t
+                simulation.add_pet(pet)
+                touched[pet.id] = pet
+            elif kind == "remove" and is_newer:
+                simulation.remove_pet(pet)
+                touched.pop(pet.id, None)
+        return list(touched.values())
@@ -1,44 +1,393 @@
 import json
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from pet.atomic import atomic_write
 from pet.pet import VirtualPet
+from pet.snapshot import PetSnapshot, SnapshotError, write_snapshot
+from pet.sqlite_store import SQLitePetStore
 import os
 
 # Automatically resolve the data path
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_PATH = os.path.join(BASE_DIR, "..", "data", "pets.json")
+SQLITE_PATH = os.path.join(BASE_DIR, "..", "data", "pets.db")
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "..", "data", "pets.snap")
+JOURNAL_PATH = os.path.join(BASE_DIR, "..", "data", "pets.journal")
 
+STORAGE_BACKENDS = ("json", "sqlite", "snapshot")
+STORAGE_BACKEND = "json"
+_sqlite_store = None
 
-def save_pets(pets):
-    data = [pet.to_dict() for pet in pets]
 
-    with open(DATA_PATH, "w") as f:
+def use_storage(backend):
+    """Selects where load_pets/save_pets read and write (see STORAGE_BACKENDS)."""
+    global STORAGE_BACKEND, _sqlite_store
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend!r}")
+    if _sqlite_store is not None:
+        _sqlite_store.close()
+        _sqlite_store = None
+    STORAGE_BACKEND = backend
+
+
+def _get_sqlite_store():
+    # Existing pets.json data is imported the first time the database is created
+    global _sqlite_store
+    if _sqlite_store is None:
+        _sqlite_store = SQLitePetStore(SQLITE_PATH, import_json_path=DATA_PATH)
+    return _sqlite_store
+
+
+def write_pet_dicts(data, path=None):
+    """Writes already-serialized pets to disk via a temp file and atomic rename.
+
+    A crash mid-write leaves the previous pets.json intact instead of a
+    truncated file. With the SQLite backend only the changed rows are written;
+    the snapshot backend writes the binary format from pet/snapshot.py.
+    """
+    if STORAGE_BACKEND == "sqlite" and path is None:
+        _get_sqlite_store().save_dicts(data)
+        return
+    if STORAGE_BACKEND == "snapshot" and path is None:
+        write_snapshot(data, SNAPSHOT_PATH)
+        return
+
+    with atomic_write(path or DATA_PATH, prefix=".pets-") as f:
         json.dump(data, f, indent=4)
 
 
-def load_pets():
+def snapshot_pets(pets, now=None):
+    """Serializes pets, stamping them as current as of ``now``."""
+    now = time.time() if now is None else now
+    snapshot = []
+    for pet in pets:
+        pet.last_seen = now
+        snapshot.append(pet.to_dict())
+    return snapshot
+
+
+def save_pets(pets):
+    write_pet_dicts(snapshot_pets(pets))
+
+
+class PetSaver:
+    """Write-behind persistence for the pet list.
+
+    ``mark_dirty`` only notes that the pets changed. The first change opens a
+    window of ``delay`` seconds; when it ends, ``commit`` serializes the pets
+    once and hands that snapshot to a worker thread to write. So a burst of
+    changes costs one snapshot, not one per change.
+
+    Snapshots must be taken on the thread that changes the pets, so the
+    saver never commits from its own thread: ``schedule(delay)`` is called
+    when a window opens and should arrange for ``commit`` to run on that
+    thread (MainWindow uses a QTimer). Without it, the first ``mark_dirty``
+    after the window has ended commits instead. ``flush`` and ``close``
+    always commit.
+
+    A paused saver (e.g. while the household is still loading) keeps the
+    changes without writing them, so a partial list never replaces the
+    file; closing it while paused drops them.
+    """
+
+    def __init__(self, delay=2.0, write=write_pet_dicts, paused=False, schedule=None):
+        self.delay = delay
+        self._write = write
+        self._schedule = schedule
+        self._cond = threading.Condition()
+        self._dirty = None  # the pets marked dirty, until they are committed
+        self._due = None
+        self._pending = None
+        self._writing = False
+        self._closed = False
+        self._paused = paused
+        self._thread = threading.Thread(target=self._run, name="pet-saver", daemon=True)
+        self._thread.start()
+
+    def mark_dirty(self, pets):
+        if self._closed:
+            return  # late notifications during shutdown have nowhere to go
+        self._dirty = pets
+        if self._due is None:
+            self._due = time.monotonic() + self.delay
+            if self._schedule is not None:
+                self._schedule(self.delay)
+                return
+        if self._schedule is None and time.monotonic() >= self._due:
+            self.commit()
+
+    def commit(self):
+        """Snapshots the pets marked dirty and queues them for writing.
+
+        Call it on the thread that changes the pets. Does nothing while
+        paused; the changes wait for ``resume``.
+        """
+        if self._dirty is None or self._paused:
+            return
+        snapshot = snapshot_pets(self._dirty)
+        self._dirty = None
+        self._due = None
+        with self._cond:
+            self._pending = snapshot
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+        if self._dirty is not None:
+            # Changes held while paused get a fresh window
+            self._due = None
+            self.mark_dirty(self._dirty)
+
+    def flush(self):
+        """Blocks until everything marked dirty so far is on disk.
+
+        Returns straight away while paused.
+        """
+        if self._paused:
+            return
+        self.commit()
+        with self._cond:
+            while self._pending is not None or self._writing:
+                self._cond.wait()
+
+    def close(self):
+        if self._paused and self._dirty is not None:
+            print("[WARN] Pet saving was paused; discarding unsaved changes.")
+            self._dirty = None
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._pending is None:
+                    self._cond.wait()
+                if self._pending is None:
+                    return  # closed and nothing left to write
+                data = self._pending
+                self._pending = None
+                self._writing = True
+
+            try:
+                self._write(data)
+            except (OSError, sqlite3.Error) as e:
+                print(f"[ERROR] Failed to save pets: {e}")
+            except Exception as e:
+                # Anything else too: a dead worker would leave flush() waiting
+                print(f"[ERROR] Unexpected error while saving pets: {e!r}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+
+def pet_from_dict(pd):
+    return VirtualPet(
+        pd["name"],
+        pd["species"],
+        pd["personality"],
+        pd["sprite_name"],
+        pd.get("hunger", 50),
+        pd.get("happiness", 50),
+        pd.get("energy", 50),
+        pd.get("relationships", {}),
+        pd.get("sleeping", False),
+        pd.get("state", "idle"),
+        pd.get("last_seen"),
+        pd.get("id"),
+    )
+
+
+def migrate_relationship_keys(pets):
+    """Re-keys relationships saved by name (older files) to the other pet's id."""
+    ids = {pet.id for pet in pets}
+    ids_by_name = {}
+    for pet in pets:
+        ids_by_name.setdefault(pet.name, pet.id)
+
+    for pet in pets:
+        if all(key in ids for key in pet.relationships):
+            continue
+        migrated = {}
+        for key, score in pet.relationships.items():
+            if key in ids:
+                migrated[key] = score
+            elif key in ids_by_name:
+                migrated[ids_by_name[key]] = score
+        pet.relationships = migrated
+    return pets
+
+
+# === Loading ===
+# ``index`` is None for a problem with the whole file. ``fatal`` means the
+# saved household couldn't be read at all and nothing stood in for it, so
+# saving the (empty) household would overwrite it.
+LoadError = namedtuple(
+    "LoadError", ["index", "offset", "reason", "fatal"], defaults=(False,)
+)
+
+READ_CHUNK = 1 << 16
+# A record that still doesn't parse with this much text after it is corrupt
+MAX_RECORD_BYTES = 1 << 20
+
+# Between records: whitespace, commas and the brackets of the outer array
+_SEPARATORS = re.compile(r"[\s,\[\]]*")
+# Where the next top-level record starts. A pet's only nested object is its
+# relationships, which is never followed by another object, so "}, {" only
+# appears between pets; a "{" that starts a line is a record in either
+# layout (JSON strings can't hold a raw newline).
+_NEXT_RECORD = re.compile(r"\}\s*,\s*(?=\{)|\n\s*(?=\{)")
+
+
+def iter_pet_dicts(f, errors=None):
+    """Parses pet records one at a time from a pets.json file object.
+
+    Reads the usual JSON array (or one object per line) in chunks, so memory
+    stays flat and the first pets are available immediately. Yields
+    (index, offset, record) tuples. A record that doesn't parse is skipped,
+    reported to ``errors`` as a LoadError, and parsing resumes at the next
+    record.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    start = 0  # file offset of buf[0]
+    pos = 0
+    eof = False
+    index = 0
+
+    def read_more():
+        nonlocal buf, start, pos, eof
+        if pos > READ_CHUNK:
+            buf = buf[pos:]
+            start += pos
+            pos = 0
+        chunk = f.read(READ_CHUNK)
+        if chunk:
+            buf += chunk
+        else:
+            eof = True
+
+    while True:
+        pos = _SEPARATORS.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                return
+            read_more()
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            if not eof and len(buf) - pos < MAX_RECORD_BYTES:
+                read_more()  # most likely cut off at the end of the chunk
+                continue
+            _report(errors, LoadError(index, start + pos, e.msg))
+            index += 1
+            # Skip to the next record, reading ahead if needed
+            while True:
+                match = _NEXT_RECORD.search(buf, pos + 1)
+                if match or eof:
+                    break
+                read_more()
+            pos = match.end() if match else len(buf)
+            continue
+
+        if isinstance(record, dict):
+            yield index, start + pos, record
+        else:
+            _report(errors, LoadError(index, start + pos, "not a JSON object"))
+        index += 1
+        pos = end
+
+
+def _report(errors, error):
+    print(
+        f"[WARN] Skipping pet record {error.index} (offset {error.offset}): {error.reason}"
+    )
+    if errors is not None:
+        errors.append(error)
+
+
+def iter_pets(errors=None):
+    """Yields pets from the active storage backend as they are read.
+
+    Records that are unreadable, or that lack the fields a pet needs, are
+    skipped and reported to ``errors``. When pets.json had bad records, the
+    original file is copied to pets.json.corrupt before anything overwrites it.
+    An unreadable snapshot is kept as pets.snap.corrupt; pets.json is loaded
+    in its place if there is one, otherwise the error is ``fatal``.
+    """
+    if STORAGE_BACKEND == "sqlite":
+        for pd in _get_sqlite_store().load_dicts():
+            yield pet_from_dict(pd)
+        return
+    # Until the first save, the snapshot backend starts from pets.json
+    if STORAGE_BACKEND == "snapshot" and os.path.exists(SNAPSHOT_PATH):
+        yield from _iter_snapshot_pets(errors)
+        return
+    yield from _iter_json_pets(errors)
+
+
+def _iter_json_pets(errors=None):
     if not os.path.exists(DATA_PATH) or os.path.getsize(DATA_PATH) == 0:
         print("[WARN] pets.json missing or empty. Returning empty list.")
-        return []
+        return
 
-    try:
-        with open(DATA_PATH, "r") as f:
-            pet_dicts = json.load(f)
-    except json.JSONDecodeError:
-        print("[ERROR] pets.json is corrupted or invalid JSON. Returning empty list.")
-        return []
-
-    pets = []
-    for pd in pet_dicts:
-        pet = VirtualPet(
-            pd["name"],
-            pd["species"],
-            pd["personality"],
-            pd["sprite_name"],
-            pd.get("hunger", 50),
-            pd.get("happiness", 50),
-            pd.get("energy", 50),
-            pd.get("relationships", {}),
-            pd.get("sleeping", False),
-            pd.get("state", "idle"),
+    errors = errors if errors is not None else []
+    skipped = len(errors)
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        for index, offset, pd in iter_pet_dicts(f, errors):
+            try:
+                yield pet_from_dict(pd)
+            except KeyError as e:
+                _report(errors, LoadError(index, offset, f"missing field {e}"))
+            except (TypeError, ValueError, AttributeError) as e:
+                _report(errors, LoadError(index, offset, str(e)))
+
+    if len(errors) > skipped:
+        backup = DATA_PATH + ".corrupt"
+        shutil.copy2(DATA_PATH, backup)
+        print(
+            f"[WARN] Skipped {len(errors) - skipped} pet record(s); original kept at {backup}"
         )
-        pets.append(pet)
-    return pets
+
+
+def _iter_snapshot_pets(errors=None):
+    snapshot = None
+    try:
+        snapshot = PetSnapshot(SNAPSHOT_PATH)
+        # Opening checks every reference and iter() decodes the strings, so
+        # past this point reading can't fail partway through
+        pet_dicts = iter(snapshot)
+    except (OSError, SnapshotError) as e:
+        if snapshot is not None:
+            snapshot.close()
+        backup = SNAPSHOT_PATH + ".corrupt"
+        shutil.copy2(SNAPSHOT_PATH, backup)
+        print(f"[ERROR] Could not read {SNAPSHOT_PATH}: {e}; original kept at {backup}")
+        fallback = os.path.exists(DATA_PATH) and os.path.getsize(DATA_PATH) > 0
+        if errors is not None:
+            errors.append(LoadError(None, 0, f"unreadable snapshot: {e}", not fallback))
+        if fallback:
+            print(f"[WARN] Loading the older {DATA_PATH} instead.")
+            yield from _iter_json_pets(errors)
+        return
+    with snapshot:
+        for pd in pet_dicts:
+            yield pet_from_dict(pd)
+
+
+def load_pets(errors=None):
+    return migrate_relationship_keys(list(iter_pets(errors)))
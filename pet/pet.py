@@ -1,4 +1,75 @@
+import sys
+import uuid
+
+SPECIES = ("cat",)
+PERSONALITIES = ("affectionate", "playful", "lazy", "curious", "shy", "aggressive")
+
+
+def new_pet_id():
+    return uuid.uuid4().hex
+
+
+# Fields a PetPopulation stores in arrays (see _PopulationField)
+POPULATION_FIELDS = ("species", "personality", "hunger", "happiness", "energy", "state")
+
+
+class _PopulationField:
+    """Pet attribute that lives in a PetPopulation's arrays once the pet is bound.
+
+    Unbound pets keep it in their ``_local`` list, which bound pets drop, so
+    a bound pet pays one slot for all of these fields. Text values are
+    interned so thousands of pets share one "cat" or "lazy" string.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.index = POPULATION_FIELDS.index(name)
+
+    def __get__(self, pet, owner=None):
+        if pet is None:
+            return self
+        if pet._population is None:
+            return pet._local[self.index]
+        return pet._population.get(self.name, pet._slot)
+
+    def __set__(self, pet, value):
+        if pet._population is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            if pet._local is None:
+                pet._local = [None] * len(POPULATION_FIELDS)
+            pet._local[self.index] = value
+        else:
+            pet._population.set(self.name, pet._slot, value)
+
+
 class VirtualPet:
+    # No per-instance __dict__: 100k pets are mostly pointers into shared,
+    # interned strings (see benchmarks/bench_memory.py)
+    __slots__ = (
+        "_population",
+        "_slot",
+        "_local",
+        "_graph",
+        "id",
+        "name",
+        "sprite_name",
+        "_relationships",
+        "sleeping",
+        "last_seen",
+        # UI bookkeeping (animation choice, profile window)
+        "_current_animation_key",
+        "_last_state",
+        "requested_attention",
+    )
+
+    species = _PopulationField("species")
+    personality = _PopulationField("personality")
+    hunger = _PopulationField("hunger")
+    happiness = _PopulationField("happiness")
+    energy = _PopulationField("energy")
+    state = _PopulationField("state")
+
     def __init__(
         self,
         name,
@@ -11,19 +82,46 @@ class VirtualPet:
         relationships=None,
         sleeping=False,
         state="idle",
+        last_seen=None,
+        pet_id=None,
     ):
+        self._population = None
+        self._slot = None
+        self._local = None
+        self._graph = None
+        # Stable identity; names can change and need not be unique
+        self.id = pet_id or new_pet_id()
         self.name = name
         self.species = species
         self.personality = personality
-        self.sprite_name = sprite_name
+        self.sprite_name = sys.intern(sprite_name)
         self.hunger = hunger
         self.happiness = happiness
         self.energy = energy
         self.relationships = relationships if relationships else {}
         self.sleeping = sleeping
         self.state = state
+        # Wall-clock time (epoch seconds) the stats were last known to be current
+        self.last_seen = last_seen
         self._current_animation_key = None
         self._last_state = state
+        self.requested_attention = False
+
+    @property
+    def relationships(self):
+        """Friendship scores toward other pets, keyed by their ``id``."""
+        if self._graph is None:
+            return self._relationships
+        return self._graph.edges(self.id)
+
+    @relationships.setter
+    def relationships(self, value):
+        if self._graph is None:
+            self._relationships = dict(value)
+        else:
+            edges = self._graph.edges(self.id)
+            edges.clear()
+            edges.update(value)
 
     def feed(self):
         self.adjust_stat("hunger", -10)
@@ -52,6 +150,7 @@ class VirtualPet:
 
     def to_dict(self):
         return {
+            "id": self.id,
             "name": self.name,
             "species": self.species,
             "personality": self.personality,
@@ -59,7 +158,8 @@ class VirtualPet:
             "hunger": self.hunger,
             "happiness": self.happiness,
             "energy": self.energy,
-            "relationships": self.relationships,
+            "relationships": dict(self.relationships),
             "sleeping": self.sleeping,
             "state": self.state,
+            "last_seen": self.last_seen,
         }
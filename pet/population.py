@@ -0,0 +1,162 @@
+import numpy as np
+
+from pet.pet import PERSONALITIES, SPECIES
+
+STATS = ("hunger", "happiness", "energy")
+
+# Stat change applied to every pet on each decay tick
+DECAY_DELTAS = {"hunger": +2, "happiness": -2, "energy": -1}
+
+# Known states get fixed codes; unknown ones are appended on first use
+STATES = ("idle", "sleeping", "walking", "playing", "praying", "collapsed", "waking")
+
+# Text fields stored as small integer codes, with their known values
+CODED_FIELDS = {"state": STATES, "species": SPECIES, "personality": PERSONALITIES}
+FIELDS = (*STATS, *CODED_FIELDS)
+
+STAT_DTYPE = np.int16
+CODE_DTYPE = np.int8
+
+
+class PetPopulation:
+    """Stats and states of many pets held in contiguous NumPy arrays.
+
+    Pets added to a population are bound to it: reading or writing their
+    stats, ``state``, ``species`` or ``personality`` goes through the arrays,
+    so each VirtualPet acts as a view on its slot and batch operations like
+    ``decay`` are visible to the UI immediately. Text fields are stored as
+    int8 codes into per-field name tables.
+    """
+
+    def __init__(self, pets=(), capacity=16):
+        self.pets = []
+        self.names = {field: list(values) for field, values in CODED_FIELDS.items()}
+        self._codes = {
+            field: {name: code for code, name in enumerate(values)}
+            for field, values in CODED_FIELDS.items()
+        }
+        self._allocate(max(capacity, len(pets)))
+        for pet in pets:
+            self.add(pet)
+
+    def __len__(self):
+        return len(self.pets)
+
+    def _allocate(self, capacity):
+        size = len(self.pets)
+        for name in FIELDS:
+            dtype = CODE_DTYPE if name in CODED_FIELDS else STAT_DTYPE
+            array = np.zeros(capacity, dtype=dtype)
+            if size:
+                array[:size] = getattr(self, name)[:size]
+            setattr(self, name, array)
+
+    def code(self, field, name):
+        codes = self._codes[field]
+        code = codes.get(name)
+        if code is None:
+            names = self.names[field]
+            if len(names) > np.iinfo(CODE_DTYPE).max:
+                raise ValueError(f"Too many distinct values for {field}")
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+
+    def get(self, field, slot):
+        if field in CODED_FIELDS:
+            return self.names[field][getattr(self, field)[slot]]
+        return int(getattr(self, field)[slot])
+
+    def set(self, field, slot, value):
+        if field in CODED_FIELDS:
+            value = self.code(field, value)
+        getattr(self, field)[slot] = value
+
+    def add(self, pet):
+        if pet._population is not None:
+            raise ValueError(f"{pet.name} already belongs to a population")
+        slot = len(self.pets)
+        if slot == len(self.state):
+            self._allocate(max(16, slot * 2))
+
+        for name in FIELDS:
+            self.set(name, slot, getattr(pet, name))
+        self.pets.append(pet)
+        pet._population = self
+        pet._slot = slot
+        pet._local = None  # the arrays hold these fields now
+
+    def remove(self, pet):
+        """Unbinds the pet, keeping its current values on the pet itself."""
+        if pet._population is not self:
+            raise ValueError(f"{pet.name} does not belong to this population")
+        slot = pet._slot
+        values = {name: self.get(name, slot) for name in FIELDS}
+        pet._population = None
+        pet._slot = None
+        for name, value in values.items():
+            setattr(pet, name, value)
+
+        # Move the last pet into the freed slot to keep the arrays dense
+        last = len(self.pets) - 1
+        if slot != last:
+            moved = self.pets[last]
+            for name in FIELDS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            self.pets[slot] = moved
+            moved._slot = slot
+        self.pets.pop()
+
+    def decay(self, deltas=DECAY_DELTAS, ticks=1):
+        """Applies decay ticks to every pet and updates threshold states.
+
+        ``ticks`` is a tick count, either one for everyone or an array with
+        one count per slot (0 leaves a pet untouched). Stats only move in one
+        direction and are clamped, so k ticks collapse to a single clamped
+        ``stat + k * delta``, and the threshold rules evaluated on the final
+        stats give the same state as running k ticks one by one.
+
+        Returns the slots whose state changed.
+        """
+        size = len(self.pets)
+        hunger = self.hunger[:size]
+        happiness = self.happiness[:size]
+        energy = self.energy[:size]
+        state = self.state[:size]
+
+        # Every stat is pinned at 0 or 100 after 100 ticks; capping keeps
+        # the intermediate values small enough for the stat dtype
+        ticks = np.minimum(np.asarray(ticks), 100).astype(STAT_DTYPE)
+        active = np.broadcast_to(ticks > 0, (size,))
+
+        for name, array in (
+            ("hunger", hunger),
+            ("happiness", happiness),
+            ("energy", energy),
+        ):
+            np.clip(array + deltas[name] * ticks, 0, 100, out=array)
+
+        state_codes = self._codes["state"]
+        sleeping_code = state_codes["sleeping"]
+        collapsed_code = state_codes["collapsed"]
+        # Same precedence as the per-pet rules: sleeping, then collapsed, then
+        # sad pets drop back to idle without overwriting those two states
+        sleeping = active & (energy < 20)
+        collapsed = active & ~sleeping & (hunger > 80)
+        idle = (
+            active
+            & ~sleeping
+            & ~collapsed
+            & (happiness < 30)
+            & (state != sleeping_code)
+            & (state != collapsed_code)
+        )
+
+        new_state = state.copy()
+        new_state[sleeping] = sleeping_code
+        new_state[collapsed] = collapsed_code
+        new_state[idle] = state_codes["idle"]
+        changed = np.flatnonzero(new_state != state)
+        state[:] = new_state
+        return changed
@@ -0,0 +1,122 @@
+import heapq
+from collections.abc import MutableMapping
+
+
+class RelationshipGraph:
+    """Directed friendship scores between pets, keyed by stable pet IDs.
+
+    Stored as a sparse adjacency map (outgoing scores per pet) plus an index
+    of incoming edges, so setting a score is O(1) and removing a pet only
+    touches its own edges, O(degree).
+    """
+
+    def __init__(self):
+        self._out = {}
+        self._in = {}
+
+    def __contains__(self, pet_id):
+        return pet_id in self._out
+
+    def __len__(self):
+        return len(self._out)
+
+    def add_pet(self, pet):
+        """Moves the pet's own scores into the graph.
+
+        From then on ``pet.relationships`` reads and writes the graph.
+        """
+        if pet._graph is not None:
+            raise ValueError(f"{pet.name} already belongs to a relationship graph")
+        self.add_node(pet.id, pet._relationships)
+        pet._relationships = {}
+        pet._graph = self
+
+    def remove_pet(self, pet):
+        """Drops the pet and every edge to or from it, in O(degree).
+
+        The pet keeps a plain copy of its outgoing scores.
+        """
+        if pet._graph is not self:
+            raise ValueError(f"{pet.name} does not belong to this graph")
+        pet._relationships = dict(self._out.get(pet.id, {}))
+        pet._graph = None
+        self.remove_node(pet.id)
+
+    def add_node(self, pet_id, edges=None):
+        self._out.setdefault(pet_id, {})
+        self._in.setdefault(pet_id, set())
+        for other, score in (edges or {}).items():
+            self.set(pet_id, other, score)
+
+    def remove_node(self, pet_id):
+        for other in self._out.pop(pet_id, {}):
+            self._in[other].discard(pet_id)
+        for source in self._in.pop(pet_id, set()):
+            self._out[source].pop(pet_id, None)
+
+    def get(self, pet_id, other, default=0):
+        return self._out.get(pet_id, {}).get(other, default)
+
+    def set(self, pet_id, other, score):
+        self._out.setdefault(pet_id, {})[other] = score
+        self._in.setdefault(other, set()).add(pet_id)
+        self._in.setdefault(pet_id, set())
+
+    def remove_edge(self, pet_id, other):
+        del self._out[pet_id][other]
+        self._in[other].discard(pet_id)
+
+    def edges(self, pet_id):
+        return EdgeView(self, pet_id)
+
+    def top_friends(self, pet_id, k=5):
+        """The k highest-scoring (other_id, score) pairs, best first."""
+        edges = self._out.get(pet_id, {})
+        return heapq.nlargest(k, edges.items(), key=lambda item: item[1])
+
+
+class EdgeView(MutableMapping):
+    """Dict-like view of one pet's outgoing scores, writing through to the graph."""
+
+    def __init__(self, graph, pet_id):
+        self._graph = graph
+        self._pet_id = pet_id
+
+    def _edges(self):
+        return self._graph._out.get(self._pet_id, {})
+
+    def __getitem__(self, other):
+        return self._edges()[other]
+
+    def __setitem__(self, other, score):
+        self._graph.set(self._pet_id, other, score)
+
+    def __delitem__(self, other):
+        if other not in self._edges():
+            raise KeyError(other)
+        self._graph.remove_edge(self._pet_id, other)
+
+    def __iter__(self):
+        return iter(self._edges())
+
+    def __len__(self):
+        return len(self._edges())
+
+    def __contains__(self, other):
+        return other in self._edges()
+
+    def get(self, other, default=None):
+        return self._edges().get(other, default)
+
+    # Read-only views straight from the graph, skipping the Mapping fallbacks
+    def keys(self):
+        return self._edges().keys()
+
+    def values(self):
+        return self._edges().values()
+
+    def items(self):
+        return self._edges().items()
+
+    def __repr__(self):
+        return f"EdgeView({self._edges()!r})"
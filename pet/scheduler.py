@@ -0,0 +1,140 @@
+import random
+
+# Share of the household that starts an interaction on each tick, up to a
+# fixed number of pairs so a tick costs the same for 50 or 50k cats
+INTERACTION_SHARE = 0.25
+MAX_PAIRS_PER_TICK = 8
+
+# How often a personality starts an interaction, relative to the others
+SOCIABILITY = {
+    "affectionate": 3.0,
+    "playful": 3.0,
+    "curious": 2.0,
+    "lazy": 1.0,
+    "shy": 1.0,
+}
+
+# Chance that a proposed pair actually gets together; friendship adds to it
+COMPATIBILITY = {
+    frozenset({"playful"}): 1.0,
+    frozenset({"affectionate"}): 1.0,
+    frozenset({"playful", "shy"}): 0.4,
+    frozenset({"playful", "lazy"}): 0.5,
+    frozenset({"shy"}): 0.6,
+}
+DEFAULT_COMPATIBILITY = 0.8
+
+# Chance that a cat looks for one of its friends rather than anyone at all
+FRIEND_BIAS = 0.5
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) to build, O(1) per weighted draw."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Whatever is left is 1.0 up to rounding error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample(self, rng=random):
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+def compatibility(pet1, pet2):
+    key = frozenset({pet1.personality, pet2.personality})
+    base = COMPATIBILITY.get(key, DEFAULT_COMPATIBILITY)
+    return min(1.0, base + pet1.relationships.get(pet2.id, 0) / 200)
+
+
+class InteractionScheduler:
+    """Picks the pairs of pets that interact on one simulation tick.
+
+    Initiators are drawn from an alias table weighted by personality, and
+    partners are either one of the initiator's friends (weighted by score) or
+    another sociable pet. Each pet takes part in at most one pair per tick,
+    and the number of pairs grows with the household up to ``max_pairs``.
+
+    Pass the household's ``version`` (see PetSimulation) to reuse the alias
+    table between ticks; it is rebuilt whenever the version changes.
+    """
+
+    def __init__(
+        self, rng=random, share=INTERACTION_SHARE, max_pairs=MAX_PAIRS_PER_TICK
+    ):
+        self.rng = rng
+        self.share = share
+        self.max_pairs = max_pairs
+        self._version = None
+        self._table = None
+        self._slots = None
+
+    def pick_pairs(self, pets, version=None):
+        if len(pets) < 2:
+            return []
+        target = min(
+            len(pets) // 2, max(1, int(len(pets) * self.share)), self.max_pairs
+        )
+        table, slots = self._lookup(pets, version)
+
+        pairs = []
+        busy = set()
+        # Bounded so a household of incompatible cats can't stall the tick
+        for _ in range(target * 8):
+            if len(pairs) == target:
+                break
+            i = table.sample(self.rng)
+            if i in busy:
+                continue
+            j = self._pick_partner(pets[i], table, slots)
+            if j is None or j == i or j in busy:
+                continue
+            if self.rng.random() >= compatibility(pets[i], pets[j]):
+                continue
+            busy.update((i, j))
+            pairs.append((pets[i], pets[j]))
+        return pairs
+
+    def _lookup(self, pets, version):
+        if (
+            version is None
+            or version != self._version
+            or self._table is None
+            or len(self._table) != len(pets)
+        ):
+            self._table = AliasTable(
+                [SOCIABILITY.get(pet.personality, 1.0) for pet in pets]
+            )
+            self._slots = {pet.id: i for i, pet in enumerate(pets)}
+            self._version = version
+        return self._table, self._slots
+
+    def _pick_partner(self, pet, table, slots):
+        friends = pet.relationships
+        if friends and self.rng.random() < FRIEND_BIAS:
+            scores = list(friends.values())
+            if sum(scores) > 0:
+                (other,) = self.rng.choices(list(friends), weights=scores)
+                return slots.get(other)
+        return table.sample(self.rng)
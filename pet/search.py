@@ -0,0 +1,139 @@
+from collections import defaultdict, namedtuple
+
+# Status words that can be typed into the search box, matched against live stats
+STATUS_FILTERS = {
+    "hungry": lambda pet: pet.hunger > 80,
+    "tired": lambda pet: pet.energy < 20,
+    "sad": lambda pet: pet.happiness < 30,
+    "sleeping": lambda pet: pet.state == "sleeping",
+}
+
+# Fields usable as ``field:value``; species and personality match by prefix
+VALUE_FIELDS = ("species", "personality")
+
+
+def trigrams(text):
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchQuery(namedtuple("SearchQuery", ["ids", "predicates"])):
+    """A parsed search. ``ids`` are the pets whose name, species and
+    personality match (None: no text terms); ``predicates`` test live
+    stats and states, so they stay right as the cats change."""
+
+    __slots__ = ()
+
+    def matches(self, pet):
+        if self.ids is not None and pet.id not in self.ids:
+            return False
+        return all(predicate(pet) for predicate in self.predicates)
+
+
+class PetSearchIndex:
+    """Trigram index over each pet's name, species and personality.
+
+    Kept up to date with ``add``, ``remove`` and ``update`` (after an edit),
+    so a query only touches the postings of its own trigrams. Terms shorter
+    than three characters fall back to scanning the indexed text.
+
+    Query syntax: whitespace-separated terms, all of which must match.
+    A term is free text (a substring of "name species personality"), a
+    status word from STATUS_FILTERS, or ``field:value`` for name, species,
+    personality or state.
+    """
+
+    def __init__(self, pets=()):
+        self._texts = {}
+        self._names = {}
+        self._grams = defaultdict(set)
+        self._values = {field: defaultdict(set) for field in VALUE_FIELDS}
+        self._entries = {}
+        for pet in pets:
+            self.add(pet)
+
+    def __len__(self):
+        return len(self._texts)
+
+    # === Maintenance ===
+    def add(self, pet):
+        name = pet.name.lower()
+        text = f"{name} {pet.species} {pet.personality}".lower()
+        values = {field: getattr(pet, field) for field in VALUE_FIELDS}
+        self._texts[pet.id] = text
+        self._names[pet.id] = name
+        self._entries[pet.id] = values
+        for gram in trigrams(text):
+            self._grams[gram].add(pet.id)
+        for field, value in values.items():
+            self._values[field][value].add(pet.id)
+
+    def remove(self, pet):
+        # What was indexed, which may differ from the pet after an edit
+        text = self._texts.pop(pet.id, None)
+        if text is None:
+            return
+        del self._names[pet.id]
+        for gram in trigrams(text):
+            postings = self._grams[gram]
+            postings.discard(pet.id)
+            if not postings:
+                del self._grams[gram]
+        for field, value in self._entries.pop(pet.id).items():
+            self._values[field][value].discard(pet.id)
+
+    def update(self, pet):
+        self.remove(pet)
+        self.add(pet)
+
+    # === Queries ===
+    def query(self, text):
+        """Parses ``text`` into a SearchQuery; None when there is nothing to filter."""
+        ids = None
+        predicates = []
+        # Longest terms first: they narrow things down the most, and later
+        # terms then only check the pets still in the running
+        for term in sorted(text.lower().split(), key=len, reverse=True):
+            field, _, value = term.partition(":")
+            if term in STATUS_FILTERS:
+                predicates.append(STATUS_FILTERS[term])
+                continue
+            if value and field in VALUE_FIELDS:
+                matched = self._value_matches(field, value)
+            elif value and field == "name":
+                matched = self._text_matches(value, self._names, ids)
+            elif value and field == "state":
+                predicates.append(lambda pet, state=value: pet.state.startswith(state))
+                continue
+            else:
+                matched = self._text_matches(term, self._texts, ids)
+            ids = matched if ids is None else ids & matched
+
+        if ids is None and not predicates:
+            return None
+        return SearchQuery(None if ids is None else frozenset(ids), tuple(predicates))
+
+    def _value_matches(self, field, prefix):
+        matched = set()
+        for value, ids in self._values[field].items():
+            if value.startswith(prefix):
+                matched |= ids
+        return matched
+
+    def _text_matches(self, term, texts, candidates=None):
+        if candidates is not None:
+            return {pet_id for pet_id in candidates if term in texts[pet_id]}
+        if len(term) < 3:
+            return {pet_id for pet_id, text in texts.items() if term in text}
+        # Intersect the rarest postings first; no posting means no match
+        postings = sorted(
+            (self._grams.get(gram, frozenset()) for gram in trigrams(term)), key=len
+        )
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+            if not candidates:
+                break
+        if len(term) == 3 and texts is self._texts:
+            return candidates
+        # Trigrams don't guarantee the term appears in one piece (or in the name)
+        return {pet_id for pet_id in candidates if term in texts[pet_id]}
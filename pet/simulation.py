@@ -0,0 +1,188 @@
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from pet.interactions import resolve_interaction
+from pet.pet import new_pet_id
+from pet.population import PetPopulation
+from pet.relationships import RelationshipGraph
+from pet.scheduler import InteractionScheduler
+
+# Simulated seconds between recurring events
+INTERACTION_INTERVAL = 10
+DECAY_INTERVAL = 60
+ANIMATION_ROTATION_INTERVAL = 30
+
+
+class SimulationEvent(
+    namedtuple("SimulationEvent", ["kind", "time", "pets", "outcomes"])
+):
+    """Something that happened during a tick.
+
+    Interaction events carry their InteractionOutcomes; the log message is
+    only formatted when someone reads ``message``.
+    """
+
+    __slots__ = ()
+
+    @property
+    def message(self):
+        return "\n".join(outcome.message for outcome in self.outcomes)
+
+
+class PetSimulation:
+    """Headless, seedable simulation of a household of pets.
+
+    Owns random interactions, stat decay and state transitions, and reports
+    what happened to subscribers as SimulationEvents. Time only moves when
+    ``advance`` is called, so the same seed always gives the same run and a
+    long stretch can be fast-forwarded as quickly as the CPU allows.
+    """
+
+    def __init__(self, pets=None, seed=None):
+        self.pets = pets if pets is not None else []
+        # Every pet by its id; ids are unique within the household
+        self.by_id = {}
+        for pet in self.pets:
+            self._register(pet)
+        self.population = PetPopulation(self.pets)
+        self.relationships = RelationshipGraph()
+        for pet in self.pets:
+            self.relationships.add_pet(pet)
+        self.rng = random.Random(seed)
+        self.scheduler = InteractionScheduler(self.rng)
+        self.time = 0.0
+        # Bumped whenever pets are added, removed or edited (see mark_changed)
+        self.version = 0
+        self._listeners = []
+        self._schedule = {
+            "interaction": (INTERACTION_INTERVAL, self.interact),
+            "decay": (DECAY_INTERVAL, self.decay),
+            "rotate_animations": (ANIMATION_ROTATION_INTERVAL, self.rotate_animations),
+        }
+        self._due = {kind: interval for kind, (interval, _) in self._schedule.items()}
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def _emit(self, kind, pets=(), outcomes=()):
+        event = SimulationEvent(kind, self.time, tuple(pets), tuple(outcomes))
+        for callback in self._listeners:
+            callback(event)
+        return event
+
+    # === Household ===
+    def _register(self, pet):
+        if pet.id in self.by_id:
+            print(
+                f"[WARN] {pet.name} has the same id as {self.by_id[pet.id].name}; "
+                "giving it a new one."
+            )
+            pet.id = new_pet_id()
+        self.by_id[pet.id] = pet
+
+    def add_pet(self, pet):
+        self._register(pet)
+        self.pets.append(pet)
+        self.population.add(pet)
+        self.relationships.add_pet(pet)
+        self.mark_changed()
+
+    def add_pets(self, pets):
+        for pet in pets:
+            self.add_pet(pet)
+
+    def remove_pet(self, pet):
+        self.pets.remove(pet)
+        del self.by_id[pet.id]
+        self.population.remove(pet)
+        # Also drops every other pet's score toward this one
+        self.relationships.remove_pet(pet)
+        self.mark_changed()
+
+    def mark_changed(self):
+        """Call after editing a pet's personality (or anything else that
+        changes who it is rather than how it feels)."""
+        self.version += 1
+
+    # === Time ===
+    def advance(self, seconds):
+        """Moves simulated time forward, running every event that falls due."""
+        end = self.time + seconds
+        while True:
+            kind = min(self._due, key=self._due.get)
+            due = self._due[kind]
+            if due > end:
+                break
+            self.time = due
+            interval, handler = self._schedule[kind]
+            self._due[kind] = due + interval
+            handler()
+        self.time = end
+
+    def skip(self, seconds):
+        """Jumps over a stretch of time without replaying it tick by tick.
+
+        For gaps like the machine sleeping: the decay ticks that fell due are
+        applied in one closed-form step, while the missed interactions and
+        animation rotations are dropped.
+        """
+        end = self.time + seconds
+        for kind, (interval, _) in self._schedule.items():
+            due = self._due[kind]
+            missed = 0 if due > end else int((end - due) // interval) + 1
+            self._due[kind] = due + missed * interval
+            if kind == "decay" and missed:
+                changed = self.population.decay(ticks=missed)
+                self.time = end
+                self._emit("decay", [self.population.pets[slot] for slot in changed])
+        self.time = end
+
+    def fast_forward(self, minutes):
+        self.advance(minutes * 60)
+
+    def catch_up(self, now, pets=None):
+        """Applies the decay the pets missed since their ``last_seen`` time.
+
+        Each pet is advanced in closed form (see PetPopulation.decay), so a
+        gap of weeks costs the same as a gap of minutes. Only ``pets`` are
+        touched when given (e.g. a batch that just finished loading); pets
+        without a ``last_seen`` are left alone. Returns the longest gap in
+        seconds.
+        """
+        pets = self.population.pets if pets is None else pets
+        gaps = np.zeros(len(self.population), dtype=np.float64)
+        for pet in pets:
+            if pet.last_seen is not None:
+                gaps[pet._slot] = max(0.0, now - pet.last_seen)
+        if not gaps.any():
+            return 0.0
+
+        changed = self.population.decay(ticks=gaps // DECAY_INTERVAL)
+        for pet in pets:
+            pet.last_seen = now
+        self._emit("catch_up", [self.population.pets[slot] for slot in changed])
+        return float(gaps.max())
+
+    # === Events ===
+    def interact(self):
+        """Runs one batch of interactions and reports them as a single event."""
+        pets = []
+        outcomes = []
+        for p1, p2 in self.scheduler.pick_pairs(self.pets, self.version):
+            outcome = resolve_interaction(p1, p2, rng=self.rng)
+            if outcome is not None:
+                pets += (p1, p2)
+                outcomes.append(outcome)
+
+        if not outcomes:
+            return None
+        return self._emit("interaction", pets, outcomes)
+
+    def decay(self):
+        changed = self.population.decay()
+        return self._emit("decay", [self.population.pets[slot] for slot in changed])
+
+    def rotate_animations(self):
+        return self._emit("rotate_animations", self.pets)
@@ -0,0 +1,340 @@
+"""Compact binary snapshot of the whole household.
+
+Layout (little-endian):
+
+    header        magic, version, record size, counts and section offsets
+    records       one fixed-width RECORD_DTYPE row per pet
+    relationships (other, score) rows; each pet owns a contiguous run
+    string table  uint32 offsets (count + 1) followed by a UTF-8 blob
+
+Every text value (ids, names, species, personalities, sprite names,
+states) is stored once in the string table and referenced by index. The
+file is memory-mapped and read lazily: opening it only checks every
+reference in a few vectorized passes, and a pet's strings are only decoded
+when it is read. (The app itself still reads every record into a VirtualPet
+on startup.)
+
+Convert to and from pets.json with:
+    python -m pet.snapshot to-snapshot data/pets.json data/pets.snap
+    python -m pet.snapshot to-json data/pets.snap data/pets.json
+"""
+
+import argparse
+import math
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from pet.atomic import atomic_write
+
+MAGIC = b"PETSNAP\0"
+VERSION = 1
+
+HEADER = struct.Struct("<8sHHIIIQQQQ")
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("id", "<u4"),
+        ("name", "<u4"),
+        ("species", "<u4"),
+        ("personality", "<u4"),
+        ("sprite_name", "<u4"),
+        ("state", "<u4"),
+        ("hunger", "<i2"),
+        ("happiness", "<i2"),
+        ("energy", "<i2"),
+        ("sleeping", "u1"),
+        ("_pad", "u1"),
+        ("last_seen", "<f8"),
+        ("rel_start", "<u4"),
+        ("rel_count", "<u4"),
+    ]
+)
+RELATIONSHIP_DTYPE = np.dtype([("other", "<u4"), ("score", "<i2")])
+OFFSET_DTYPE = np.dtype("<u4")
+# Record fields holding a string table index
+STRING_FIELDS = ("id", "name", "species", "personality", "sprite_name", "state")
+
+
+class SnapshotError(ValueError):
+    """The file is not a snapshot this version can read."""
+
+
+# === Writing ===
+def encode_snapshot(pet_dicts):
+    """Serializes pets in the pets.json schema to snapshot bytes."""
+    strings = {}
+
+    def intern(text):
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    rows = []
+    relationships = []
+    for pd in pet_dicts:
+        rel_start = len(relationships)
+        for other, score in pd.get("relationships", {}).items():
+            relationships.append((intern(other), score))
+        last_seen = pd.get("last_seen")
+        rows.append(
+            (
+                intern(pd["id"]),
+                intern(pd["name"]),
+                intern(pd["species"]),
+                intern(pd["personality"]),
+                intern(pd["sprite_name"]),
+                intern(pd.get("state", "idle")),
+                pd.get("hunger", 50),
+                pd.get("happiness", 50),
+                pd.get("energy", 50),
+                bool(pd.get("sleeping", False)),
+                0,
+                math.nan if last_seen is None else last_seen,
+                rel_start,
+                len(relationships) - rel_start,
+            )
+        )
+
+    records = np.array(rows, dtype=RECORD_DTYPE)
+    rels = np.array(relationships, dtype=RELATIONSHIP_DTYPE)
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=OFFSET_DTYPE)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+    records_offset = HEADER.size
+    rels_offset = records_offset + records.nbytes
+    strings_offset = rels_offset + rels.nbytes
+    blob_offset = strings_offset + offsets.nbytes
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        RECORD_DTYPE.itemsize,
+        len(records),
+        len(rels),
+        len(encoded),
+        records_offset,
+        rels_offset,
+        strings_offset,
+        blob_offset,
+    )
+    return b"".join(
+        (header, records.tobytes(), rels.tobytes(), offsets.tobytes(), *encoded)
+    )
+
+
+def write_snapshot(pet_dicts, path):
+    """Writes a snapshot via a temp file and atomic rename, like pets.json."""
+    data = encode_snapshot(pet_dicts)
+    with atomic_write(path, "wb", prefix=".pets-") as f:
+        f.write(data)
+
+
+# === Reading ===
+class PetSnapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    ``snapshot[i]`` and iteration give pets in the pets.json dict schema;
+    ``records`` exposes the fixed-width rows as a NumPy array for bulk reads.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = self.relationships = self._offsets = None
+        self._strings = {}
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:
+                raise SnapshotError(f"{path} is too short to be a pet snapshot")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_header(size)
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_header(self, size):
+        (
+            magic,
+            version,
+            record_size,
+            count,
+            rel_count,
+            string_count,
+            records_offset,
+            rels_offset,
+            strings_offset,
+            blob_offset,
+        ) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise SnapshotError(f"{self.path} is not a pet snapshot")
+        if version != VERSION:
+            raise SnapshotError(
+                f"{self.path} is snapshot version {version}; expected {VERSION}"
+            )
+        if record_size != RECORD_DTYPE.itemsize:
+            raise SnapshotError(f"{self.path} has {record_size}-byte records")
+        sections = (
+            (records_offset, count * RECORD_DTYPE.itemsize),
+            (rels_offset, rel_count * RELATIONSHIP_DTYPE.itemsize),
+            (strings_offset, (string_count + 1) * OFFSET_DTYPE.itemsize),
+        )
+        if any(offset + length > size for offset, length in sections):
+            raise SnapshotError(f"{self.path} is truncated")
+
+        buffer = self._mmap
+        self.records = np.frombuffer(buffer, RECORD_DTYPE, count, records_offset)
+        self.relationships = np.frombuffer(
+            buffer, RELATIONSHIP_DTYPE, rel_count, rels_offset
+        )
+        self._offsets = np.frombuffer(
+            buffer, OFFSET_DTYPE, string_count + 1, strings_offset
+        )
+        self._blob_offset = blob_offset
+        if string_count and blob_offset + int(self._offsets[-1]) > size:
+            raise SnapshotError(f"{self.path} is truncated")
+        self._check_references(string_count, rel_count)
+
+    def _check_references(self, string_count, rel_count):
+        # Checked up front, so reading can't fail halfway through the household.
+        # (No locals holding views of the map: the traceback would keep them
+        # alive and close() couldn't release it.)
+        if len(self.records):
+            for field in STRING_FIELDS:
+                if self.records[field].max() >= string_count:
+                    raise SnapshotError(f"{self.path} has a bad {field} reference")
+            starts = self.records["rel_start"].astype(np.uint64)
+            ends = starts + self.records["rel_count"]
+            if ends.max() > rel_count:
+                raise SnapshotError(f"{self.path} has a bad relationship range")
+        if rel_count and self.relationships["other"].max() >= string_count:
+            raise SnapshotError(f"{self.path} has a bad relationship reference")
+        if np.any(self._offsets[1:] < self._offsets[:-1]):
+            raise SnapshotError(f"{self.path} has a bad string table")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        # Reading everything: decode the whole string table in one go and
+        # convert rows to Python tuples in blocks, both far cheaper than
+        # going field by field. The table is decoded here rather than on the
+        # first next(), so a bad string fails before any pet is read.
+        return self._iter_rows(self.string_table().__getitem__)
+
+    def _iter_rows(self, string):
+        for start in range(0, len(self.records), 4096):
+            for row in self.records[start : start + 4096].tolist():
+                yield self._to_dict(row, string)
+
+    def string_table(self):
+        bounds = (self._offsets + self._blob_offset).tolist()
+        data = self._mmap
+        try:
+            return [
+                data[start:end].decode("utf-8")
+                for start, end in zip(bounds, bounds[1:])
+            ]
+        except UnicodeDecodeError as e:
+            raise SnapshotError(f"{self.path} has a string that isn't UTF-8") from e
+
+    def string(self, index):
+        text = self._strings.get(index)
+        if text is None:
+            start = self._blob_offset + int(self._offsets[index])
+            end = self._blob_offset + int(self._offsets[index + 1])
+            try:
+                text = self._mmap[start:end].decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise SnapshotError(f"{self.path} has a string that isn't UTF-8") from e
+            self._strings[index] = text
+        return text
+
+    def __getitem__(self, i):
+        return self._to_dict(self.records[i].tolist(), self.string)
+
+    def _to_dict(self, row, string):
+        (
+            pet_id,
+            name,
+            species,
+            personality,
+            sprite_name,
+            state,
+            hunger,
+            happiness,
+            energy,
+            sleeping,
+            _,
+            last_seen,
+            rel_start,
+            rel_count,
+        ) = row
+        rels = self.relationships[rel_start : rel_start + rel_count].tolist()
+        return {
+            "id": string(pet_id),
+            "name": string(name),
+            "species": string(species),
+            "personality": string(personality),
+            "sprite_name": string(sprite_name),
+            "hunger": hunger,
+            "happiness": happiness,
+            "energy": energy,
+            "relationships": {string(other): score for other, score in rels},
+            "sleeping": bool(sleeping),
+            "state": string(state),
+            "last_seen": None if math.isnan(last_seen) else last_seen,
+        }
+
+    def close(self):
+        # The NumPy views must go before the map can be closed
+        self.records = self.relationships = self._offsets = None
+        self._mmap.close()
+
+
+def read_snapshot(path):
+    with PetSnapshot(path) as snapshot:
+        return list(snapshot)
+
+
+# === Converter ===
+def json_to_snapshot(json_path, snapshot_path):
+    # Through VirtualPet so older files (no ids, missing stats) are filled in
+    from pet.persistence import iter_pet_dicts, pet_from_dict
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        pet_dicts = [pet_from_dict(pd).to_dict() for _, _, pd in iter_pet_dicts(f)]
+    write_snapshot(pet_dicts, snapshot_path)
+
+
+def snapshot_to_json(snapshot_path, json_path):
+    from pet.persistence import write_pet_dicts
+
+    write_pet_dicts(read_snapshot(snapshot_path), json_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert pets.json <-> snapshot")
+    parser.add_argument("direction", choices=("to-snapshot", "to-json"))
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args()
+
+    if args.direction == "to-snapshot":
+        json_to_snapshot(args.source, args.target)
+    else:
+        snapshot_to_json(args.source, args.target)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import json
+import os
+import sqlite3
+import threading
+
+from pet.pet import new_pet_id
+
+SCHEMA_VERSION = 1
+
+PET_COLUMNS = (
+    "name",
+    "species",
+    "personality",
+    "sprite_name",
+    "hunger",
+    "happiness",
+    "energy",
+    "sleeping",
+    "state",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pets (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    species TEXT NOT NULL,
+    personality TEXT NOT NULL,
+    sprite_name TEXT NOT NULL,
+    hunger INTEGER NOT NULL,
+    happiness INTEGER NOT NULL,
+    energy INTEGER NOT NULL,
+    sleeping INTEGER NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS relationships (
+    pet_id TEXT NOT NULL,
+    other TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (pet_id, other)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+UPSERT_PET = (
+    f"INSERT INTO pets (id, {', '.join(PET_COLUMNS)}) "
+    f"VALUES (?{', ?' * len(PET_COLUMNS)}) "
+    "ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in PET_COLUMNS)
+)
+
+
+def _row_from_dict(pd):
+    return (
+        pd["name"],
+        pd["species"],
+        pd["personality"],
+        pd["sprite_name"],
+        pd.get("hunger", 50),
+        pd.get("happiness", 50),
+        pd.get("energy", 50),
+        int(bool(pd.get("sleeping", False))),
+        pd.get("state", "idle"),
+    )
+
+
+class SQLitePetStore:
+    """Pet storage in SQLite that only touches the rows that changed.
+
+    Works on the same list-of-dicts shape as pets.json, keyed by pet ``id``.
+    The last written state of every pet is kept in memory so a save can skip
+    unchanged pets and relationships. Rows are upserted in place, so rowid
+    order is the household order. Every save stamps the whole household with
+    the same ``last_seen``, so it is kept once in the meta table rather than
+    on every row.
+    """
+
+    def __init__(self, path, import_json_path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._relationships = {}
+        self._last_seen = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Saves may come from the PetSaver worker thread; access is serialized
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self.conn.commit()
+
+        if version == 0 and import_json_path:
+            self._import_json(import_json_path)
+        else:
+            self._refresh_cache()
+
+    def _import_json(self, json_path):
+        if not os.path.exists(json_path) or os.path.getsize(json_path) == 0:
+            return
+        try:
+            with open(json_path, "r") as f:
+                pet_dicts = json.load(f)
+        except json.JSONDecodeError:
+            print(f"[WARN] Could not import {json_path}: invalid JSON.")
+            return
+        for pd in pet_dicts:
+            pd.setdefault("id", new_pet_id())
+        self.save_dicts(pet_dicts)
+
+    def _refresh_cache(self):
+        rows = self.conn.execute(
+            f"SELECT id, {', '.join(PET_COLUMNS)} FROM pets ORDER BY rowid"
+        ).fetchall()
+        relationships = {}
+        for pet_id, other, score in self.conn.execute(
+            "SELECT pet_id, other, score FROM relationships"
+        ):
+            relationships.setdefault(pet_id, {})[other] = score
+
+        last_seen = self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'last_seen'"
+        ).fetchone()
+        self._last_seen = last_seen[0] if last_seen else None
+        self._rows = {row[0]: tuple(row[1:]) for row in rows}
+        self._relationships = {
+            pet_id: relationships.get(pet_id, {}) for pet_id in self._rows
+        }
+
+    def load_dicts(self):
+        with self._lock:
+            self._refresh_cache()
+            pet_dicts = []
+            for pet_id, row in self._rows.items():
+                pd = dict(zip(PET_COLUMNS, row))
+                pd["id"] = pet_id
+                pd["sleeping"] = bool(pd["sleeping"])
+                pd["relationships"] = dict(self._relationships[pet_id])
+                pd["last_seen"] = self._last_seen
+                pet_dicts.append(pd)
+        return pet_dicts
+
+    def save_dicts(self, pet_dicts):
+        with self._lock, self.conn:
+            for pd in pet_dicts:
+                pet_id = pd["id"]
+                row = _row_from_dict(pd)
+                if self._rows.get(pet_id) != row:
+                    self.conn.execute(UPSERT_PET, (pet_id, *row))
+                    self._rows[pet_id] = row
+                self._save_relationships(pet_id, pd.get("relationships", {}))
+
+            last_seen = max(
+                (pd["last_seen"] for pd in pet_dicts if pd.get("last_seen")),
+                default=None,
+            )
+            if last_seen is not None and last_seen != self._last_seen:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_seen', ?)",
+                    (last_seen,),
+                )
+                self._last_seen = last_seen
+
+            if len(self._rows) > len(pet_dicts):
+                current = {pd["id"] for pd in pet_dicts}
+                stale = [(pet_id,) for pet_id in self._rows if pet_id not in current]
+                self.conn.executemany("DELETE FROM pets WHERE id = ?", stale)
+                self.conn.executemany(
+                    "DELETE FROM relationships WHERE pet_id = ?", stale
+                )
+                for (pet_id,) in stale:
+                    del self._rows[pet_id]
+                    self._relationships.pop(pet_id, None)
+
+    def _save_relationships(self, pet_id, relationships):
+        previous = self._relationships.get(pet_id, {})
+        if previous == relationships:
+            return
+
+        changed = [
+            (pet_id, other, score)
+            for other, score in relationships.items()
+            if previous.get(other) != score
+        ]
+        removed = [(pet_id, other) for other in previous if other not in relationships]
+        if changed:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO relationships (pet_id, other, score) "
+                "VALUES (?, ?, ?)",
+                changed,
+            )
+        if removed:
+            self.conn.executemany(
+                "DELETE FROM relationships WHERE pet_id = ? AND other = ?", removed
+            )
+        self._relationships[pet_id] = dict(relationships)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -1,8 +1,21 @@
 from pathlib import Path
+import os
 import sys
 
+import pytest
+
 # Ensure the project root (which contains the `pet` and `ui` packages)
 # is on sys.path so tests can `import pet...` directly.
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+# Qt tests run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from pet.activity_log import ActivityLog
+
+
+def test_flush_returns_the_batch_and_keeps_the_newest_lines():
+    log = ActivityLog(capacity=3)
+    log.add("Mochi cuddled up next to Kumo.")
+    log.add("Momo napped.\nKumo observed Mochi.")
+    log.add("")
+
+    assert log.flush() == [
+        "Mochi cuddled up next to Kumo.",
+        "Momo napped.",
+        "Kumo observed Mochi.",
+    ]
+    assert log.flush() == []
+
+    log.add("Tofu pounced.")
+    log.flush()
+    assert list(log.lines) == ["Momo napped.", "Kumo observed Mochi.", "Tofu pounced."]
+
+
+def test_a_huge_batch_is_capped_at_capacity():
+    log = ActivityLog(capacity=10)
+    for i in range(1000):
+        log.add(f"line {i}")
+
+    batch = log.flush()
+
+    assert batch == [f"line {i}" for i in range(990, 1000)]
+    assert len(log.lines) == 10
+
+
+def test_lines_spill_to_a_rotating_file(tmp_path: Path):
+    path = tmp_path / "activity.log"
+    log = ActivityLog(capacity=5, path=str(path), max_bytes=200, backups=2)
+    for i in range(40):
+        log.add(f"Cat{i} looked at the window")
+        log.flush()
+    log.close()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["activity.log", "activity.log.1", "activity.log.2"]
+    assert all(p.stat().st_size <= 200 for p in tmp_path.iterdir())
+    assert (
+        path.read_text(encoding="utf-8").rstrip().endswith("Cat39 looked at the window")
+    )
@@ -0,0 +1,65 @@
+from ui.animation_clock import AnimationClock, FrameAnimation
+
+
+def test_looping_animation_wraps_around():
+    animation = FrameAnimation(["a", "b", "c"], interval=100, loop=True, started_at=0)
+
+    assert not animation.advance(50)
+    assert animation.current() == "a"
+    assert animation.advance(120)
+    assert animation.current() == "b"
+    assert animation.advance(330)
+    assert animation.current() == "a"  # 3 frames in: back to the first
+    assert not animation.finished
+
+
+def test_one_shot_animation_holds_the_last_frame():
+    animation = FrameAnimation(
+        ["a", "b", "c"], interval=100, loop=False, started_at=1000
+    )
+
+    animation.advance(1150)
+    assert animation.current() == "b"
+    assert not animation.finished
+
+    assert animation.advance(1250)
+    assert animation.current() == "c"
+    assert animation.finished
+    # Long after the end it stays put and reports no change
+    assert not animation.advance(99_000)
+    assert animation.current() == "c"
+
+
+def test_empty_animation_has_no_frame():
+    animation = FrameAnimation((), interval=0, loop=True, started_at=0)
+
+    assert animation.current() is None
+    assert not animation.advance(500)
+
+
+class Client:
+    def __init__(self, changes):
+        self.changes = changes
+        self.updates = 0
+
+    def advance(self, now):
+        return self.changes
+
+    def update(self):
+        self.updates += 1
+
+
+def test_clock_only_updates_clients_whose_frame_changed(qapp):
+    clock = AnimationClock()
+    moving, still = Client(True), Client(False)
+    clock.register(moving)
+    clock.register(still)
+    assert clock.timer.isActive()
+
+    clock.tick()
+    assert (moving.updates, still.updates) == (1, 0)
+
+    clock.unregister(moving)
+    clock.unregister(still)
+    assert len(clock) == 0
+    assert not clock.timer.isActive()
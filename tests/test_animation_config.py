@@ -0,0 +1,55 @@
+import pytest
+
+from pet.animation_config import (
+    ANIMATION_CONFIGS,
+    ANIMATIONS,
+    compile_animation,
+    compile_animations,
+)
+
+
+def test_every_config_compiles_to_a_frame_table():
+    assert ANIMATIONS.keys() == ANIMATION_CONFIGS.keys()
+    for species, configs in ANIMATION_CONFIGS.items():
+        assert ANIMATIONS[species].keys() == configs.keys()
+
+    sitting = ANIMATIONS["cat"]["sitting"]
+    assert sitting.frames == tuple((0, col) for col in range(6))
+    assert sitting.rects[1] == (64, 0, 64, 64)
+    assert (sitting.loop, sitting.interval) == (False, 350)
+
+
+def test_multi_row_animation_runs_through_each_row_in_order():
+    running = ANIMATIONS["cat"]["running"]
+
+    assert len(running.frames) == 6 + 12
+    assert running.frames[5] == (5, 5)
+    assert running.frames[6] == (6, 0)
+    assert running.rects[6] == (0, 384, 64, 64)
+    assert running.loop is True
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        (0, 0, 17, True, 100),  # past the last column
+        (19, 0, 4, True, 100),  # past the last row
+        (0, 4, 4, True, 100),  # no frames
+        (0, 0, 4, True, 0),  # no interval
+        (0, 0, 4, "yes", 100),
+        ((0, 0, 4), (1, 0), True, 100),
+        (0, 0, 4),
+    ],
+)
+def test_bad_configs_are_rejected(config):
+    with pytest.raises(ValueError, match="'idle'"):
+        compile_animation("idle", config)
+
+
+def test_sheet_size_is_configurable():
+    configs = {"dog": {"idle": (1, 0, 4, True, 100)}}
+
+    tables = compile_animations(configs, columns=4, frame_width=32, frame_height=48)
+    assert tables["dog"]["idle"].rects[-1] == (96, 48, 32, 48)
+    with pytest.raises(ValueError):
+        compile_animations(configs, columns=3)
@@ -0,0 +1,71 @@
+from pet.animation_config import ANIMATIONS
+from pet.atlas import AtlasIndex, animation_signature, grid_layout
+
+
+def test_grid_layout_fills_pages_and_trims_the_last():
+    positions, pages = grid_layout(7, 64, 64, max_size=192)
+
+    assert positions[:4] == [(0, 0, 0), (0, 64, 0), (0, 128, 0), (0, 0, 64)]
+    assert positions[-1] == (0, 0, 128)
+    assert pages == [(192, 192)]
+
+    positions, pages = grid_layout(11, 64, 64, max_size=192)
+    assert positions[9] == (1, 0, 0)
+    assert pages == [(192, 192), (128, 64)]
+    assert grid_layout(0) == ([], [])
+
+
+def make_index():
+    return AtlasIndex(
+        "cat",
+        animation_signature(ANIMATIONS["cat"]),
+        ["cat-0.png"],
+        [(0, 0, 0), (0, 64, 0)],
+        {
+            "AllCats": {
+                "mtime_ns": 5,
+                "animations": {"laying": [1], "dancing": [0, 1, 0]},
+            },
+        },
+    )
+
+
+def test_index_round_trip(tmp_path):
+    path = tmp_path / "atlas.json"
+    make_index().save(path)
+    index = AtlasIndex.load(path)
+
+    assert "AllCats" in index and "AllCatsGrey" not in index
+    assert index.frames_for("AllCats", "dancing") == [(0, 0, 0), (0, 64, 0), (0, 0, 0)]
+    assert index.frames_for("AllCats", "sitting") == []
+    assert index.frame_size == (64, 64)
+
+
+def test_index_goes_stale_with_sheets_or_tables():
+    index = make_index()
+    signature = animation_signature(ANIMATIONS["cat"])
+
+    assert index.is_fresh({"AllCats": 5}, signature)
+    assert not index.is_fresh({"AllCats": 6}, signature)
+    assert not index.is_fresh({"AllCats": 5, "AllCatsGrey": 5}, signature)
+    assert not index.is_fresh({"AllCats": 5}, animation_signature({}))
+
+
+def test_sheets_that_failed_to_load_keep_the_index_fresh(tmp_path):
+    index = make_index()
+    index.failed = {"AllCatsGrey": 9}
+    index.save(tmp_path / "atlas.json")
+    index = AtlasIndex.load(tmp_path / "atlas.json")
+    signature = animation_signature(ANIMATIONS["cat"])
+
+    assert "AllCatsGrey" not in index
+    assert index.is_fresh({"AllCats": 5, "AllCatsGrey": 9}, signature)
+    # Fixing the sheet changes its mtime and calls for a rebuild
+    assert not index.is_fresh({"AllCats": 5, "AllCatsGrey": 10}, signature)
+
+
+def test_unreadable_index_is_ignored(tmp_path):
+    path = tmp_path / "atlas.json"
+    assert AtlasIndex.load(path) is None
+    path.write_text('{"version": 1')
+    assert AtlasIndex.load(path) is None
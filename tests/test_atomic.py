@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+from pet.atomic import atomic_write
+
+
+def test_failed_write_leaves_the_old_file(tmp_path: Path):
+    path = tmp_path / "pets.json"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("half of the new")
+            raise RuntimeError("crash")
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["pets.json"]
+
+    with atomic_write(path, "wb") as f:
+        f.write(b"new")
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["pets.json"]
@@ -1,5 +1,11 @@
 from pet.pet import VirtualPet
-from pet.interactions import process_interaction
+from pet.interactions import (
+    RULE_TABLE,
+    match_interaction,
+    process_interaction,
+    resolve_interaction,
+    rules_for,
+)
 
 
 def make_cat(name: str, personality: str) -> VirtualPet:
@@ -15,8 +21,8 @@ def test_affectionate_increases_happiness_and_relationship():
     assert "cuddled" in msg
     assert a.happiness > 50
     assert b.happiness > 50
-    assert a.relationships["B"] > 0
-    assert b.relationships["A"] > 0
+    assert a.relationships[b.id] > 0
+    assert b.relationships[a.id] > 0
 
 
 def test_playful_vs_shy_decreases_happiness():
@@ -38,4 +44,33 @@ def test_non_cat_species_returns_empty_message():
 
     assert msg == ""
     # make sure we did not accidentally create relationship entries
-    assert dog.name not in cat.relationships
+    assert dog.id not in cat.relationships
+
+
+def test_roles_follow_personality_not_argument_order():
+    playful = make_cat("Playful", "playful")
+    shy = make_cat("Shy", "shy")
+
+    outcome = resolve_interaction(shy, playful)
+
+    assert outcome.rule.name == "shy_away"
+    assert (outcome.first, outcome.second) == (playful, shy)
+    assert (playful.state, shy.state) == ("playing", "idle")
+    assert playful.relationships[shy.id] == 0
+
+
+def test_every_personality_pair_has_a_fallback():
+    for candidates in RULE_TABLE.values():
+        assert candidates[-1][0].chance == 1.0
+    assert rules_for("grumpy", "lazy")[-1][0].name == "ignore"
+
+
+def test_matching_does_not_touch_the_pets():
+    a = make_cat("A", "affectionate")
+    b = make_cat("B", "curious")
+
+    outcome = match_interaction(a, b)
+
+    assert outcome.rule.name == "cuddle"
+    assert (a.happiness, b.happiness) == (50, 50)
+    assert a.relationships == {}
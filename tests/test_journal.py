@@ -0,0 +1,159 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pet.journal as journal_module
+from pet.journal import PetJournal
+from pet.pet import VirtualPet
+from pet.persistence import pet_from_dict, snapshot_pets
+from pet.simulation import PetSimulation
+
+
+def make_pets():
+    return [
+        VirtualPet("Mochi", "cat", "affectionate", "AllCats", pet_id="mochi"),
+        VirtualPet("Kumo", "cat", "lazy", "AllCatsGrey", pet_id="kumo"),
+    ]
+
+
+def reload(pets):
+    """What the app sees on the next start: the last snapshot, freshly loaded."""
+    return PetSimulation([pet_from_dict(pd) for pd in snapshot_pets(pets, now=100.0)])
+
+
+def test_replay_restores_changes_after_the_snapshot(tmp_path: Path, monkeypatch):
+    times = iter(range(200, 300))
+    monkeypatch.setattr(journal_module.time, "time", lambda: next(times))
+    pets = make_pets()
+    sim = reload(pets)
+
+    journal = PetJournal(str(tmp_path / "pets.journal"))
+    journal.start()
+    mochi, kumo = pets
+    mochi.hunger = 10
+    mochi.state = "eating"
+    journal.pets_changed([mochi], "feed")
+    journal.pet_removed(kumo)
+    newcomer = VirtualPet("Tofu", "cat", "curious", "AllCatsWhite", pet_id="tofu")
+    journal.pet_added(newcomer)
+    journal.append("relationship", id="mochi", other="tofu", score=40, cause="cuddle")
+    journal.close()
+
+    recovered = PetJournal(str(tmp_path / "pets.journal")).replay(sim)
+
+    assert [pet.id for pet in sim.pets] == ["mochi", "tofu"]
+    restored = sim.pets[0]
+    assert restored.hunger == 10
+    assert restored.state == "eating"
+    assert restored.relationships == {"tofu": 40}
+    # Catch-up decay resumes from the last logged change
+    assert restored.last_seen == 200
+    assert {pet.id for pet in recovered} == {"mochi", "tofu"}
+
+
+def test_replay_skips_events_already_in_the_snapshot(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(journal_module.time, "time", lambda: 50.0)
+    pets = make_pets()
+    journal = PetJournal(str(tmp_path / "pets.journal"))
+    journal.start()
+    pets[0].hunger = 10
+    journal.pets_changed([pets[0]], "feed")
+    journal.pet_added(VirtualPet("Tofu", "cat", "curious", "AllCats", pet_id="tofu"))
+    journal.close()
+
+    pets[0].hunger = 70  # changed again before the snapshot at t=100
+    sim = reload(pets)
+
+    assert PetJournal(str(tmp_path / "pets.journal")).replay(sim) == []
+    assert sim.pets[0].hunger == 70
+    assert len(sim.pets) == 2
+
+
+def test_torn_last_line_is_skipped(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(journal_module.time, "time", lambda: 200.0)
+    path = tmp_path / "pets.journal"
+    pets = make_pets()
+    journal = PetJournal(str(path))
+    journal.start()
+    pets[0].hunger = 10
+    journal.pets_changed([pets[0]], "feed")
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"t": 201, "kind": "upd')
+
+    sim = reload(make_pets())
+    PetJournal(str(path)).replay(sim)
+
+    assert sim.pets[0].hunger == 10
+
+
+def test_records_before_start_are_ignored(tmp_path: Path):
+    journal = PetJournal(str(tmp_path / "pets.journal"))
+    journal.pets_changed(make_pets(), "feed")
+
+    assert not journal.has_events()
+
+
+def test_rotation_waits_for_the_snapshot(tmp_path: Path):
+    journal = PetJournal(str(tmp_path / "pets.journal"))
+    journal.start()
+    journal.pets_changed(make_pets(), "feed")
+
+    assert journal.rotate()
+    assert journal.bytes_written == 0
+    # The rotated journal isn't covered by a snapshot yet
+    journal.pets_changed(make_pets(), "play")
+    assert not journal.rotate()
+
+    journal.discard_rotated()
+    assert journal.rotate()
+    journal.discard_rotated()
+    journal.close()
+    assert not journal.has_events()
+    assert not os.path.exists(journal.path)
+
+
+def test_writes_are_fsynced_in_batches(tmp_path: Path, monkeypatch):
+    syncs = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(
+        journal_module.os, "fsync", lambda fd: syncs.append(fd) or real_fsync(fd)
+    )
+    journal = PetJournal(str(tmp_path / "pets.journal"), sync_interval=60)
+    journal.start()
+    for _ in range(100):
+        journal.pets_changed(make_pets(), "interaction")
+    journal.close()
+
+    assert len(syncs) == 1
+    assert len(list(PetJournal(journal.path).events())) == 200
+
+
+def test_appends_do_not_wait_for_fsync(tmp_path: Path, monkeypatch):
+    in_fsync = threading.Event()
+    release = threading.Event()
+    real_fsync = os.fsync
+
+    def slow_fsync(fd):
+        in_fsync.set()
+        release.wait(5)
+        real_fsync(fd)
+
+    monkeypatch.setattr(journal_module.os, "fsync", slow_fsync)
+    journal = PetJournal(str(tmp_path / "pets.journal"), sync_interval=60)
+    journal.start()
+    journal.pets_changed(make_pets(), "feed")
+    syncing = threading.Thread(target=journal.sync)
+    syncing.start()
+    assert in_fsync.wait(5)
+
+    # The sync thread is stuck in fsync; appending still returns right away
+    started = time.monotonic()
+    journal.pets_changed(make_pets(), "play")
+    assert time.monotonic() - started < 1
+
+    release.set()
+    syncing.join()
+    journal.close()
+    assert len(list(PetJournal(journal.path).events())) == 4
@@ -1,5 +1,8 @@
+import json
 from pathlib import Path
 
+import pytest
+
 from pet.pet import VirtualPet
 import pet.persistence as persistence
 
@@ -42,3 +45,191 @@ def test_save_and_load_pets_round_trip(tmp_path: Path, monkeypatch):
         assert loaded_cat.hunger == original_cat.hunger
         assert loaded_cat.happiness == original_cat.happiness
         assert loaded_cat.energy == original_cat.energy
+
+
+def test_save_pets_replaces_file_atomically(tmp_path: Path, monkeypatch):
+    temp_file = tmp_path / "pets.json"
+    monkeypatch.setattr(persistence, "DATA_PATH", str(temp_file))
+    temp_file.write_text("not json")
+
+    persistence.save_pets([VirtualPet("Mochi", "cat", "lazy", "AllCats")])
+
+    assert [p.name for p in persistence.load_pets()] == ["Mochi"]
+    # No temp files are left behind next to pets.json
+    assert [p.name for p in tmp_path.iterdir()] == ["pets.json"]
+
+
+def test_saved_pets_remember_when_they_were_last_seen(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+
+    persistence.save_pets([VirtualPet("Mochi", "cat", "lazy", "AllCats")])
+    (loaded,) = persistence.load_pets()
+
+    assert loaded.last_seen is not None
+
+
+def test_pet_saver_coalesces_dirty_notifications():
+    writes = []
+    saver = persistence.PetSaver(delay=60, write=writes.append)
+    cat = VirtualPet("Mochi", "cat", "lazy", "AllCats")
+
+    for hunger in (10, 20, 30):
+        cat.hunger = hunger
+        saver.mark_dirty([cat])
+    saver.close()
+
+    assert len(writes) == 1
+    assert writes[0][0]["hunger"] == 30
+
+
+def test_pet_saver_snapshots_once_per_window(monkeypatch):
+    snapshots = []
+    real_snapshot = persistence.snapshot_pets
+    monkeypatch.setattr(
+        persistence,
+        "snapshot_pets",
+        lambda pets: snapshots.append(len(pets)) or real_snapshot(pets),
+    )
+    writes = []
+    windows = []
+    saver = persistence.PetSaver(delay=60, write=writes.append, schedule=windows.append)
+    cat = VirtualPet("Mochi", "cat", "lazy", "AllCats", hunger=10)
+
+    for hunger in (10, 20, 30):
+        cat.hunger = hunger
+        saver.mark_dirty([cat])
+    # Marking dirty only opens the window; nothing is serialized yet
+    assert windows == [60]
+    assert snapshots == []
+
+    saver.commit()  # the window ends
+    cat.hunger = 99
+    saver.flush()
+    assert snapshots == [1]
+    assert writes[0][0]["hunger"] == 30
+
+    saver.mark_dirty([cat])
+    assert windows == [60, 60]
+    saver.close()
+    assert writes[-1][0]["hunger"] == 99
+
+
+def test_pet_saver_survives_a_failing_write():
+    writes = []
+
+    def write(data):
+        if not writes:
+            writes.append(None)
+            raise ValueError("boom")
+        writes.append(data)
+
+    saver = persistence.PetSaver(delay=0, write=write)
+    cat = VirtualPet("Mochi", "cat", "lazy", "AllCats", hunger=10)
+
+    saver.mark_dirty([cat])
+    saver.flush()
+    cat.hunger = 20
+    saver.mark_dirty([cat])
+    saver.flush()
+    saver.close()
+
+    assert writes[-1][0]["hunger"] == 20
+
+
+def test_marking_a_closed_saver_dirty_is_ignored():
+    writes = []
+    saver = persistence.PetSaver(delay=0, write=writes.append)
+    saver.close()
+
+    saver.mark_dirty(make_household(1))
+
+    assert writes == []
+
+
+def make_household(n):
+    return [
+        VirtualPet(f"Cat{i}", "cat", "lazy", "AllCats", hunger=i % 100)
+        for i in range(n)
+    ]
+
+
+def test_streaming_parser_matches_json_load(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(persistence, "READ_CHUNK", 64)
+    data = [pet.to_dict() for pet in make_household(30)]
+    array_file = tmp_path / "pets.json"
+    array_file.write_text(json.dumps(data, indent=4))
+    lines_file = tmp_path / "pets.jsonl"
+    lines_file.write_text("\n".join(json.dumps(pd) for pd in data))
+
+    for path in (array_file, lines_file):
+        with open(path) as f:
+            parsed = [pd for _, _, pd in persistence.iter_pet_dicts(f)]
+        assert parsed == data
+
+    # A corrupt line only costs that one record
+    lines = lines_file.read_text().split("\n")
+    lines[10] = '{"name": "Cat10", "hunger": }'
+    lines_file.write_text("\n".join(lines))
+    errors = []
+    with open(lines_file) as f:
+        parsed = [pd for _, _, pd in persistence.iter_pet_dicts(f, errors)]
+    assert parsed == data[:10] + data[11:]
+    assert [e.index for e in errors] == [10]
+
+
+@pytest.mark.parametrize("indent", [4, None], ids=["array", "lines"])
+def test_corrupt_records_are_skipped_and_reported(tmp_path: Path, monkeypatch, indent):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+    monkeypatch.setattr(persistence, "READ_CHUNK", 100)
+    data = [pet.to_dict() for pet in make_household(5)]
+    if indent is None:
+        text = "\n".join(json.dumps(pd) for pd in data)
+    else:
+        text = json.dumps(data, indent=indent)
+    # Break the second record and drop a required field from the fourth
+    text = text.replace('"Cat1",', '"Cat1" oops', 1)
+    text = text.replace('"name": "Cat3",', "", 1)
+    (tmp_path / "pets.json").write_text(text)
+
+    errors = []
+    loaded = persistence.load_pets(errors)
+
+    assert [p.name for p in loaded] == ["Cat0", "Cat2", "Cat4"]
+    assert [e.index for e in errors] == [1, 3]
+    assert (tmp_path / "pets.json.corrupt").read_text() == text
+
+
+def test_truncated_file_keeps_the_complete_records(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+    text = json.dumps([pet.to_dict() for pet in make_household(3)], indent=4)
+    (tmp_path / "pets.json").write_text(text[: len(text) - 40])
+
+    errors = []
+    loaded = persistence.load_pets(errors)
+
+    assert [p.name for p in loaded] == ["Cat0", "Cat1"]
+    assert len(errors) == 1
+
+
+def test_paused_saver_holds_writes_until_resumed():
+    writes = []
+    saver = persistence.PetSaver(delay=0, write=writes.append, paused=True)
+
+    saver.mark_dirty(make_household(1))
+    saver.flush()
+    assert writes == []
+
+    saver.resume()
+    saver.flush()
+    assert len(writes) == 1
+    saver.close()
+
+
+def test_closing_a_paused_saver_discards_the_partial_snapshot():
+    writes = []
+    saver = persistence.PetSaver(delay=0, write=writes.append, paused=True)
+
+    saver.mark_dirty(make_household(1))
+    saver.close()
+
+    assert writes == []
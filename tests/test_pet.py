@@ -34,3 +34,19 @@ def test_mood_logic(hunger, energy, happiness, expected):
     )
 
     assert cat.mood() == expected
+
+
+def test_pets_have_no_instance_dict():
+    pet = VirtualPet("Mochi", "cat", "lazy", "AllCats")
+
+    assert not hasattr(pet, "__dict__")
+    with pytest.raises(AttributeError):
+        pet.nickname = "Mo"
+
+
+def test_text_fields_are_interned():
+    a = VirtualPet("A", "".join(["c", "at"]), "".join(["la", "zy"]), "AllCats")
+    b = VirtualPet("B", "cat", "lazy", "AllCats")
+
+    assert a.species is b.species
+    assert a.personality is b.personality
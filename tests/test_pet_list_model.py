@@ -0,0 +1,59 @@
+from pet.pet import VirtualPet
+from ui.pet_list_model import PetListModel
+
+
+def make_pets(count):
+    return [VirtualPet(f"Cat{i}", "cat", "shy", "AllCats") for i in range(count)]
+
+
+def rows_shown(model):
+    return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+
+def test_sync_after_remove_and_add_in_one_turn(qapp):
+    pets = make_pets(4)
+    model = PetListModel(pets)
+    model.sync(version=1)
+
+    # Same count as before, but one pet left and another arrived
+    del pets[1]
+    pets.append(VirtualPet("Newcomer", "cat", "lazy", "AllCats"))
+    model.sync(version=2)
+
+    assert model.rowCount() == 4
+    assert [model.pet_at(row).name for row in range(4)] == [
+        "Cat0",
+        "Cat2",
+        "Cat3",
+        "Newcomer",
+    ]
+    assert [model.row_of(pet) for pet in pets] == [0, 1, 2, 3]
+    assert rows_shown(model)[3].startswith("Newcomer")
+
+
+def test_sync_skips_the_check_while_the_version_is_unchanged(qapp):
+    pets = make_pets(2)
+    model = PetListModel(pets)
+    model.sync(version=1)
+    pets.append(VirtualPet("Late", "cat", "lazy", "AllCats"))
+
+    model.sync(version=1)
+    assert model.rowCount() == 2
+    model.sync(version=2)
+    assert model.rowCount() == 3
+
+
+def test_pets_changed_signals_each_run_of_rows(qapp):
+    pets = make_pets(12)
+    model = PetListModel(pets)
+    signals = []
+    model.dataChanged.connect(
+        lambda first, last, roles: signals.append((first.row(), last.row()))
+    )
+
+    model.pets_changed([pets[i] for i in (10, 0, 5, 9, 1)])
+    assert signals == [(0, 1), (5, 5), (9, 10)]
+
+    signals.clear()
+    model.pets_changed()
+    assert signals == [(0, 11)]
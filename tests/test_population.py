@@ -0,0 +1,110 @@
+import random
+
+import numpy as np
+import pytest
+
+from pet.pet import VirtualPet
+from pet.population import PetPopulation
+
+
+def decay_loop(pets):
+    """The original per-pet decay from MainWindow.auto_decay_stats."""
+    for pet in pets:
+        pet.adjust_stat("hunger", +2)
+        pet.adjust_stat("happiness", -2)
+        pet.adjust_stat("energy", -1)
+        if pet.energy < 20:
+            pet.state = "sleeping"
+        elif pet.hunger > 80:
+            pet.state = "collapsed"
+        elif pet.happiness < 30 and pet.state not in ("sleeping", "collapsed"):
+            pet.state = "idle"
+
+
+def random_pets(n, seed=0):
+    rng = random.Random(seed)
+    states = ["idle", "sleeping", "playing", "collapsed", "walking"]
+    return [
+        VirtualPet(
+            f"Cat{i}",
+            "cat",
+            "lazy",
+            "AllCats",
+            hunger=rng.randint(0, 100),
+            happiness=rng.randint(0, 100),
+            energy=rng.randint(0, 100),
+            state=rng.choice(states),
+            pet_id=f"cat{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def test_decay_matches_per_pet_loop():
+    expected = random_pets(500)
+    bound = random_pets(500)
+    population = PetPopulation(bound)
+
+    for _ in range(30):
+        decay_loop(expected)
+        population.decay()
+
+    assert [p.to_dict() for p in bound] == [p.to_dict() for p in expected]
+
+
+def test_bound_pet_reads_and_writes_arrays():
+    cat = VirtualPet("Mochi", "cat", "lazy", "AllCats", hunger=40)
+    population = PetPopulation([cat])
+
+    cat.feed()
+    cat.state = "praying"
+
+    assert population.hunger[0] == 30
+    assert population.get("state", 0) == "praying"
+    # Nothing is kept on the pet itself while it is bound
+    assert cat._local is None
+
+
+def test_remove_keeps_values_and_compacts_slots():
+    pets = random_pets(3)
+    population = PetPopulation(pets)
+    first = pets[0]
+    hunger = first.hunger
+
+    population.remove(first)
+    assert first._local is not None
+    first.hunger = hunger + 1
+
+    assert len(population) == 2
+    assert first.hunger == hunger + 1
+    assert [p._slot for p in population.pets] == [0, 1]
+    assert population.hunger[0] == pets[2].hunger
+
+
+def test_add_grows_capacity():
+    population = PetPopulation(capacity=1)
+    pets = random_pets(40)
+    for pet in pets:
+        population.add(pet)
+
+    assert [population.hunger[p._slot] for p in pets] == [p.hunger for p in pets]
+
+
+def test_pet_cannot_join_two_populations():
+    cat = VirtualPet("Mochi", "cat", "lazy", "AllCats")
+    PetPopulation([cat])
+
+    with pytest.raises(ValueError):
+        PetPopulation([cat])
+
+
+def test_species_and_personality_are_stored_as_codes():
+    cat = VirtualPet("Mochi", "cat", "lazy", "AllCats")
+    population = PetPopulation([cat])
+
+    cat.personality = "grumpy"
+
+    assert population.personality.dtype == np.int8
+    assert population.names["personality"][population.personality[0]] == "grumpy"
+    assert cat.to_dict()["personality"] == "grumpy"
+    assert cat.species == "cat"
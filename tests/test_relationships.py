@@ -0,0 +1,83 @@
+from pet.pet import VirtualPet
+from pet.persistence import migrate_relationship_keys
+from pet.relationships import RelationshipGraph
+from pet.simulation import PetSimulation
+
+
+def make_pets(n):
+    return [
+        VirtualPet(f"Cat{i}", "cat", "lazy", "AllCats", pet_id=f"cat{i}")
+        for i in range(n)
+    ]
+
+
+def test_removing_a_pet_drops_edges_both_ways():
+    pets = make_pets(3)
+    sim = PetSimulation(pets)
+    a, b, c = pets
+    a.relationships[b.id] = 10
+    b.relationships[a.id] = 20
+    c.relationships[b.id] = 30
+
+    sim.remove_pet(b)
+
+    assert b.id not in a.relationships
+    assert b.id not in c.relationships
+    assert b.relationships == {a.id: 20}
+    assert b.id not in sim.relationships
+
+
+def test_edge_targets_only_become_pets_when_added():
+    graph = RelationshipGraph()
+    graph.add_node("a", {"b": 5, "gone": 3})
+
+    # "b" loads later; "gone" was deleted and never shows up
+    assert "b" not in graph and "gone" not in graph
+    assert len(graph) == 1
+
+    graph.add_node("b", {"a": 7})
+    assert len(graph) == 2
+    assert graph.get("a", "b") == 5
+
+    graph.remove_node("b")
+    assert graph.top_friends("a") == [("gone", 3)]
+
+
+def test_top_friends_are_best_first():
+    graph = RelationshipGraph()
+    for i, score in enumerate([5, 40, 15, 90, 1]):
+        graph.set("me", f"cat{i}", score)
+
+    assert graph.top_friends("me", 2) == [("cat3", 90), ("cat1", 40)]
+
+
+def test_edges_write_through():
+    pets = make_pets(2)
+    sim = PetSimulation(pets)
+    a, b = pets
+
+    a.relationships[b.id] = 95
+    sim.relationships.set(a.id, b.id, 100)
+
+    assert a.relationships[b.id] == 100
+    assert sim.relationships.get(a.id, b.id) == 100
+    assert a.to_dict()["relationships"] == {b.id: 100}
+
+
+def test_renaming_a_pet_keeps_its_friends():
+    a, b = make_pets(2)
+    a.relationships[b.id] = 12
+    b.name = "Renamed"
+
+    PetSimulation([a, b])
+
+    assert a.relationships == {b.id: 12}
+
+
+def test_name_keyed_relationships_are_migrated():
+    a, b = make_pets(2)
+    a.relationships = {"Cat1": 12, "Gone": 3}
+
+    migrate_relationship_keys([a, b])
+
+    assert a.relationships == {b.id: 12}
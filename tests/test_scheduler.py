@@ -0,0 +1,78 @@
+import random
+from collections import Counter
+
+from pet.pet import VirtualPet
+from pet.scheduler import MAX_PAIRS_PER_TICK, AliasTable, InteractionScheduler
+
+
+def make_pets(personalities):
+    return [
+        VirtualPet(f"Cat{i}", "cat", personality, "AllCats", pet_id=f"cat{i}")
+        for i, personality in enumerate(personalities)
+    ]
+
+
+def test_alias_table_matches_weights():
+    weights = [1, 2, 3, 4]
+    table = AliasTable(weights)
+    rng = random.Random(0)
+
+    counts = Counter(table.sample(rng) for _ in range(40000))
+
+    for i, weight in enumerate(weights):
+        assert abs(counts[i] / 40000 - weight / 10) < 0.01
+
+
+def test_each_pet_is_in_at_most_one_pair():
+    pets = make_pets(["playful", "affectionate", "curious", "lazy", "shy"] * 20)
+    scheduler = InteractionScheduler(random.Random(1), max_pairs=50)
+
+    pairs = scheduler.pick_pairs(pets)
+    paired = [pet for pair in pairs for pet in pair]
+
+    assert len(pairs) == 25
+    assert len(paired) == len(set(paired))
+
+
+def test_pairs_per_tick_are_capped():
+    pets = make_pets(["playful", "affectionate"] * 500)
+    scheduler = InteractionScheduler(random.Random(4))
+
+    assert len(scheduler.pick_pairs(pets)) == MAX_PAIRS_PER_TICK
+
+
+def test_table_is_reused_until_the_version_changes():
+    pets = make_pets(["lazy"] * 10)
+    scheduler = InteractionScheduler(random.Random(5))
+
+    scheduler.pick_pairs(pets, version=1)
+    table = scheduler._table
+    scheduler.pick_pairs(pets, version=1)
+    assert scheduler._table is table
+
+    pets[0].personality = "playful"
+    scheduler.pick_pairs(pets, version=2)
+    assert scheduler._table is not table
+    assert scheduler._table.prob != table.prob
+
+
+def test_friends_are_picked_more_often():
+    pets = make_pets(["curious"] * 20)
+    best, friend = pets[0], pets[1]
+    best.relationships[friend.id] = 100
+    scheduler = InteractionScheduler(random.Random(2))
+
+    together = 0
+    for _ in range(500):
+        pairs = scheduler.pick_pairs(pets)
+        together += any({best, friend} == set(pair) for pair in pairs)
+
+    # Without the friendship they would meet roughly 1 tick in 38 (about 13)
+    assert together > 60
+
+
+def test_small_households():
+    scheduler = InteractionScheduler(random.Random(3))
+
+    assert scheduler.pick_pairs(make_pets(["lazy"])) == []
+    assert len(scheduler.pick_pairs(make_pets(["lazy", "lazy"]))) == 1
@@ -0,0 +1,80 @@
+from pet.pet import VirtualPet
+from pet.search import PetSearchIndex
+
+
+def make_pets():
+    return [
+        VirtualPet("Mochi", "cat", "affectionate", "AllCats", pet_id="mochi"),
+        VirtualPet("Kumo", "cat", "shy", "AllCatsGrey", hunger=90, pet_id="kumo"),
+        VirtualPet("Momo", "cat", "lazy", "AllCatsBlack", energy=10, pet_id="momo"),
+    ]
+
+
+def matching(index, pets, text):
+    query = index.query(text)
+    return {pet.id for pet in pets if query is None or query.matches(pet)}
+
+
+def test_free_text_matches_substrings_of_any_field():
+    pets = make_pets()
+    index = PetSearchIndex(pets)
+
+    assert matching(index, pets, "mo") == {"mochi", "kumo", "momo"}
+    assert matching(index, pets, "mom") == {"momo"}
+    assert matching(index, pets, "och") == {"mochi"}
+    assert matching(index, pets, "MOCHI") == {"mochi"}
+    assert matching(index, pets, "laz") == {"momo"}
+    assert matching(index, pets, "cat") == {"mochi", "kumo", "momo"}
+    assert matching(index, pets, "mochy") == set()
+    # Both trigrams of "omom" occur in "momo", but not in that order
+    assert matching(index, pets, "omom") == set()
+
+
+def test_empty_query_filters_nothing():
+    index = PetSearchIndex(make_pets())
+
+    assert index.query("") is None
+    assert index.query("   ") is None
+
+
+def test_structured_filters_and_status_words():
+    pets = make_pets()
+    index = PetSearchIndex(pets)
+
+    assert matching(index, pets, "personality:shy") == {"kumo"}
+    assert matching(index, pets, "personality:aff") == {"mochi"}
+    assert matching(index, pets, "name:mo") == {"mochi", "kumo", "momo"}
+    # "cat" is in every species, but not in any name
+    assert matching(index, pets, "name:cat") == set()
+    assert matching(index, pets, "hungry") == {"kumo"}
+    assert matching(index, pets, "tired") == {"momo"}
+    assert matching(index, pets, "mo tired") == {"momo"}
+
+
+def test_status_filters_follow_live_stats():
+    pets = make_pets()
+    query = PetSearchIndex(pets).query("hungry")
+
+    pets[0].hunger = 95
+    pets[1].hunger = 10
+
+    assert {pet.id for pet in pets if query.matches(pet)} == {"mochi"}
+
+
+def test_index_follows_edits_and_removals():
+    pets = make_pets()
+    index = PetSearchIndex(pets)
+    mochi = pets[0]
+
+    mochi.name = "Biscuit"
+    mochi.personality = "playful"
+    index.update(mochi)
+    assert matching(index, pets, "mochi") == set()
+    assert matching(index, pets, "bisc") == {"mochi"}
+    assert matching(index, pets, "personality:affectionate") == set()
+
+    index.remove(pets[2])
+    index.remove(pets[2])
+    assert len(index) == 2
+    assert index._grams.get("mom") is None
+    assert matching(index, pets[:2], "mo") == {"kumo"}
@@ -0,0 +1,182 @@
+import random
+
+from pet.pet import VirtualPet
+from pet.simulation import PetSimulation
+
+
+def make_household(n=20, seed=1):
+    rng = random.Random(seed)
+    personalities = ["affectionate", "playful", "lazy", "curious", "shy"]
+    return [
+        VirtualPet(
+            f"Cat{i}", "cat", rng.choice(personalities), "AllCats", pet_id=f"cat{i}"
+        )
+        for i in range(n)
+    ]
+
+
+def test_same_seed_gives_same_run():
+    a = PetSimulation(make_household(), seed=42)
+    b = PetSimulation(make_household(), seed=42)
+
+    a.fast_forward(90)
+    b.fast_forward(90)
+
+    assert [p.to_dict() for p in a.pets] == [p.to_dict() for p in b.pets]
+
+
+def test_events_fire_on_schedule():
+    sim = PetSimulation(make_household(), seed=0)
+    kinds = []
+    sim.subscribe(lambda event: kinds.append(event.kind))
+
+    sim.fast_forward(10)
+
+    # 600 s: an interaction every 10 s, decay every 60 s, rotation every 30 s
+    assert kinds.count("interaction") == 60
+    assert kinds.count("decay") == 10
+    assert kinds.count("rotate_animations") == 20
+    assert sim.time == 600
+
+
+def test_advance_in_small_steps_matches_one_big_step():
+    a = PetSimulation(make_household(), seed=7)
+    b = PetSimulation(make_household(), seed=7)
+
+    for _ in range(840):
+        a.advance(0.25)
+    b.advance(210)
+
+    assert [p.to_dict() for p in a.pets] == [p.to_dict() for p in b.pets]
+
+
+def test_interaction_event_carries_message_and_pets():
+    sim = PetSimulation(make_household(2), seed=3)
+    events = []
+    sim.subscribe(events.append)
+
+    sim.advance(10)
+
+    (event,) = events
+    assert event.kind == "interaction"
+    assert set(event.pets) == set(sim.pets)
+    assert event.message
+
+
+def test_decay_reports_pets_whose_state_changed():
+    tired = VirtualPet("Tired", "cat", "lazy", "AllCats", energy=20)
+    fine = VirtualPet("Fine", "cat", "lazy", "AllCats", energy=80)
+    sim = PetSimulation([tired, fine])
+
+    event = sim.decay()
+
+    assert event.pets == (tired,)
+    assert tired.state == "sleeping"
+
+
+def test_long_fast_forward_stays_in_bounds():
+    sim = PetSimulation(make_household(200), seed=5)
+
+    sim.fast_forward(24 * 60)
+
+    for pet in sim.pets:
+        assert 0 <= pet.hunger <= 100
+        assert 0 <= pet.happiness <= 100
+        assert 0 <= pet.energy <= 100
+
+
+def test_skip_applies_missed_decay_without_replaying_ticks():
+    skipped = make_household(30, seed=4)
+    replayed = make_household(30, seed=4)
+    sim = PetSimulation(skipped, seed=1)
+    kinds = []
+    sim.subscribe(lambda event: kinds.append(event.kind))
+
+    sim.skip(605)
+    reference = PetSimulation(replayed)
+    for _ in range(10):
+        reference.decay()
+
+    assert kinds == ["decay"]
+    assert [p.to_dict() for p in skipped] == [p.to_dict() for p in replayed]
+    assert sim.time == 605
+    # The schedule carries on from where the gap ended
+    sim.advance(5)
+    assert kinds[1:] == ["interaction"]
+
+
+def test_catch_up_matches_replaying_decay_ticks():
+    replayed = make_household(50, seed=9)
+    caught_up = make_household(50, seed=9)
+    for i, (a, b) in enumerate(zip(replayed, caught_up)):
+        a.energy = b.energy = 20 + i
+        a.hunger = b.hunger = 30 + i
+        b.last_seen = 1000.0
+
+    sim = PetSimulation(replayed)
+    for _ in range(37):
+        sim.decay()
+    PetSimulation(caught_up).catch_up(1000.0 + 37 * 60 + 59)
+
+    assert [p.to_dict() for p in caught_up] == [
+        dict(p.to_dict(), last_seen=1000.0 + 37 * 60 + 59) for p in replayed
+    ]
+
+
+def test_catch_up_handles_weeks_and_missing_timestamps():
+    away = VirtualPet("Away", "cat", "lazy", "AllCats", last_seen=0.0)
+    new = VirtualPet("New", "cat", "lazy", "AllCats")
+    sim = PetSimulation([away, new])
+
+    gap = sim.catch_up(6 * 7 * 24 * 3600)
+
+    assert gap == 6 * 7 * 24 * 3600
+    assert (away.hunger, away.happiness, away.energy) == (100, 0, 0)
+    assert away.state == "sleeping"
+    assert (new.hunger, new.happiness, new.energy, new.state) == (50, 50, 50, "idle")
+
+
+def test_many_pairs_interact_in_one_event():
+    sim = PetSimulation(make_household(40), seed=11)
+    events = []
+    sim.subscribe(events.append)
+
+    sim.interact()
+
+    (event,) = events
+    assert len(event.pets) > 2
+    assert len(event.message.splitlines()) == len(event.pets) // 2
+
+
+def test_catch_up_can_be_limited_to_a_batch():
+    loaded = VirtualPet("Loaded", "cat", "lazy", "AllCats", last_seen=0.0)
+    waiting = VirtualPet("Waiting", "cat", "lazy", "AllCats", last_seen=0.0)
+    sim = PetSimulation([loaded, waiting])
+
+    sim.catch_up(600.0, [loaded])
+
+    assert loaded.hunger == 70
+    assert (waiting.hunger, waiting.last_seen) == (50, 0.0)
+
+
+def test_pets_are_looked_up_by_id():
+    pets = make_household(3)
+    sim = PetSimulation(pets[:2])
+
+    sim.add_pet(pets[2])
+    sim.remove_pet(pets[0])
+
+    assert sim.by_id == {"cat1": pets[1], "cat2": pets[2]}
+
+
+def test_duplicate_ids_are_replaced():
+    first = VirtualPet("Mochi", "cat", "lazy", "AllCats", pet_id="mochi")
+    copy = VirtualPet("Mochi", "cat", "lazy", "AllCats", pet_id="mochi")
+    late = VirtualPet("Momo", "cat", "lazy", "AllCats", pet_id="mochi")
+    sim = PetSimulation([first, copy])
+
+    sim.add_pet(late)
+
+    assert first.id == "mochi"
+    assert len({first.id, copy.id, late.id}) == 3
+    assert set(sim.by_id) == {first.id, copy.id, late.id}
@@ -0,0 +1,152 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import pet.persistence as persistence
+from pet.pet import VirtualPet
+from pet.snapshot import (
+    HEADER,
+    PetSnapshot,
+    SnapshotError,
+    json_to_snapshot,
+    read_snapshot,
+    snapshot_to_json,
+    write_snapshot,
+)
+
+
+def make_dicts():
+    mochi = VirtualPet("Mochi 🐱", "cat", "affectionate", "AllCats", hunger=40)
+    kumo = VirtualPet("Kumo", "cat", "lazy", "AllCatsGrey", last_seen=1234.5)
+    kumo.relationships[mochi.id] = 12
+    return [mochi.to_dict(), kumo.to_dict()]
+
+
+def test_round_trip(tmp_path: Path):
+    data = make_dicts()
+    write_snapshot(data, tmp_path / "pets.snap")
+
+    assert read_snapshot(tmp_path / "pets.snap") == data
+
+
+def test_records_can_be_read_lazily(tmp_path: Path):
+    data = make_dicts()
+    write_snapshot(data, tmp_path / "pets.snap")
+
+    with PetSnapshot(tmp_path / "pets.snap") as snapshot:
+        assert len(snapshot) == 2
+        assert snapshot[1] == data[1]
+        assert snapshot.records["hunger"].tolist() == [40, 50]
+
+
+def test_other_versions_and_truncated_files_are_rejected(tmp_path: Path):
+    path = tmp_path / "pets.snap"
+    write_snapshot(make_dicts(), path)
+    data = path.read_bytes()
+
+    path.write_bytes(data[:8] + (99).to_bytes(2, "little") + data[10:])
+    with pytest.raises(SnapshotError, match="version 99"):
+        PetSnapshot(path)
+
+    path.write_bytes(data[: HEADER.size + 10])
+    with pytest.raises(SnapshotError, match="truncated"):
+        PetSnapshot(path)
+
+    path.write_text(json.dumps(make_dicts()))
+    with pytest.raises(SnapshotError):
+        PetSnapshot(path)
+
+
+def test_damaged_records_are_rejected_on_open(tmp_path: Path):
+    path = tmp_path / "pets.snap"
+    write_snapshot(make_dicts(), path)
+    with PetSnapshot(path) as snapshot:
+        records_offset = HEADER.size
+        blob = snapshot._blob_offset
+    data = bytearray(path.read_bytes())
+
+    damaged = data.copy()
+    # The first record's name index (after its id) points past the table
+    damaged[records_offset + 4 : records_offset + 8] = (10**6).to_bytes(4, "little")
+    path.write_bytes(damaged)
+    with pytest.raises(SnapshotError, match="bad name reference"):
+        PetSnapshot(path)
+
+    damaged = data.copy()
+    damaged[blob] = 0xFF
+    path.write_bytes(damaged)
+    with PetSnapshot(path) as snapshot:
+        with pytest.raises(SnapshotError, match="UTF-8"):
+            iter(snapshot)
+
+
+def test_damaged_snapshot_record_falls_back_to_json(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+    monkeypatch.setattr(persistence, "SNAPSHOT_PATH", str(tmp_path / "pets.snap"))
+    persistence.save_pets([VirtualPet("Mochi", "cat", "shy", "AllCats")])
+    write_snapshot(make_dicts(), tmp_path / "pets.snap")
+    data = bytearray((tmp_path / "pets.snap").read_bytes())
+    data[-1] = 0xFF  # inside the last string
+    (tmp_path / "pets.snap").write_bytes(data)
+    persistence.use_storage("snapshot")
+    try:
+        errors = []
+        (pet,) = persistence.load_pets(errors)
+    finally:
+        persistence.use_storage("json")
+
+    assert pet.name == "Mochi"
+    assert [(e.index, e.fatal) for e in errors] == [(None, False)]
+
+
+def test_converter_round_trip(tmp_path: Path):
+    data = make_dicts()
+    (tmp_path / "pets.json").write_text(json.dumps(data))
+
+    json_to_snapshot(tmp_path / "pets.json", tmp_path / "pets.snap")
+    snapshot_to_json(tmp_path / "pets.snap", tmp_path / "out.json")
+
+    assert json.loads((tmp_path / "out.json").read_text()) == data
+    assert (tmp_path / "pets.snap").stat().st_size < len(json.dumps(data, indent=4))
+
+
+def test_snapshot_storage_backend(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+    monkeypatch.setattr(persistence, "SNAPSHOT_PATH", str(tmp_path / "pets.snap"))
+    persistence.save_pets([VirtualPet("Mochi", "cat", "shy", "AllCats")])
+    persistence.use_storage("snapshot")
+    try:
+        # Starts from pets.json until the first snapshot is saved
+        (first,) = persistence.load_pets()
+        first.hunger = 77
+        persistence.save_pets([first])
+        (second,) = persistence.load_pets()
+    finally:
+        persistence.use_storage("json")
+
+    assert (second.id, second.hunger) == (first.id, 77)
+    assert (tmp_path / "pets.snap").exists()
+
+
+def test_corrupt_snapshot_is_reported_and_falls_back_to_json(
+    tmp_path: Path, monkeypatch
+):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+    monkeypatch.setattr(persistence, "SNAPSHOT_PATH", str(tmp_path / "pets.snap"))
+    persistence.save_pets([VirtualPet("Mochi", "cat", "shy", "AllCats")])
+    (tmp_path / "pets.snap").write_bytes(b"not a snapshot")
+    persistence.use_storage("snapshot")
+    try:
+        errors = []
+        (pet,) = persistence.load_pets(errors)
+        (tmp_path / "pets.json").unlink()
+        fatal = []
+        assert persistence.load_pets(fatal) == []
+    finally:
+        persistence.use_storage("json")
+
+    assert pet.name == "Mochi"
+    assert [(e.index, e.fatal) for e in errors] == [(None, False)]
+    assert [(e.index, e.fatal) for e in fatal] == [(None, True)]
+    assert (tmp_path / "pets.snap.corrupt").read_bytes() == b"not a snapshot"
@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+
+from PySide6.QtGui import QColor, QImage, Qt
+
+import ui.sprite_atlas as sprite_atlas
+
+
+def make_layers(tmp_path: Path):
+    (tmp_path / "base").mkdir()
+    (tmp_path / "Markings").mkdir()
+    base = QImage(4, 4, QImage.Format_ARGB32)
+    base.fill(QColor("#ff0000"))
+    base.save(str(tmp_path / "base" / "red.png"))
+    # A marking covering the left half; its own color is replaced
+    marking = QImage(4, 4, QImage.Format_ARGB32)
+    marking.fill(Qt.transparent)
+    for y in range(4):
+        for x in range(2):
+            marking.setPixelColor(x, y, QColor("#ffffff"))
+    marking.save(str(tmp_path / "Markings" / "stripe.png"))
+
+
+def test_layered_sheet_is_composited_and_cached(tmp_path: Path, qapp, monkeypatch):
+    make_layers(tmp_path)
+    layers = [("stripe", "#00ff00")]
+    cache_dir = str(tmp_path / "cache")
+
+    path = sprite_atlas.layered_sheet("red", layers, str(tmp_path), cache_dir)
+    sheet = QImage(path)
+    assert sheet.pixelColor(0, 0) == QColor("#00ff00")
+    assert sheet.pixelColor(3, 0) == QColor("#ff0000")
+
+    # Asking again is a cache hit: nothing is composited
+    def fail(*args):
+        raise AssertionError("composited again")
+
+    monkeypatch.setattr(sprite_atlas, "composite_layers", fail)
+    assert sprite_atlas.layered_sheet("red", layers, str(tmp_path), cache_dir) == path
+    monkeypatch.undo()
+
+    # Other colors, or an edited layer, are a different sheet
+    other = sprite_atlas.layered_sheet(
+        "red", [("stripe", "#0000ff")], str(tmp_path), cache_dir
+    )
+    assert other != path
+    marking = tmp_path / "Markings" / "stripe.png"
+    mtime = os.stat(marking).st_mtime_ns
+    os.utime(marking, ns=(mtime + 10**9, mtime + 10**9))
+    assert sprite_atlas.layered_sheet("red", layers, str(tmp_path), cache_dir) != path
+
+
+def test_missing_base_layer_gives_no_sheet(tmp_path: Path, qapp):
+    make_layers(tmp_path)
+
+    assert sprite_atlas.layered_sheet("blue", (), str(tmp_path), str(tmp_path)) is None
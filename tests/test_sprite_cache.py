@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from PySide6.QtGui import QColor, QImage
+
+from pet.animation_config import FRAME_HEIGHT, FRAME_WIDTH, SHEET_COLUMNS, SHEET_ROWS
+from ui.sprite_cache import SpriteAtlasCache
+
+
+def make_sheets(tmp_path: Path, count):
+    paths = []
+    for i in range(count):
+        sheet = QImage(
+            SHEET_COLUMNS * FRAME_WIDTH, SHEET_ROWS * FRAME_HEIGHT, QImage.Format_ARGB32
+        )
+        sheet.fill(QColor(i * 40, 0, 0))
+        path = str(tmp_path / f"Sheet{i}.png")
+        sheet.save(path)
+        paths.append(path)
+    return paths
+
+
+def test_hits_and_misses_are_counted(tmp_path: Path, qapp):
+    (path,) = make_sheets(tmp_path, 1)
+    cache = SpriteAtlasCache()
+
+    first = cache.atlas(path, "cat")
+    assert cache.atlas(path, "cat") is first
+    cache.frames(path, "cat", "sleeping")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["atlases"]) == (2, 1, 1)
+    assert stats["bytes"] == first.nbytes > 0
+
+
+def test_least_recently_used_sheet_is_evicted(tmp_path: Path, qapp):
+    a, b, c = make_sheets(tmp_path, 3)
+    size = SpriteAtlasCache().atlas(a, "cat").nbytes
+    cache = SpriteAtlasCache(max_bytes=2 * size)
+
+    cache.atlas(a, "cat")
+    cache.atlas(b, "cat")
+    cache.atlas(a, "cat")  # now b is the least recently used
+    cache.atlas(c, "cat")
+
+    assert cache.stats()["atlases"] == 2
+    assert cache.stats()["bytes"] == 2 * size
+    misses = cache.misses
+    cache.atlas(a, "cat")
+    assert cache.misses == misses
+    cache.atlas(b, "cat")
+    assert cache.misses == misses + 1
+
+
+def test_scaled_frames_count_towards_the_cap(tmp_path: Path, qapp):
+    a, b = make_sheets(tmp_path, 2)
+    size = SpriteAtlasCache().atlas(a, "cat").nbytes
+    cache = SpriteAtlasCache(max_bytes=2 * size)
+    cache.atlas(a, "cat")
+    cache.atlas(b, "cat")
+
+    # Growing b with scaled copies pushes a out; b itself always stays
+    cache.scaled_frames(b, "cat", "sleeping", 256, 256)
+
+    assert cache.stats()["atlases"] == 1
+    assert cache.stats()["bytes"] == cache.atlas(b, "cat").nbytes > size
@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+
+from pet.pet import VirtualPet
+from pet.sqlite_store import SQLitePetStore
+import pet.persistence as persistence
+
+
+def make_dicts():
+    return [
+        VirtualPet(
+            "Mochi", "cat", "affectionate", "AllCats", hunger=40, pet_id="mochi"
+        ).to_dict(),
+        VirtualPet(
+            "Kumo",
+            "cat",
+            "lazy",
+            "AllCatsGrey",
+            relationships={"mochi": 12},
+            pet_id="kumo",
+        ).to_dict(),
+    ]
+
+
+def test_round_trip(tmp_path: Path):
+    store = SQLitePetStore(str(tmp_path / "pets.db"))
+    store.save_dicts(make_dicts())
+    store.close()
+
+    loaded = SQLitePetStore(str(tmp_path / "pets.db")).load_dicts()
+
+    assert loaded == make_dicts()
+
+
+def test_only_changed_rows_are_written(tmp_path: Path):
+    store = SQLitePetStore(str(tmp_path / "pets.db"))
+    data = make_dicts()
+    store.save_dicts(data)
+
+    before = store.conn.total_changes
+    store.save_dicts(data)
+    assert store.conn.total_changes == before
+
+    data[1]["hunger"] = 99
+    data[1]["relationships"]["mochi"] = 20
+    store.save_dicts(data)
+    # One pet row and one relationship row
+    assert store.conn.total_changes == before + 2
+
+
+def test_removed_pets_and_relationships_are_deleted(tmp_path: Path):
+    store = SQLitePetStore(str(tmp_path / "pets.db"))
+    data = make_dicts()
+    store.save_dicts(data)
+
+    data[1]["relationships"] = {}
+    store.save_dicts(data[1:])
+
+    assert store.load_dicts() == data[1:]
+
+
+def test_existing_json_is_imported_on_first_run(tmp_path: Path):
+    json_path = tmp_path / "pets.json"
+    json_path.write_text(json.dumps(make_dicts()))
+
+    store = SQLitePetStore(str(tmp_path / "pets.db"), import_json_path=str(json_path))
+
+    assert [pd["name"] for pd in store.load_dicts()] == ["Mochi", "Kumo"]
+
+
+def test_persistence_sqlite_backend(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(persistence, "DATA_PATH", str(tmp_path / "pets.json"))
+    monkeypatch.setattr(persistence, "SQLITE_PATH", str(tmp_path / "pets.db"))
+    persistence.use_storage("sqlite")
+    try:
+        persistence.save_pets([VirtualPet("Mochi", "cat", "shy", "AllCats")])
+        loaded = persistence.load_pets()
+    finally:
+        persistence.use_storage("json")
+
+    assert [p.name for p in loaded] == ["Mochi"]
+    assert not (tmp_path / "pets.json").exists()
+
+
+def test_last_seen_is_stored_once_for_the_household(tmp_path: Path):
+    store = SQLitePetStore(str(tmp_path / "pets.db"))
+    data = make_dicts()
+    for pd in data:
+        pd["last_seen"] = 1234.5
+    store.save_dicts(data)
+
+    before = store.conn.total_changes
+    for pd in data:
+        pd["last_seen"] = 2000.0
+    store.save_dicts(data)
+
+    assert store.conn.total_changes == before + 1
+    assert [pd["last_seen"] for pd in store.load_dicts()] == [2000.0, 2000.0]
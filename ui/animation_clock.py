@@ -0,0 +1,88 @@
+from PySide6.QtCore import QElapsedTimer, QObject, QTimer
+
+# Fast enough for the shortest frame_interval in ANIMATION_CONFIGS (150 ms).
+DEFAULT_TICK_MS = 50
+
+
+class FrameAnimation:
+    """Frame selection for one running animation, derived from elapsed time."""
+
+    def __init__(self, frames, interval, loop, started_at):
+        self.frames = frames
+        self.interval = max(1, interval)
+        self.loop = loop
+        self.started_at = started_at
+        self.index = 0
+
+    @property
+    def finished(self):
+        return not self.loop and self.index >= len(self.frames) - 1
+
+    def current(self):
+        if not self.frames:
+            return None
+        return self.frames[self.index]
+
+    def advance(self, now):
+        if not self.frames:
+            return False
+        index = (now - self.started_at) // self.interval
+        if self.loop:
+            index %= len(self.frames)
+        else:
+            index = min(index, len(self.frames) - 1)  # stay at last frame
+        if index == self.index:
+            return False
+        self.index = index
+        return True
+
+
+class AnimationClock(QObject):
+    """One timer that drives every animated sprite.
+
+    Clients implement ``advance(now_ms)`` returning True when their frame
+    changed; only those clients get ``update()`` called on them.
+    """
+
+    def __init__(self, tick_ms=DEFAULT_TICK_MS, parent=None):
+        super().__init__(parent)
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._clients = {}
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(tick_ms)
+        self.timer.timeout.connect(self.tick)
+
+    def now(self):
+        return self._elapsed.elapsed()
+
+    def register(self, client):
+        self._clients[id(client)] = client
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def unregister(self, client):
+        self._clients.pop(id(client), None)
+        if not self._clients:
+            self.timer.stop()
+
+    def tick(self):
+        now = self.now()
+        # Clients may unregister themselves while advancing
+        for client in list(self._clients.values()):
+            if client.advance(now):
+                client.update()
+
+    def __len__(self):
+        return len(self._clients)
+
+
+_animation_clock = None
+
+
+def get_animation_clock():
+    global _animation_clock
+    if _animation_clock is None:
+        _animation_clock = AnimationClock()
+    return _animation_clock
@@ -0,0 +1,104 @@
+from PySide6.QtCore import QEvent, QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import QImage, QPixmap
+
+from ui.thumbnails import background_path, list_backgrounds
+
+# Smooth rescale once a resize has been quiet for this long
+RESCALE_DEBOUNCE_MS = 120
+
+
+class _PreloadTask(QRunnable):
+    def __init__(self, renderer, filename):
+        super().__init__()
+        self.renderer = renderer
+        self.filename = filename
+
+    def run(self):
+        # QImage (unlike QPixmap) may be loaded off the GUI thread
+        self.renderer.preloaded.emit(
+            self.filename, QImage(background_path(self.filename))
+        )
+
+
+class BackgroundRenderer(QObject):
+    """Keeps the room background pre-scaled to the scene widget's size.
+
+    The source image is decoded once per background. While the scene is
+    being resized each step gets a cheap fast-scaled copy, and a smooth one
+    follows once resizing pauses, so painting never scales. The backgrounds
+    either side of the current one are decoded in the background so paging
+    through them in Settings doesn't wait on disk.
+
+    ``on_scaled(pixmap)`` receives every new scaled background.
+    """
+
+    preloaded = Signal(str, QImage)
+
+    def __init__(self, scene_widget, on_scaled):
+        super().__init__(scene_widget)
+        self.scene_widget = scene_widget
+        self.on_scaled = on_scaled
+        self.filename = None
+        self.source = QPixmap()
+        self.scaled = QPixmap()
+        self._images = {}
+        self._loading = set()
+        self.preloaded.connect(self._store_preloaded)
+        self._rescale_timer = QTimer(
+            self,
+            singleShot=True,
+            interval=RESCALE_DEBOUNCE_MS,
+            timeout=lambda: self.rescale(smooth=True),
+        )
+        scene_widget.installEventFilter(self)
+
+    def set_background(self, filename):
+        """Switches to a background; False if it couldn't be loaded."""
+        image = self._images.pop(filename, None)
+        pixmap = QPixmap.fromImage(image) if image is not None else QPixmap()
+        if pixmap.isNull():
+            pixmap = QPixmap(background_path(filename))
+        if pixmap.isNull():
+            return False
+        self.filename = filename
+        self.source = pixmap
+        self.rescale(smooth=True)
+        self.preload_neighbours()
+        return True
+
+    def rescale(self, smooth):
+        size = self.scene_widget.size()
+        if self.source.isNull() or size.isEmpty():
+            return
+        if smooth:
+            self._rescale_timer.stop()
+        elif self.scaled.size() == size:
+            return
+        mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+        self.scaled = self.source.scaled(size, Qt.IgnoreAspectRatio, mode)
+        self.on_scaled(self.scaled)
+
+    def eventFilter(self, watched, event):
+        if watched is self.scene_widget and event.type() == QEvent.Resize:
+            self.rescale(smooth=False)
+            self._rescale_timer.start()
+        return False
+
+    # === Preloading ===
+    def preload_neighbours(self):
+        names = list_backgrounds()
+        if self.filename not in names:
+            return
+        i = names.index(self.filename)
+        neighbours = {names[(i - 1) % len(names)], names[(i + 1) % len(names)]}
+        neighbours.discard(self.filename)
+        # Only the neighbours of the current background are worth keeping
+        self._images = {n: img for n, img in self._images.items() if n in neighbours}
+        for name in neighbours - self._images.keys() - self._loading:
+            self._loading.add(name)
+            QThreadPool.globalInstance().start(_PreloadTask(self, name))
+
+    def _store_preloaded(self, filename, image):
+        self._loading.discard(filename)
+        if not image.isNull() and filename != self.filename:
+            self._images[filename] = image
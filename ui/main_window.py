@@ -4,38 +4,53 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QListWidget,
+    QListView,
     QMessageBox,
     QAbstractItemView,
-    QTextEdit,
+    QPlainTextEdit,
     QLineEdit,
     QMainWindow,
     QSizePolicy,
     QMenu,
 )
-from PySide6.QtCore import QTimer, Qt, QPoint
-from PySide6.QtGui import QPixmap
-from ui.pet_sprite import PetSprite
+from PySide6.QtCore import QElapsedTimer, QTimer, Qt, QPoint
+from ui.pet_canvas import PetCanvas
+from ui.pet_list_model import PetFilterProxy, PetListModel
+from ui.pet_scene import PetSceneManager, STATE_TO_ANIMATION
 from ui.add_pet_dialog import AddPetDialog
 from ui.edit_pet_dialog import EditPetDialog
 from ui.pet_profile_window import PetProfileWindow
 from ui.settings_dialog import SettingsDialog
+from ui.background import BackgroundRenderer
+from ui.sprite_atlas import install_packed_atlas
+from ui.sprite_cache import check_sprite_sheets
+from pet.activity_log import LOG_PATH, ActivityLog
 from pet.config import load_config, save_config
 from pet.pet import VirtualPet
-from pet.persistence import load_pets, save_pets
-from pet.interactions import process_interaction
-from pet.animation_config import ANIMATION_CONFIGS
+from pet.journal import PetJournal
+from pet.persistence import (
+    LoadError,
+    PetSaver,
+    iter_pets,
+    migrate_relationship_keys,
+    use_storage,
+    write_pet_dicts,
+)
+from pet.search import PetSearchIndex
+from pet.simulation import DECAY_INTERVAL, PetSimulation
+from pet.animation_config import ANIMATIONS
+import itertools
 import random
+import time
 
-STATE_TO_ANIMATION = {
-    "idle": ["sitting", "resting_lazy", "laying"],
-    "sleeping": ["sleeping", "deep_sleep"],
-    "walking": ["running"],
-    "playing": ["dancing", "box_headup"],
-    "praying": ["praying_closed", "praying_open"],
-    "collapsed": ["collapse_open", "collapse_closed"],
-    "waking": ["waking"],
-}
+# Pets loaded before the window first appears; the rest stream in afterwards
+FIRST_SCREEN_PETS = 50
+LOAD_BATCH_PETS = 2000
+LOAD_REFRESH_MS = 500
+# Search runs once typing pauses for this long
+SEARCH_DEBOUNCE_MS = 150
+# Longer timer gaps (e.g. the machine slept) are skipped, not replayed
+MAX_REPLAY_SECONDS = 30
 
 
 class MainWindow(QMainWindow):
@@ -62,26 +77,26 @@ class MainWindow(QMainWindow):
                     stop: 1 #f7fafc
                 );
             }
-            QListWidget {
+            QListView {
                 background-color: #ffffff;
                 border-radius: 6px;
                 border: 1px solid #dde1eb;
                 padding: 6px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 4px 2px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e0ebff;
                 color: #1f2933;
             }
-            QTextEdit {
+            QTextEdit, QPlainTextEdit {
                 background-color: #ffffff;
                 border-radius: 6px;
                 border: 1px solid #dde1eb;
                 padding: 6px;
             }
-            QTextEdit#logBox {
+            QPlainTextEdit#logBox {
                 background-color: #fff7ed;
                 border: 1px solid #f3c78c;
                 color: #823b11;
@@ -97,8 +112,34 @@ class MainWindow(QMainWindow):
             }
             """)
 
-        self.pets = load_pets()
-        self.pet_sprites = {}
+        use_storage(self.config.get("storage", "json"))
+        self.simulation = PetSimulation()
+        self.simulation.subscribe(self.on_simulation_event)
+        self.pets = self.simulation.pets
+        self.search_index = PetSearchIndex()
+        self.activity_log = ActivityLog(
+            path=LOG_PATH if self.config.get("activity_log_file") else None
+        )
+        self.journal = PetJournal() if self.config.get("journal") else None
+        # A journal left over from a run that didn't close cleanly is replayed
+        # once everything has loaded; catch-up decay has to wait for it
+        self._replay_pending = self.journal is not None and self.journal.has_events()
+        # Nothing is written until every pet has loaded, so a partial
+        # household can't overwrite the file. The pets are serialized here,
+        # once per save window, when save_timer fires.
+        self.save_timer = QTimer(self, singleShot=True)
+        self.saver = PetSaver(
+            paused=True,
+            write=self.write_pets,
+            schedule=lambda delay: self.save_timer.start(int(delay * 1000)),
+        )
+        self.save_timer.timeout.connect(self.saver.commit)
+        self.load_errors = []
+        self.saving_blocked = False
+        self.time_away = 0.0
+        self._pet_stream = iter_pets(self.load_errors)
+        self._last_load_refresh = QElapsedTimer()
+        self.load_pet_batch(FIRST_SCREEN_PETS)
 
         # === Layout ===
         central_widget = QWidget()
@@ -111,17 +152,35 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(top_layout)
 
         # === Scene with background ===
-        self.scene_widget = QWidget()
-        self.scene_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        scene_layout = QVBoxLayout(self.scene_widget)
-        scene_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.background_label = QLabel()
-        self.background_label.setScaledContents(True)
-        self.background_label.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
+        check_sprite_sheets()
+        install_packed_atlas()
+        if self.config.get("scene_backend") == "canvas":
+            # Background and all pets painted by a single widget
+            self.scene_widget = PetCanvas(
+                on_pet_clicked=self.open_pet_profile_from_sprite
+            )
+            self.pet_scene = self.scene_widget
+        else:
+            self.scene_widget = QWidget()
+            self.scene_widget.setSizePolicy(
+                QSizePolicy.Expanding, QSizePolicy.Expanding
+            )
+            scene_layout = QVBoxLayout(self.scene_widget)
+            scene_layout.setContentsMargins(0, 0, 0, 0)
+
+            background_label = QLabel()
+            # Shows the pre-scaled background as is; Ignored so the pixmap's
+            # size never feeds back into the layout
+            background_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+            scene_layout.addWidget(background_label)
+            self.pet_scene = PetSceneManager(
+                self.scene_widget,
+                background_label,
+                self.open_pet_profile_from_sprite,
+            )
+        self.background = BackgroundRenderer(
+            self.scene_widget, self.pet_scene.set_background
         )
-        scene_layout.addWidget(self.background_label)
         self.set_background(self.current_background)
 
         # === Right panel ===
@@ -130,12 +189,26 @@ class MainWindow(QMainWindow):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search cats...")
-        self.search_input.textChanged.connect(self.refresh_pet_list)
 
-        self.pet_list = QListWidget()
+        self.pet_model = PetListModel(self.pets, self)
+        self.pet_filter = PetFilterProxy(self)
+        self.pet_filter.setSourceModel(self.pet_model)
+        self.search_timer = QTimer(
+            self,
+            singleShot=True,
+            interval=SEARCH_DEBOUNCE_MS,
+            timeout=self.apply_search,
+        )
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+        self.pet_list = QListView()
         self.pet_list.setObjectName("petList")
+        self.pet_list.setModel(self.pet_filter)
         self.pet_list.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.pet_list.itemDoubleClicked.connect(self.open_pet_profile)
+        self.pet_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Every row has the same height, so the view can skip measuring them
+        self.pet_list.setUniformItemSizes(True)
+        self.pet_list.doubleClicked.connect(self.open_pet_profile)
         self.pet_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.pet_list.customContextMenuRequested.connect(self.show_pet_context_menu)
 
@@ -208,10 +281,14 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(self.help_button)
         button_layout.addWidget(self.settings_button)
 
-        self.log_box = QTextEdit()
+        # Plain text with a block limit: only visible lines are laid out and
+        # the oldest lines drop off, matching the ActivityLog ring buffer
+        self.log_box = QPlainTextEdit()
         self.log_box.setObjectName("logBox")
         self.log_box.setReadOnly(True)
         self.log_box.setFixedHeight(120)
+        self.log_box.setMaximumBlockCount(self.activity_log.capacity)
+        self.log_flush_timer = QTimer(self, singleShot=True, timeout=self.flush_log)
 
         # === Assemble right panel ===
         right_panel.addWidget(self.search_input)
@@ -225,23 +302,144 @@ class MainWindow(QMainWindow):
         top_layout.addLayout(right_panel, stretch=1)
 
         # === Timers ===
-        self.interaction_timer = QTimer(self, timeout=self.random_pet_interaction)
-        self.interaction_timer.start(10000)
+        # The simulation runs on simulated time; feed it wall-clock time here
+        self.simulation_clock = QElapsedTimer()
+        self.simulation_clock.start()
+        self.simulation_timer = QTimer(self, timeout=self.tick_simulation)
+        self.simulation_timer.start(1000)
 
-        self.stat_decay_timer = QTimer(self, timeout=self.auto_decay_stats)
-        self.stat_decay_timer.start(60000)
+        self.refresh_pet_list()
+        self.refresh_pet_scene()
 
-        self.animation_timer = QTimer(self, timeout=self.update_pet_sprites)
-        self.animation_timer.start(500)
+        # Keep loading from the event loop, one batch per turn
+        self._last_load_refresh.start()
+        self.load_timer = QTimer(self, timeout=self.load_more_pets)
+        self.load_timer.start(0)
+
+    # === Loading ===
+    def load_pet_batch(self, count):
+        """Adds up to ``count`` more pets from storage; False once all are in."""
+        batch = []
+        try:
+            batch.extend(itertools.islice(self._pet_stream, count))
+        except Exception as e:
+            # The rest of the household is lost for this session: keep what
+            # did load, but never save it over the full one
+            print(f"[ERROR] Stopped loading pets: {e!r}")
+            self.load_errors.append(
+                LoadError(None, 0, f"loading stopped: {e}", fatal=True)
+            )
+            self._pet_stream = iter(())
+            count = None
+        self.simulation.add_pets(batch)
+        for pet in batch:
+            self.search_index.add(pet)
+        if not self._replay_pending:
+            # Apply the decay the cats went through while the app was closed
+            self.time_away = max(
+                self.time_away, self.simulation.catch_up(time.time(), batch)
+            )
+        return len(batch) == count
+
+    def load_more_pets(self):
+        more = self.load_pet_batch(LOAD_BATCH_PETS)
+        if not more:
+            self.finish_loading()
+        elif self._last_load_refresh.hasExpired(LOAD_REFRESH_MS):
+            self._last_load_refresh.restart()
+            self.apply_search()
+            self.refresh_pet_list()
+            self.refresh_pet_scene()
 
-        self.animation_variation_timer = QTimer(
-            self, timeout=self.rotate_pet_animations
-        )
-        self.animation_variation_timer.start(30000)
+    def finish_loading(self):
+        self.load_timer.stop()
+        self._pet_stream = None
+        migrate_relationship_keys(self.pets)
+        self.saving_blocked = any(error.fatal for error in self.load_errors)
+        if self.saving_blocked:
+            # Nothing could be loaded; the saver stays paused so an empty
+            # household can't replace the saved one
+            self.log(
+                "⚠️ Your saved cats could not all be read, so changes won't be "
+                "saved this session. The saved file was left as it was."
+            )
+        else:
+            if self._replay_pending:
+                self.replay_journal()
+            if self.journal is not None:
+                self.journal.start()
+            self.saver.resume()
+            if self._replay_pending:
+                # Fold the replayed journal into a fresh snapshot
+                self._replay_pending = False
+                self.compact_journal()
+
+        if self.time_away >= DECAY_INTERVAL:
+            hours = self.time_away / 3600
+            self.log(
+                f"Welcome back! Your cats spent {hours:.1f} hours on their own. 🐾"
+            )
+        skipped = [error for error in self.load_errors if error.index is not None]
+        if skipped:
+            self.log(
+                f"⚠️ {len(skipped)} cat record(s) could not be read and were skipped."
+            )
+        if any(error.index is None and not error.fatal for error in self.load_errors):
+            self.log(
+                "⚠️ The cat snapshot could not be read; loaded the older pets.json "
+                "instead."
+            )
 
+        self.apply_search()
         self.refresh_pet_list()
         self.refresh_pet_scene()
 
+    # === Activity log ===
+    def log(self, message):
+        """Queues a message; everything queued in one event-loop turn is
+        shown (and written out) together."""
+        self.activity_log.add(message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start(0)
+
+    def flush_log(self):
+        batch = self.activity_log.flush()
+        if batch:
+            self.log_box.appendPlainText("\n".join(batch))
+
+    def replay_journal(self):
+        recovered = self.journal.replay(self.simulation)
+        # Replay may have added or removed cats
+        self.search_index = PetSearchIndex(self.pets)
+        self.time_away = self.simulation.catch_up(time.time())
+        if recovered:
+            self.log(f"Recovered unsaved changes for {len(recovered)} cat(s). 📓")
+
+    # === Saving ===
+    def record(self, change, *args):
+        """Journals one change (see PetJournal), or saves the whole household
+        when journaling is off."""
+        if self.journal is None:
+            self.saver.mark_dirty(self.pets)
+            return
+        getattr(self.journal, change)(*args)
+        if self.journal.should_compact():
+            self.compact_journal()
+
+    def compact_journal(self):
+        # rotate() refuses while a .old is waiting for its snapshot, including
+        # one left by a crash before it was written. The snapshot taken here
+        # discards it (see write_pets), so take one either way.
+        self.journal.rotate()
+        self.saver.mark_dirty(self.pets)
+
+    def write_pets(self, data):
+        # Runs on the saver thread; once a snapshot is on disk the journal
+        # that was rotated out before it is no longer needed
+        write_pet_dicts(data)
+        if self.journal is not None:
+            self.journal.discard_rotated()
+
     def show_help_dialog(self):
         QMessageBox.information(
             self,
@@ -252,13 +450,18 @@ class MainWindow(QMainWindow):
                 "• Happiness: goes up when you play or when cats cuddle; drops if ignored.\n"
                 "• Energy: goes down when playing and over time, up when your cat rests or sleeps.\n\n"
                 "Random interactions:\n"
-                "• Every so often, two cats will interact on their own. Their personalities decide\n"
-                "  whether they cuddle, play, or keep their distance, changing their stats and friendship.\n\n"
+                "• Every so often, pairs of cats will interact on their own, favouring their friends.\n"
+                "  Their personalities decide whether they cuddle, play, or keep their distance,\n"
+                "  changing their stats and friendship.\n\n"
                 "Interacting with your cats:\n"
                 "• Double‑click a cat in the list or click its sprite in the room to open its profile.\n"
                 "• From the profile, use Feed / Play / Rest to care for your cat.\n"
                 "• Watch the icons next to each cat's name for hunger (🍽️), tiredness (😴),\n"
-                "  and low happiness (😿).\n"
+                "  and low happiness (😿).\n\n"
+                "Searching:\n"
+                '• Type part of a name, species or personality, e.g. "mo" or "lazy".\n'
+                "• Filter by status with hungry, tired, sad or sleeping, or by field with\n"
+                "  personality:shy, name:mochi or state:playing. Combine terms to narrow down.\n"
             ),
         )
 
@@ -271,114 +474,51 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def set_background(self, filename):
-        path = f"assets/PetMobileGameAsset/Backgrounds/{filename}"
-        pixmap = QPixmap(path)
-        if not pixmap.isNull():
-            self.background_label.setPixmap(pixmap)
-            self.current_background = filename
+        if not self.background.set_background(filename):
+            print(f"[WARN] Could not load background {filename}")
+            return
+        self.current_background = filename
+        if self.config.get("background") != filename:
             self.config["background"] = filename
             save_config(self.config)  # ← persist it
-        else:
-            self.background_label.clear()
-
-    def refresh_pet_list(self):
-        query = self.search_input.text().lower()
-        self.pet_list.clear()
-        if not self.pets:
-            self.pet_list.hide()
-            self.empty_state_widget.show()
-            return
-
-        self.pet_list.show()
-        self.empty_state_widget.hide()
-
-        for pet in self.pets:
-            display = f"{pet.name} ({pet.species.capitalize()}, {pet.personality})"
-            icons = []
-            if pet.hunger > 80:
-                icons.append("🍽️")
-            if pet.energy < 20:
-                icons.append("😴")
-            if pet.happiness < 30:
-                icons.append("😿")
-            if icons:
-                display += " " + "".join(icons)
-            if query in display.lower():
-                self.pet_list.addItem(display)
 
-    def refresh_pet_scene(self):
-        for child in self.scene_widget.findChildren(QWidget):
-            if child is not self.background_label:
-                child.setParent(None)
-
-        self.pet_sprites.clear()
-
-        scene_height = self.scene_widget.height()
-        sprite_height = 96  # Known sprite display height (adjust if you change it)
+    def refresh_pet_list(self, pets=None):
+        """Picks up added/removed pets and redraws ``pets`` (default: all)."""
+        self.pet_model.sync(self.simulation.version)
+        self.pet_model.pets_changed(pets)
+        self.pet_list.setVisible(bool(self.pets))
+        self.empty_state_widget.setVisible(not self.pets)
 
-        for idx, pet in enumerate(self.pets):
-            sprite_path = (
-                f"assets/PetMobileGameAsset/Cats/RetroCats/{pet.sprite_name}.png"
-            )
+    def apply_search(self):
+        self.search_timer.stop()
+        self.pet_filter.set_search(self.search_index.query(self.search_input.text()))
 
-            sprite = PetSprite(
-                sprite_path=sprite_path,
-                species=pet.species,
-                animation_config=ANIMATION_CONFIGS[pet.species],
-                state=pet.state,
-                pet=pet,
-            )
+    def pet_for_index(self, index):
+        """The pet behind a row of the (filtered) list view."""
+        return self.pet_model.pet_at(self.pet_filter.mapToSource(index).row())
 
-            self.configure_sprite_animation(sprite, pet)
-            sprite.setParent(self.scene_widget)
+    def selected_pet(self):
+        selected = self.pet_list.selectionModel().selectedIndexes()
+        return self.pet_for_index(selected[0]) if selected else None
 
-            x = 32 + idx * 96
-            y = scene_height - sprite_height - 10  # fixed height used
+    def select_pet(self, pet):
+        row = self.pet_model.row_of(pet)
+        index = self.pet_filter.mapFromSource(self.pet_model.index(row))
+        self.pet_list.setCurrentIndex(index)
 
-            sprite.move(x, y)
-            sprite.show()
-            sprite.clicked.connect(self.open_pet_profile_from_sprite)
-            self.pet_sprites[pet.name] = sprite
+    def refresh_pet_scene(self):
+        self.pet_scene.sync(self.pets)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.refresh_pet_scene()
 
-    def update_pet_sprites(self):
-        for pet in self.pets:
-            sprite = self.pet_sprites.get(pet.name)
-            if sprite:
-                self.configure_sprite_animation(sprite, pet)
-
-    def configure_sprite_animation(self, sprite, pet):
-        anim_keys = STATE_TO_ANIMATION.get(pet.state, [])
-        config_dict = ANIMATION_CONFIGS[pet.species]
-
-        # Reset animation if state changed
-        if pet.state != getattr(pet, "_last_state", None):
-            pet._current_animation_key = None
-            pet._last_state = pet.state
-
-        # Pick new animation only if not set
-        if not pet._current_animation_key:
-            valid_keys = [k for k in anim_keys if k in config_dict]
-            if valid_keys:
-                pet._current_animation_key = random.choice(valid_keys)
-
-        key = pet._current_animation_key
-        if key and key in config_dict:
-            config = config_dict[key]
-            # print(f"[ANIM] Pet: {pet.name}, State: {pet.state}, Using animation: {key}")
-            sprite.set_animation(config)
-        else:
-            print(f"[WARN] No animation found for Pet: {pet.name}, State: {pet.state}")
-
     def rotate_pet_animations(self):
         for pet in self.pets:
             anim_keys = STATE_TO_ANIMATION.get(pet.state, [])
-            config_dict = ANIMATION_CONFIGS[pet.species]
+            animations = ANIMATIONS[pet.species]
 
-            valid_keys = [k for k in anim_keys if k in config_dict]
+            valid_keys = [k for k in anim_keys if k in animations]
             if not valid_keys:
                 continue
 
@@ -400,32 +540,33 @@ class MainWindow(QMainWindow):
                 f"AllCats{'' if color == 'BrownWhite' else color}"  # handle default
             )
             new_pet = VirtualPet(name, species, personality, sprite_name)
-            self.pets.append(new_pet)
-            save_pets(self.pets)
+            self.simulation.add_pet(new_pet)
+            self.search_index.add(new_pet)
+            self.record("pet_added", new_pet)
+            self.apply_search()
             self.refresh_pet_list()
             self.refresh_pet_scene()
 
     def edit_selected_pet(self):
-        selected = self.pet_list.selectedItems()
-        if not selected:
+        pet = self.selected_pet()
+        if pet is None:
             return
-        index = self.pet_list.row(selected[0])
-        pet = self.pets[index]
         dialog = EditPetDialog(pet)
         if dialog.exec():
             name, personality = dialog.get_updated_info()
             pet.name = name
             pet.personality = personality
-            save_pets(self.pets)
-            self.refresh_pet_list()
+            self.simulation.mark_changed()
+            self.record("pets_changed", [pet], "edit", ("name", "personality"))
+            self.search_index.update(pet)
+            self.apply_search()
+            self.refresh_pet_list([pet])
 
     def delete_selected_pet(self):
-        selected = self.pet_list.selectedItems()
-        if not selected:
+        pet_to_remove = self.selected_pet()
+        if pet_to_remove is None:
             return
 
-        index = self.pet_list.row(selected[0])
-        pet_to_remove = self.pets[index]
         removed_name = pet_to_remove.name
 
         # Show confirmation dialog
@@ -439,25 +580,22 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.No:
             return
 
-        # Remove pet
-        del self.pets[index]
-
-        # Clean up relationships in remaining pets
-        for pet in self.pets:
-            if removed_name in pet.relationships:
-                del pet.relationships[removed_name]
+        # Remove pet (and every relationship to it)
+        self.simulation.remove_pet(pet_to_remove)
+        self.search_index.remove(pet_to_remove)
 
-        save_pets(self.pets)
+        self.record("pet_removed", pet_to_remove)
+        self.apply_search()
         self.refresh_pet_list()
         self.refresh_pet_scene()
 
     def show_pet_context_menu(self, pos: QPoint):
-        item = self.pet_list.itemAt(pos)
-        if not item:
+        index = self.pet_list.indexAt(pos)
+        if not index.isValid():
             return
 
         # Ensure the clicked item is selected
-        self.pet_list.setCurrentItem(item)
+        self.pet_list.setCurrentIndex(index)
 
         menu = QMenu(self)
         open_profile_action = menu.addAction("Open Profile")
@@ -467,28 +605,36 @@ class MainWindow(QMainWindow):
 
         action = menu.exec_(self.pet_list.mapToGlobal(pos))
         if action == open_profile_action:
-            self.open_pet_profile(item)
+            self.open_pet_profile(index)
         elif action == edit_action:
             self.edit_selected_pet()
         elif action == delete_action:
             self.delete_selected_pet()
 
-    def open_pet_profile(self, item):
-        index = self.pet_list.row(item)
-        pet = self.pets[index]
-        self.pet_list.setCurrentRow(index)
+    def open_pet_profile(self, index):
+        pet = self.pet_for_index(index)
+        self.pet_list.setCurrentIndex(index)
         self.profile_window = PetProfileWindow(
-            pet, self.pets, on_stats_changed=self.handle_pet_stats_changed
+            pet,
+            self.pets,
+            on_stats_changed=self.handle_pet_stats_changed,
+            record=self.record,
+            pets_by_id=self.simulation.by_id,
+            relationships=self.simulation.relationships,
         )
         self.profile_window.show()
 
     def open_pet_profile_from_sprite(self, pet):
-        if pet not in self.pets:
+        if self.simulation.by_id.get(pet.id) is not pet:
             return
-        index = self.pets.index(pet)
-        self.pet_list.setCurrentRow(index)
+        self.select_pet(pet)
         self.profile_window = PetProfileWindow(
-            pet, self.pets, on_stats_changed=self.handle_pet_stats_changed
+            pet,
+            self.pets,
+            on_stats_changed=self.handle_pet_stats_changed,
+            record=self.record,
+            pets_by_id=self.simulation.by_id,
+            relationships=self.simulation.relationships,
         )
         self.profile_window.show()
 
@@ -496,48 +642,46 @@ class MainWindow(QMainWindow):
         self.refresh_pet_list()
         self.refresh_pet_scene()
 
-    def random_pet_interaction(self):
-        if len(self.pets) < 2:
-            return
-        p1, p2 = random.sample(self.pets, 2)
-        msg = process_interaction(p1, p2)
-        self.log_box.append(msg)
-
-        # Change state based on message content (simple keyword rule for now)
-        if "cuddled" in msg:
-            p1.state = "idle"
-            p2.state = "idle"
-        elif "tried to play" in msg:
-            p1.state = "playing"
-            p2.state = "idle"
-        elif "shied away" in msg:
-            p2.state = "collapsed"
+    def tick_simulation(self):
+        seconds = self.simulation_clock.restart() / 1000
+        if seconds > MAX_REPLAY_SECONDS:
+            self.simulation.skip(seconds)
+        else:
+            self.simulation.advance(seconds)
+
+    def on_simulation_event(self, event):
+        if event.kind == "interaction":
+            self.handle_pet_interaction(event)
+        elif event.kind == "decay":
+            self.handle_stat_decay(event)
+        elif event.kind == "rotate_animations":
+            self.rotate_pet_animations()
+
+    def handle_pet_interaction(self, event):
+        # One event per tick covers every pair that interacted
+        self.log(event.message)
 
         # Force re-render immediately after state change
         self.refresh_pet_scene()
-        self.refresh_pet_list()
+        self.refresh_pet_list(event.pets)
 
-        save_pets(self.pets)
+        self.record("interacted", event.outcomes)
 
-    def auto_decay_stats(self):
-        for pet in self.pets:
-            pet.adjust_stat("hunger", +2)
-            pet.adjust_stat("happiness", -2)
-            pet.adjust_stat("energy", -1)
-
-            # Simple threshold logic to update state without overwriting playful states
-            if pet.energy < 20:
-                pet.state = "sleeping"
-            elif pet.hunger > 80:
-                pet.state = "collapsed"
-            elif pet.happiness < 30 and pet.state not in ("sleeping", "collapsed"):
-                pet.state = "idle"
-            # Otherwise, keep the current state (e.g., playing or idle)
-
-        save_pets(self.pets)
+    def handle_stat_decay(self, event):
+        self.record("decayed", event.pets)
         self.refresh_pet_scene()
         self.refresh_pet_list()
 
     def closeEvent(self, event):
-        save_pets(self.pets)
+        if self._pet_stream is not None:
+            # Closed mid-load: the household in memory is incomplete
+            self.load_timer.stop()
+            self._pet_stream.close()
+        elif self.journal is not None and not self.saving_blocked:
+            self.journal.rotate()
+        self.saver.mark_dirty(self.pets)
+        self.saver.close()
+        if self.journal is not None:
+            self.journal.close()
+        self.activity_log.close()
         event.accept()
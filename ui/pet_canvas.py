@@ -0,0 +1,177 @@
+from PySide6.QtCore import QRect, Qt, Signal
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+from pet.animation_config import ANIMATIONS
+from ui.animation_clock import FrameAnimation, get_animation_clock
+from ui.pet_scene import SPRITE_SIZE, pick_animation_key, sprite_position
+from ui.sprite_cache import get_sprite_cache, sprite_path_for
+
+
+class CanvasPet:
+    """A pet drawn by PetCanvas: position and animation state, no widget."""
+
+    def __init__(self, pet):
+        self.pet = pet
+        self.sprite_path = sprite_path_for(pet.sprite_name)
+        self.rect = QRect(0, 0, SPRITE_SIZE, SPRITE_SIZE)
+        self.animation = None
+        self.animation_key = None
+
+    def set_animation(self, animation_key, now):
+        table = ANIMATIONS[self.pet.species][animation_key]
+        self.animation_key = animation_key
+        self.animation = FrameAnimation(
+            get_sprite_cache().scaled_frames(
+                self.sprite_path,
+                self.pet.species,
+                animation_key,
+                SPRITE_SIZE,
+                SPRITE_SIZE,
+            ),
+            interval=table.interval,
+            loop=table.loop,
+            started_at=now,
+        )
+
+
+class PetCanvas(QWidget):
+    """Scene backend that paints the background and every pet in one pass.
+
+    Offers the same sync/set_background/clear surface as PetSceneManager, so
+    MainWindow can use either. Clicks are hit-tested against the pet rects.
+    """
+
+    clicked = Signal(object)
+
+    def __init__(self, on_pet_clicked=None, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.background = QPixmap()
+        self.scaled_background = QPixmap()
+        self.items = {}
+        # Draw order, back to front; hit-testing walks it in reverse
+        self.order = []
+        if on_pet_clicked:
+            self.clicked.connect(on_pet_clicked)
+
+    def set_background(self, pixmap):
+        # Usually already scaled to fit (see BackgroundRenderer)
+        self.background = pixmap
+        self._rescale_background()
+        self.update()
+
+    def sync(self, pets):
+        clock = get_animation_clock()
+        now = clock.now()
+        previous = self.items
+        live = {}
+        order = []
+
+        for idx, pet in enumerate(pets):
+            item = previous.pop(pet.id, None)
+            if (
+                item is None
+                or item.pet is not pet
+                or item.sprite_path != sprite_path_for(pet.sprite_name)
+            ):
+                item = CanvasPet(pet)
+
+            key = pick_animation_key(pet)
+            if key is None:
+                print(
+                    f"[WARN] No animation found for Pet: {pet.name}, State: {pet.state}"
+                )
+            elif key != item.animation_key:
+                item.set_animation(key, now)
+                self.update(item.rect)
+
+            target = sprite_position(idx, self.height())
+            if item.rect.topLeft() != target:
+                self.update(item.rect)
+                item.rect.moveTopLeft(target)
+                self.update(item.rect)
+
+            live[pet.id] = item
+            order.append(item)
+
+        for item in previous.values():
+            self.update(item.rect)
+
+        self.items = live
+        self.order = order
+        if self.items:
+            clock.register(self)
+        else:
+            clock.unregister(self)
+
+    def clear(self):
+        self.items = {}
+        self.order = []
+        get_animation_clock().unregister(self)
+        self.update()
+
+    def advance(self, now):
+        """Schedules a repaint of just the pets whose frame changed.
+
+        Always returns False: the dirty rects are already queued, and Qt
+        merges them into a single paint event.
+        """
+        for item in self.order:
+            if item.animation is not None and item.animation.advance(now):
+                self.update(item.rect)
+        return False
+
+    def item_at(self, pos):
+        for item in reversed(self.order):
+            if item.rect.contains(pos):
+                return item
+        return None
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            item = self.item_at(event.position().toPoint())
+            if item is not None:
+                self.clicked.emit(item.pet)
+        super().mousePressEvent(event)
+
+    def resizeEvent(self, event):
+        self._rescale_background()
+        super().resizeEvent(event)
+
+    def hideEvent(self, event):
+        get_animation_clock().unregister(self)
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        if self.items:
+            get_animation_clock().register(self)
+        super().showEvent(event)
+
+    def paintEvent(self, event):
+        dirty = event.rect()
+        painter = QPainter(self)
+        if not self.scaled_background.isNull():
+            painter.drawPixmap(dirty, self.scaled_background, dirty)
+
+        for item in self.order:
+            if item.animation is None or not item.rect.intersects(dirty):
+                continue
+            frame = item.animation.current()
+            if frame is None:
+                continue
+            x = item.rect.x() + (item.rect.width() - frame.width()) // 2
+            y = item.rect.y() + (item.rect.height() - frame.height()) // 2
+            painter.drawPixmap(x, y, frame)
+        painter.end()
+
+    def _rescale_background(self):
+        if self.background.isNull() or self.width() <= 0 or self.height() <= 0:
+            self.scaled_background = QPixmap()
+            return
+        if self.background.size() == self.size():
+            self.scaled_background = self.background
+            return
+        self.scaled_background = self.background.scaled(
+            self.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        )
@@ -0,0 +1,117 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from pet.search import STATUS_FILTERS
+
+STATUS_ICONS = (("hungry", "🍽️"), ("tired", "😴"), ("sad", "😿"))
+
+
+def pet_display_text(pet):
+    display = f"{pet.name} ({pet.species.capitalize()}, {pet.personality})"
+    icons = [icon for status, icon in STATUS_ICONS if STATUS_FILTERS[status](pet)]
+    if icons:
+        display += " " + "".join(icons)
+    return display
+
+
+class PetListModel(QAbstractListModel):
+    """List model over the household list, one row per pet.
+
+    Rows are formatted only when a view (or the filter) asks for them.
+    The model doesn't watch the list: call ``sync`` after pets are added or
+    removed and ``pets_changed`` after their stats change.
+    """
+
+    def __init__(self, pets, parent=None):
+        super().__init__(parent)
+        self.pets = pets
+        self._count = len(pets)
+        self._rows = {pet.id: row for row, pet in enumerate(pets)}
+        self._version = None
+
+    def rowCount(self, parent=None):
+        # Flat list: only the invisible root has children
+        return 0 if parent is not None and parent.isValid() else self._count
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._count:
+            return None
+        pet = self.pets[index.row()]
+        if role == Qt.DisplayRole:
+            return pet_display_text(pet)
+        return None
+
+    def pet_at(self, row):
+        return self.pets[row]
+
+    def row_of(self, pet):
+        return self._rows.get(pet.id)
+
+    def sync(self, version=None):
+        """Catches up with pets added to or removed from the list.
+
+        ``version`` is the household's PetSimulation.version; while it is
+        unchanged nothing was added or removed and this returns at once.
+        """
+        if version is not None and version == self._version:
+            return
+        self._version = version
+        count = len(self.pets)
+        if count == self._count and all(
+            self._rows.get(pet.id) == row for row, pet in enumerate(self.pets)
+        ):
+            return
+        last = self._count - 1
+        # Appending leaves the rows we already know where they were
+        if count > self._count and (
+            last < 0 or self._rows.get(self.pets[last].id) == last
+        ):
+            self.beginInsertRows(QModelIndex(), self._count, count - 1)
+            for row in range(self._count, count):
+                self._rows[self.pets[row].id] = row
+            self._count = count
+            self.endInsertRows()
+            return
+
+        # Removals shift rows around; rare enough to just start over
+        self.beginResetModel()
+        self._count = count
+        self._rows = {pet.id: row for row, pet in enumerate(self.pets)}
+        self.endResetModel()
+
+    def pets_changed(self, pets=None):
+        """Tells views the given pets (default: all of them) need redrawing."""
+        if not self._count:
+            return
+        if pets is None:
+            runs = [(0, self._count - 1)]
+        else:
+            rows = sorted({self._rows[pet.id] for pet in pets if pet.id in self._rows})
+            # One signal per run of neighbouring rows, so the filter only
+            # re-checks the rows that changed
+            runs = []
+            for row in rows:
+                if runs and runs[-1][1] == row - 1:
+                    runs[-1] = (runs[-1][0], row)
+                else:
+                    runs.append((row, row))
+        for first, last in runs:
+            self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+
+
+class PetFilterProxy(QSortFilterProxyModel):
+    """Shows only the pets matching a SearchQuery (see pet.search)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search = None
+
+    def set_search(self, search):
+        if search == self.search:
+            return
+        self.search = search
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.search is None:
+            return True
+        return self.search.matches(self.sourceModel().pet_at(source_row))
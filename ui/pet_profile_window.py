@@ -10,17 +10,36 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QFrame,
 )
-from PySide6.QtCore import Qt, QTimer, QRect
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap
 from pet.persistence import save_pets
+from pet.relationships import RelationshipGraph
+from ui.sprite_cache import get_sprite_cache, sprite_path_for
+
+MAX_FRIENDS_SHOWN = 10
 
 
 class PetProfileWindow(QWidget):
-    def __init__(self, pet, all_pets, on_stats_changed=None):
+    def __init__(
+        self,
+        pet,
+        all_pets,
+        on_stats_changed=None,
+        record=None,
+        pets_by_id=None,
+        relationships=None,
+    ):
         super().__init__()
         self.pet = pet
         self.all_pets = all_pets
         self.on_stats_changed = on_stats_changed
+        self.record = record
+        self.pets_by_id = pets_by_id
+        if relationships is None:
+            # Standalone use: a graph holding just this pet's scores
+            relationships = RelationshipGraph()
+            relationships.add_node(pet.id, pet.relationships)
+        self.relationships = relationships
         self.cooldowns = {"feed": False, "play": False, "rest": False}
 
         self.setWindowTitle(f"{pet.name}'s Profile")
@@ -115,24 +134,16 @@ class PetProfileWindow(QWidget):
         self.state_label.setAlignment(Qt.AlignCenter)
 
         # Sprite
-        sprite_path = (
-            f"assets/PetMobileGameAsset/Cats/RetroCats/{self.pet.sprite_name}.png"
+        frames = get_sprite_cache().scaled_frames(
+            sprite_path_for(self.pet.sprite_name), self.pet.species, "sitting", 96, 96
         )
-        pixmap = QPixmap(sprite_path)
-
-        frame_width = 64
-        frame_height = 64
-        x, y = 0, 0
-
-        if not pixmap.isNull():
-            cropped = pixmap.copy(QRect(x, y, frame_width, frame_height))
+        if frames:
+            cropped = frames[0]
         else:
-            cropped = QPixmap(frame_width, frame_height)
+            cropped = QPixmap(64, 64)
 
         self.pet_sprite = QLabel()
-        self.pet_sprite.setPixmap(
-            cropped.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        )
+        self.pet_sprite.setPixmap(cropped)
         self.pet_sprite.setAlignment(Qt.AlignCenter)
         self.pet_sprite.setMinimumHeight(80)
 
@@ -222,10 +233,16 @@ class PetProfileWindow(QWidget):
         self.mood_label.setText(f"Mood: {mood} {mood_emoji}")
         self.state_label.setText(f"State: {self.pet.state}")
 
-        if self.pet.relationships:
-            lines = [
-                f"- {name}: {score}" for name, score in self.pet.relationships.items()
-            ]
+        pets_by_id = self.pets_by_id
+        if pets_by_id is None:
+            pets_by_id = {other.id: other for other in self.all_pets}
+        best_friends = self.relationships.top_friends(self.pet.id, MAX_FRIENDS_SHOWN)
+        lines = [
+            f"- {pets_by_id[other_id].name}: {score}"
+            for other_id, score in best_friends
+            if other_id in pets_by_id
+        ]
+        if lines:
             self.relationships_info.setText("\n".join(lines))
         else:
             self.relationships_info.setText("No relationships yet.")
@@ -289,7 +306,10 @@ class PetProfileWindow(QWidget):
 
         self.start_cooldown(action)
         self.pet.requested_attention = False
-        save_pets(self.all_pets)
+        if self.record:
+            self.record("pets_changed", [self.pet], action)
+        else:
+            save_pets(self.all_pets)
         self.update_stats()
         if self.on_stats_changed:
             self.on_stats_changed()
@@ -0,0 +1,134 @@
+import random
+
+from PySide6.QtCore import QPoint
+
+from pet.animation_config import ANIMATIONS
+from ui.pet_sprite import PetSprite
+from ui.sprite_cache import sprite_path_for
+
+STATE_TO_ANIMATION = {
+    "idle": ["sitting", "resting_lazy", "laying"],
+    "sleeping": ["sleeping", "deep_sleep"],
+    "walking": ["running"],
+    "playing": ["dancing", "box_headup"],
+    "praying": ["praying_closed", "praying_open"],
+    "collapsed": ["collapse_open", "collapse_closed"],
+    "waking": ["waking"],
+}
+
+SPRITE_SIZE = 96  # Known sprite display height (adjust if you change it)
+SPRITE_SPACING = 96
+SCENE_MARGIN_X = 32
+SCENE_MARGIN_BOTTOM = 10
+
+
+def sprite_position(index, scene_height):
+    return QPoint(
+        SCENE_MARGIN_X + index * SPRITE_SPACING,
+        scene_height - SPRITE_SIZE - SCENE_MARGIN_BOTTOM,
+    )
+
+
+def pick_animation_key(pet):
+    """Returns the animation the pet should show, choosing a new one on state change."""
+    anim_keys = STATE_TO_ANIMATION.get(pet.state, [])
+    animations = ANIMATIONS[pet.species]
+
+    # Reset animation if state changed
+    if pet.state != getattr(pet, "_last_state", None):
+        pet._current_animation_key = None
+        pet._last_state = pet.state
+
+    # Pick new animation only if not set
+    if not pet._current_animation_key:
+        valid_keys = [k for k in anim_keys if k in animations]
+        if valid_keys:
+            pet._current_animation_key = random.choice(valid_keys)
+
+    key = pet._current_animation_key
+    if key and key in animations:
+        return key
+    return None
+
+
+class PetSceneManager:
+    """Reconciles the sprites in the room with the current list of pets.
+
+    Sprites are keyed by pet id and kept alive between refreshes, so a
+    refresh only creates, removes, moves or re-animates what actually changed.
+    """
+
+    def __init__(self, scene_widget, background_label, on_sprite_clicked):
+        self.scene_widget = scene_widget
+        self.background_label = background_label
+        self.on_sprite_clicked = on_sprite_clicked
+        self.sprites = {}
+
+    def set_background(self, pixmap):
+        if pixmap.isNull():
+            self.background_label.clear()
+        else:
+            self.background_label.setPixmap(pixmap)
+
+    def sprite_for(self, pet):
+        return self.sprites.get(pet.id)
+
+    def sync(self, pets):
+        scene_height = self.scene_widget.height()
+        previous = self.sprites
+        live = {}
+
+        for idx, pet in enumerate(pets):
+            sprite = previous.pop(pet.id, None)
+            if sprite is None or sprite.pet is not pet:
+                sprite = self._create_sprite(pet)
+            elif sprite.sprite_path != sprite_path_for(pet.sprite_name):
+                self._remove_sprite(sprite)
+                sprite = self._create_sprite(pet)
+
+            self._update_animation(sprite, pet)
+
+            target = sprite_position(idx, scene_height)
+            if sprite.pos() != target:
+                sprite.move(target)
+            if sprite.isHidden():
+                sprite.show()
+
+            live[pet.id] = sprite
+
+        for sprite in previous.values():
+            self._remove_sprite(sprite)
+
+        self.sprites = live
+
+    def clear(self):
+        for sprite in self.sprites.values():
+            self._remove_sprite(sprite)
+        self.sprites = {}
+
+    def _create_sprite(self, pet):
+        sprite = PetSprite(
+            sprite_path=sprite_path_for(pet.sprite_name),
+            species=pet.species,
+            animations=ANIMATIONS[pet.species],
+            state=pet.state,
+            parent=self.scene_widget,
+            pet=pet,
+        )
+        sprite.clicked.connect(self.on_sprite_clicked)
+        return sprite
+
+    def _remove_sprite(self, sprite):
+        sprite.stop_animation()
+        sprite.hide()
+        sprite.setParent(None)
+        sprite.deleteLater()
+
+    def _update_animation(self, sprite, pet):
+        key = pick_animation_key(pet)
+        if key is None:
+            print(f"[WARN] No animation found for Pet: {pet.name}, State: {pet.state}")
+            return
+        sprite.state = pet.state
+        if key != sprite.animation_key:
+            sprite.set_animation(key)
@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPixmap, QPainter
-from PySide6.QtCore import Qt, QTimer, QRect, Signal
+from PySide6.QtCore import Qt, Signal
+from ui.animation_clock import FrameAnimation, get_animation_clock
+from ui.sprite_cache import get_sprite_cache
 
 
 class PetSprite(QWidget):
@@ -10,7 +12,7 @@ class PetSprite(QWidget):
         self,
         sprite_path,
         species,
-        animation_config,
+        animations,
         state,
         frame_width=64,
         frame_height=64,
@@ -19,9 +21,9 @@ class PetSprite(QWidget):
     ):
         super().__init__(parent)
 
-        self.sprite_sheet = QPixmap(sprite_path)
+        self.sprite_path = sprite_path
         self.species = species
-        self.animation_config = animation_config
+        self.animations = animations
         self.state = state
         self.pet = pet
         self.frame_width = frame_width
@@ -31,74 +33,68 @@ class PetSprite(QWidget):
         self.current_pixmap = QPixmap(self.frame_width, self.frame_height)
         self.current_pixmap.fill(Qt.transparent)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_animation)
-
-        self.multi_row_frames = []
-        self.multi_row_index = 0
-        self.loop = True
-
-    def set_animation(self, config):
-        self.multi_row_frames = []
-        self.multi_row_index = 0
-
-        if isinstance(config[0], tuple) and isinstance(config[1], tuple):
-            # Multi-row animation
-            frame_ranges = config[:-2]
-            self.loop = config[-2]
-            interval = config[-1]
-            for row, start, end in frame_ranges:
-                for col in range(start, end):
-                    self.multi_row_frames.append((row, col))
+        self.animation = None
+        self.animation_key = None
+
+    def set_animation(self, animation_key):
+        table = self.animations[animation_key]
+        clock = get_animation_clock()
+        self.animation_key = animation_key
+        self.animation = FrameAnimation(
+            self._scaled_frames(animation_key),
+            interval=table.interval,
+            loop=table.loop,
+            started_at=clock.now(),
+        )
+        self._show_current_frame()
+        self.update()
+        if self.animation.frames and not self.animation.finished:
+            clock.register(self)
         else:
-            # Single-row animation
-            row, start, end, self.loop, interval = config
-            for col in range(start, end):
-                self.multi_row_frames.append((row, col))
-
-        self.timer.stop()
-        self.timer.start(interval)
-        self.update_animation()
-
-    def update_animation(self):
-        if not self.multi_row_frames:
-            return
-
-        row, col = self.multi_row_frames[self.multi_row_index]
-        x = col * self.frame_width
-        y = row * self.frame_height
-
-        if (
-            x + self.frame_width <= self.sprite_sheet.width()
-            and y + self.frame_height <= self.sprite_sheet.height()
-        ):
-            cropped = self.sprite_sheet.copy(
-                QRect(x, y, self.frame_width, self.frame_height)
-            )
-            self.current_pixmap = cropped
+            clock.unregister(self)
+
+    def advance(self, now):
+        """Called by the shared AnimationClock; returns True if the frame changed."""
+        if not self.animation.advance(now):
+            return False
+        self._show_current_frame()
+        if self.animation.finished:
+            get_animation_clock().unregister(self)
+        return True
+
+    def stop_animation(self):
+        get_animation_clock().unregister(self)
+
+    def _scaled_frames(self, animation_key):
+        return get_sprite_cache().scaled_frames(
+            self.sprite_path, self.species, animation_key, self.width(), self.height()
+        )
 
-        self.multi_row_index += 1
-        if self.multi_row_index >= len(self.multi_row_frames):
-            if self.loop:
-                self.multi_row_index = 0
-            else:
-                self.multi_row_index -= 1  # stay at last frame
-                self.timer.stop()
+    def _show_current_frame(self):
+        frame = self.animation.current()
+        if frame is not None:
+            self.current_pixmap = frame
 
-        self.update()
+    def resizeEvent(self, event):
+        # Scaled frames are only valid for one size; swap in the matching set
+        if self.animation is not None:
+            self.animation.frames = self._scaled_frames(self.animation_key)
+            self._show_current_frame()
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        scaled = self.current_pixmap.scaled(
-            self.width(), self.height(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        x_offset = (self.width() - scaled.width()) // 2
-        y_offset = (self.height() - scaled.height()) // 2
-        painter.drawPixmap(x_offset, y_offset, scaled)
+        x_offset = (self.width() - self.current_pixmap.width()) // 2
+        y_offset = (self.height() - self.current_pixmap.height()) // 2
+        painter.drawPixmap(x_offset, y_offset, self.current_pixmap)
         painter.end()
 
     def reset_animation_frame(self):
-        self.multi_row_index = 0
+        if self.animation:
+            self.animation.started_at = get_animation_clock().now()
+            self.animation.index = 0
+            self._show_current_frame()
+            self.update()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
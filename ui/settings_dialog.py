@@ -11,7 +11,12 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPixmap, QCursor
 from PySide6.QtCore import Qt
 
-import os
+from ui.thumbnails import (
+    THUMBNAIL_SIZE,
+    background_path,
+    get_thumbnail_loader,
+    list_backgrounds,
+)
 
 
 class SettingsDialog(QDialog):
@@ -34,18 +39,16 @@ class SettingsDialog(QDialog):
         thumb_layout = QHBoxLayout(scroll_content)
         thumb_layout.setSpacing(10)
 
-        for i in range(1, 21):
-            filename = f"{i}.png"
-            full_path = os.path.join(
-                "assets", "PetMobileGameAsset", "Backgrounds", filename
-            )
-            pixmap = QPixmap(full_path).scaled(
-                100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-
-            thumb = QLabel()
-            thumb.setPixmap(pixmap)
-            thumb.setFixedSize(100, 100)
+        # Thumbnails are made (or read from the disk cache) on worker
+        # threads; until one arrives its slot shows a placeholder
+        self.loader = get_thumbnail_loader()
+        self.loader.ready.connect(self.show_thumbnail)
+        self.finished.connect(self.disconnect_loader)
+
+        for filename in list_backgrounds():
+            thumb = QLabel("…")
+            thumb.setAlignment(Qt.AlignCenter)
+            thumb.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
             thumb.setStyleSheet(self.get_style(filename))
             thumb.setCursor(QCursor(Qt.PointingHandCursor))
             thumb.mousePressEvent = self.make_click_handler(filename)
@@ -53,11 +56,23 @@ class SettingsDialog(QDialog):
             thumb_layout.addWidget(thumb)
             self.thumbnail_labels[filename] = thumb
 
+            image = self.loader.request(filename, background_path(filename))
+            if image is not None:
+                self.show_thumbnail(filename, image)
+
         scroll_content.setLayout(thumb_layout)
         scroll.setWidget(scroll_content)
 
         layout.addWidget(scroll)
 
+    def show_thumbnail(self, filename, image):
+        thumb = self.thumbnail_labels.get(filename)
+        if thumb is not None and not image.isNull():
+            thumb.setPixmap(QPixmap.fromImage(image))
+
+    def disconnect_loader(self):
+        self.loader.ready.disconnect(self.show_thumbnail)
+
     def get_style(self, filename):
         if filename == self.selected_background:
             return "border: 3px solid #44aaff;"
@@ -0,0 +1,276 @@
+"""Packed sprite atlas for the cat sheets, and layered cats made on demand.
+
+The animation frames of every AllCats*.png sheet are packed into a few
+atlas pages in data/sprites/ (see pet/atlas.py for the index). Build it
+ahead of time with:
+
+    python -m ui.sprite_atlas
+
+Otherwise it is built in the background on the first run, and again after
+a sheet or ANIMATION_CONFIGS changes, and used from the next start.
+
+``layered_sheet`` composites an assets/cats/base coat with recolored
+assets/cats/Markings layers into a cached sheet.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+
+from PySide6.QtCore import QRect, QRunnable, QThreadPool, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+
+from pet.animation_config import ANIMATIONS, FRAME_HEIGHT, FRAME_WIDTH
+from pet.atlas import ATLAS_MAX_SIZE, AtlasIndex, animation_signature, grid_layout
+from ui.sprite_cache import SPRITE_DIR, get_sprite_cache
+
+ATLAS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "sprites"
+)
+ATLAS_INDEX = "atlas.json"
+LAYER_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "assets", "cats"
+)
+LAYERED_DIR = os.path.join(ATLAS_DIR, "layered")
+
+
+def sprite_sheets(directory=SPRITE_DIR):
+    """{sheet name: path} for every sprite sheet in the directory."""
+    paths = sorted(glob.glob(os.path.join(glob.escape(directory), "*.png")))
+    return {os.path.splitext(os.path.basename(p))[0]: p for p in paths}
+
+
+def sheet_sources(sheets):
+    return {name: os.stat(path).st_mtime_ns for name, path in sheets.items()}
+
+
+# === Packed atlas ===
+def build_atlas(sheets=None, species="cat", out_dir=None, max_size=ATLAS_MAX_SIZE):
+    """Packs the frames each sheet's animations use into atlas pages.
+
+    Writes the pages and then the index to ``out_dir``, and returns the index.
+    Uses QImage only, so it can run off the GUI thread (or without a
+    QApplication at all).
+    """
+    sheets = sprite_sheets() if sheets is None else sheets
+    out_dir = out_dir or ATLAS_DIR
+    tables = ANIMATIONS[species]
+
+    images = []
+    numbers = {}
+    entries = {}
+    failed = {}
+    for name, path in sheets.items():
+        mtime = os.stat(path).st_mtime_ns
+        sheet = QImage(path)
+        if sheet.isNull():
+            print(f"[WARN] Could not load sprite sheet {path}; not packed")
+            # Remembered, so the atlas isn't rebuilt for it until it changes
+            failed[name] = mtime
+            continue
+        sheet = sheet.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        animations = {}
+        for key, table in tables.items():
+            frames = []
+            for rect in table.rects:
+                rect = QRect(*rect)
+                if not sheet.rect().contains(rect):
+                    continue
+                frame = sheet.copy(rect)
+                digest = hashlib.blake2b(frame.constBits()).digest()
+                if digest not in numbers:
+                    numbers[digest] = len(images)
+                    images.append(frame)
+                frames.append(numbers[digest])
+            animations[key] = frames
+        entries[name] = {"mtime_ns": mtime, "animations": animations}
+
+    positions, page_sizes = grid_layout(
+        len(images), FRAME_WIDTH, FRAME_HEIGHT, max_size
+    )
+    pages = [QImage(w, h, QImage.Format_ARGB32_Premultiplied) for w, h in page_sizes]
+    painters = []
+    for page in pages:
+        page.fill(Qt.transparent)
+        painters.append(QPainter(page))
+    for image, (page, x, y) in zip(images, positions):
+        painters[page].drawImage(x, y, image)
+    for painter in painters:
+        painter.end()
+
+    os.makedirs(out_dir, exist_ok=True)
+    page_names = []
+    for i, page in enumerate(pages):
+        page_name = f"{species}-{i}.png"
+        if not page.save(os.path.join(out_dir, page_name)):
+            raise OSError(f"Could not write atlas page {page_name} to {out_dir}")
+        page_names.append(page_name)
+
+    index = AtlasIndex(
+        species,
+        animation_signature(tables),
+        page_names,
+        positions,
+        entries,
+        failed=failed,
+    )
+    # Written last: an index on disk always has all of its pages
+    index.save(os.path.join(out_dir, ATLAS_INDEX))
+    return index
+
+
+class PackedAtlas:
+    """An atlas index plus its pages, decoded the first time a frame is needed."""
+
+    def __init__(self, index, directory):
+        self.index = index
+        self.directory = directory
+        self._pages = {}
+
+    def has_sheet(self, sheet, species):
+        return species == self.index.species and sheet in self.index
+
+    def frames(self, sheet, animation_key):
+        width, height = self.index.frame_size
+        frames = []
+        for page, x, y in self.index.frames_for(sheet, animation_key):
+            pixmap = self._page(page)
+            if not pixmap.isNull():
+                frames.append(pixmap.copy(x, y, width, height))
+        return tuple(frames)
+
+    def _page(self, number):
+        pixmap = self._pages.get(number)
+        if pixmap is None:
+            path = os.path.join(self.directory, self.index.pages[number])
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                print(f"[WARN] Could not load sprite atlas page {path}")
+            self._pages[number] = pixmap
+        return pixmap
+
+
+def load_packed_atlas(directory=None, sheets=None, species="cat"):
+    """The saved atlas if it matches the current sheets and tables, else None."""
+    directory = directory or ATLAS_DIR
+    sheets = sprite_sheets() if sheets is None else sheets
+    index = AtlasIndex.load(os.path.join(directory, ATLAS_INDEX))
+    if index is None or index.species != species:
+        return None
+    if not index.is_fresh(
+        sheet_sources(sheets), animation_signature(ANIMATIONS[species])
+    ):
+        return None
+    return PackedAtlas(index, directory)
+
+
+class AtlasBuildTask(QRunnable):
+    def __init__(self, sheets, directory):
+        super().__init__()
+        self.sheets = sheets
+        self.directory = directory
+
+    def run(self):
+        try:
+            build_atlas(self.sheets, out_dir=self.directory)
+        except Exception as e:
+            # Nothing waits on the build; the sheets keep being used instead
+            print(f"[WARN] Could not build the sprite atlas: {e!r}")
+
+
+def install_packed_atlas(cache=None, directory=None):
+    """Points the sprite cache at the packed atlas; True if one was ready.
+
+    If it is missing or stale a new one is built on the global QThreadPool,
+    and the sheets are read one by one until the next start.
+    """
+    directory = directory or ATLAS_DIR
+    sheets = sprite_sheets()
+    packed = load_packed_atlas(directory, sheets)
+    if packed is None:
+        if sheets:
+            QThreadPool.globalInstance().start(AtlasBuildTask(sheets, directory))
+        return False
+    (cache or get_sprite_cache()).use_packed(packed)
+    return True
+
+
+# === Layered cats ===
+def composite_layers(base, markings=(), layer_dir=None):
+    """A base coat with marking layers drawn over it, each in its own color.
+
+    ``base`` names a file in base/ (e.g. "orange_0"); ``markings`` is a list
+    of (marking name, color), e.g. [("Tabby Markings 000", "#8a4b1c")].
+    Returns a null QImage if the base can't be loaded.
+    """
+    layer_dir = layer_dir or LAYER_DIR
+    sheet = QImage(os.path.join(layer_dir, "base", f"{base}.png"))
+    if sheet.isNull():
+        print(f"[WARN] Could not load cat base layer {base}")
+        return sheet
+    sheet = sheet.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+    painter = QPainter(sheet)
+    for name, color in markings:
+        layer = QImage(os.path.join(layer_dir, "Markings", f"{name}.png"))
+        if layer.isNull():
+            print(f"[WARN] Could not load cat marking layer {name}")
+            continue
+        layer = layer.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        # Keep the marking's shape (alpha), replace its color
+        tint = QPainter(layer)
+        tint.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        tint.fillRect(layer.rect(), QColor(color))
+        tint.end()
+        painter.drawImage(0, 0, layer)
+    painter.end()
+    return sheet
+
+
+def layered_sheet(base, markings=(), layer_dir=None, cache_dir=None):
+    """Path of the composited sheet for these layers, made on first request.
+
+    The cache file name hashes the layers, colors and layer mtimes, so an
+    edited layer makes the old sheet miss. Returns None if it can't be made.
+    """
+    layer_dir = layer_dir or LAYER_DIR
+    cache_dir = cache_dir or LAYERED_DIR
+    paths = [os.path.join(layer_dir, "base", f"{base}.png")]
+    paths += [os.path.join(layer_dir, "Markings", f"{n}.png") for n, _ in markings]
+    key = hashlib.sha1(repr((base, list(markings))).encode("utf-8"))
+    for path in paths:
+        if os.path.exists(path):
+            key.update(str(os.stat(path).st_mtime_ns).encode("ascii"))
+    cached = os.path.join(cache_dir, f"{base}-{key.hexdigest()[:16]}.png")
+    if os.path.exists(cached):
+        return cached
+
+    sheet = composite_layers(base, markings, layer_dir)
+    if sheet.isNull():
+        return None
+    os.makedirs(cache_dir, exist_ok=True)
+    if not sheet.save(cached):
+        print(f"[WARN] Could not write layered cat sheet {cached}")
+        return None
+    return cached
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the packed cat sprite atlas")
+    parser.add_argument("--sprites", default=SPRITE_DIR, help="sheet directory")
+    parser.add_argument("--out", default=ATLAS_DIR, help="atlas directory")
+    parser.add_argument("--max-size", type=int, default=ATLAS_MAX_SIZE)
+    args = parser.parse_args()
+
+    index = build_atlas(
+        sprite_sheets(args.sprites), out_dir=args.out, max_size=args.max_size
+    )
+    print(
+        f"Packed {len(index.sheets)} sheets into {len(index.frames)} frames "
+        f"on {len(index.pages)} page(s) in {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import glob
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QImageReader, QPixmap
+
+from pet.animation_config import (
+    ANIMATIONS,
+    FRAME_HEIGHT,
+    FRAME_WIDTH,
+    SHEET_COLUMNS,
+    SHEET_ROWS,
+)
+
+SPRITE_DIR = "assets/PetMobileGameAsset/Cats/RetroCats"
+
+# Roughly 16 full cat sheets worth of pre-sliced frames.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def sprite_path_for(sprite_name):
+    return f"{SPRITE_DIR}/{sprite_name}.png"
+
+
+def sheet_name(sprite_path):
+    return os.path.splitext(os.path.basename(sprite_path))[0]
+
+
+def check_sprite_sheets(directory=SPRITE_DIR):
+    """Warns about sheets too small for the frame tables; returns their paths.
+
+    Only the image headers are read, so this is cheap enough for startup.
+    """
+    width, height = SHEET_COLUMNS * FRAME_WIDTH, SHEET_ROWS * FRAME_HEIGHT
+    bad = []
+    for path in sorted(glob.glob(f"{glob.escape(directory)}/*.png")):
+        size = QImageReader(path).size()
+        if size.width() < width or size.height() < height:
+            print(
+                f"[ERROR] Sprite sheet {path} is {size.width()}x{size.height()}, "
+                f"animations need {width}x{height}"
+            )
+            bad.append(path)
+    return bad
+
+
+class SpriteAtlas:
+    """All animation frames of one sprite sheet, sliced once up front.
+
+    With a ``packed`` atlas (see ui/sprite_atlas.py) that holds this sheet,
+    the frames come from the shared atlas pages and the sheet isn't decoded.
+    """
+
+    def __init__(self, sprite_path, species, packed=None):
+        self.sprite_path = sprite_path
+        self.species = species
+        self.animations = {}
+        self.scaled = {}
+        self.nbytes = 0
+
+        name = sheet_name(sprite_path)
+        if packed is not None and packed.has_sheet(name, species):
+            for key in ANIMATIONS.get(species, {}):
+                self._add(key, packed.frames(name, key))
+            return
+
+        sheet = QPixmap(sprite_path)
+        if sheet.isNull():
+            return
+
+        bounds = sheet.rect()
+        for key, table in ANIMATIONS.get(species, {}).items():
+            rects = [QRect(*rect) for rect in table.rects]
+            # A short sheet (see check_sprite_sheets) loses frames, not the app
+            self._add(key, tuple(sheet.copy(r) for r in rects if bounds.contains(r)))
+
+    def _add(self, key, frames):
+        self.animations[key] = frames
+        self.nbytes += sum(f.width() * f.height() * 4 for f in frames)
+
+    def frames(self, animation_key):
+        return self.animations.get(animation_key, ())
+
+    def scaled_frames(self, animation_key, width, height):
+        key = (animation_key, width, height)
+        frames = self.scaled.get(key)
+        if frames is None:
+            frames = tuple(
+                frame.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                for frame in self.frames(animation_key)
+            )
+            self.scaled[key] = frames
+            self.nbytes += sum(f.width() * f.height() * 4 for f in frames)
+        return frames
+
+
+class SpriteAtlasCache:
+    """Process-wide LRU cache of sliced sprite sheets.
+
+    Frames are shared between every sprite using the same sheet, so callers
+    must treat the returned pixmaps as read-only.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, packed=None):
+        self.max_bytes = max_bytes
+        self.packed = packed
+        self._atlases = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def atlas(self, sprite_path, species):
+        key = (sprite_path, species)
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            self.hits += 1
+            self._atlases.move_to_end(key)
+            return atlas
+
+        self.misses += 1
+        atlas = SpriteAtlas(sprite_path, species, self.packed)
+        self._atlases[key] = atlas
+        self.total_bytes += atlas.nbytes
+        self._evict()
+        return atlas
+
+    def use_packed(self, packed):
+        """Takes frames from a packed atlas from now on (None: the sheets)."""
+        self.packed = packed
+        self.clear()
+
+    def frames(self, sprite_path, species, animation_key):
+        return self.atlas(sprite_path, species).frames(animation_key)
+
+    def scaled_frames(self, sprite_path, species, animation_key, width, height):
+        """Frames smoothly scaled once for a given display size and then reused."""
+        atlas = self.atlas(sprite_path, species)
+        before = atlas.nbytes
+        frames = atlas.scaled_frames(animation_key, width, height)
+        if atlas.nbytes != before:
+            self.total_bytes += atlas.nbytes - before
+            self._evict()
+        return frames
+
+    def _evict(self):
+        # Always keep the most recently used atlas, even if it alone is too big
+        while self.total_bytes > self.max_bytes and len(self._atlases) > 1:
+            _, atlas = self._atlases.popitem(last=False)
+            self.total_bytes -= atlas.nbytes
+
+    def clear(self):
+        self._atlases.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        return {
+            "atlases": len(self._atlases),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_sprite_cache = None
+
+
+def get_sprite_cache():
+    # Created lazily: QPixmap needs a running QApplication.
+    global _sprite_cache
+    if _sprite_cache is None:
+        _sprite_cache = SpriteAtlasCache()
+    return _sprite_cache
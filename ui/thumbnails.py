@@ -0,0 +1,125 @@
+import glob
+import os
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage
+
+BACKGROUND_DIR = os.path.join("assets", "PetMobileGameAsset", "Backgrounds")
+THUMBNAIL_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "data", "thumbnails"
+)
+THUMBNAIL_SIZE = 100
+
+
+def background_path(filename):
+    return os.path.join(BACKGROUND_DIR, filename)
+
+
+def list_backgrounds(directory=BACKGROUND_DIR):
+    """Background images in the directory, numbered ones in numeric order."""
+    try:
+        names = [n for n in os.listdir(directory) if n.lower().endswith(".png")]
+    except OSError as e:
+        print(f"[WARN] Could not list backgrounds in {directory}: {e}")
+        return []
+
+    def order(name):
+        stem = os.path.splitext(name)[0]
+        return (0, int(stem), name) if stem.isdigit() else (1, 0, name)
+
+    return sorted(names, key=order)
+
+
+def thumbnail_cache_path(source, size=THUMBNAIL_SIZE, cache_dir=None):
+    """Cache file for a thumbnail; the source's mtime is part of the name, so
+    editing the image makes the old thumbnail miss."""
+    cache_dir = cache_dir or THUMBNAIL_DIR
+    stem = os.path.splitext(os.path.basename(source))[0]
+    mtime = os.stat(source).st_mtime_ns
+    return os.path.join(cache_dir, f"{stem}-{size}-{mtime}.png")
+
+
+def load_thumbnail(source, size=THUMBNAIL_SIZE, cache_dir=None):
+    """Returns a QImage thumbnail, from the cache or freshly scaled (and cached).
+
+    Uses QImage rather than QPixmap so it can run off the GUI thread.
+    """
+    cached = thumbnail_cache_path(source, size, cache_dir)
+    cache_dir = os.path.dirname(cached)
+    image = QImage(cached)
+    if not image.isNull():
+        return image
+
+    image = QImage(source)
+    if image.isNull():
+        print(f"[WARN] Could not load background {source}")
+        return image
+    image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    stale = glob.glob(glob.escape(cached.rsplit("-", 1)[0]) + "-*.png")
+    for path in stale:
+        os.remove(path)
+    if not image.save(cached):
+        print(f"[WARN] Could not write thumbnail cache {cached}")
+    return image
+
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, loader, filename, source):
+        super().__init__()
+        self.loader = loader
+        self.filename = filename
+        self.source = source
+
+    def run(self):
+        image = QImage()
+        try:
+            image = load_thumbnail(self.source, self.loader.size, self.loader.cache_dir)
+        except Exception as e:
+            print(f"[WARN] Could not make a thumbnail for {self.source}: {e!r}")
+        finally:
+            # Always answer, or the picker slot would wait forever. Queued to
+            # the loader's (GUI) thread.
+            self.loader.ready.emit(self.filename, image)
+
+
+class ThumbnailLoader(QObject):
+    """Makes thumbnails on the global QThreadPool.
+
+    ``ready(filename, image)`` fires on the GUI thread as each one arrives.
+    Finished thumbnails are kept in memory, so reopening a picker is instant.
+    """
+
+    ready = Signal(str, QImage)
+
+    def __init__(self, size=THUMBNAIL_SIZE, cache_dir=None):
+        super().__init__()
+        self.size = size
+        self.cache_dir = cache_dir
+        self.images = {}
+        self._pending = set()
+        self.ready.connect(self._store)
+
+    def request(self, filename, source):
+        """Returns the thumbnail if it is already known, else starts making it."""
+        image = self.images.get(filename)
+        if image is None and filename not in self._pending:
+            self._pending.add(filename)
+            QThreadPool.globalInstance().start(ThumbnailTask(self, filename, source))
+        return image
+
+    def _store(self, filename, image):
+        self._pending.discard(filename)
+        if not image.isNull():
+            self.images[filename] = image
+
+
+_thumbnail_loader = None
+
+
+def get_thumbnail_loader():
+    global _thumbnail_loader
+    if _thumbnail_loader is None:
+        _thumbnail_loader = ThumbnailLoader()
+    return _thumbnail_loader